@@ -9,8 +9,9 @@ This script automates changelog generation by:
      falls back to the 'changelog-dir-created' tag
    - If no version tags exist at all, uses the 'changelog-dir-created' tag
 
-2. Running changelog-build (HashiCorp tool) to generate entries from baseline to HEAD
-   - Reads from .changelog/*.txt files added since the baseline
+2. Rendering the entries from baseline to HEAD (see changelog.render_changelog, which
+   reproduces HashiCorp's changelog-build without needing Go)
+   - Reads the .changelog/*.txt files added since the baseline from git objects
    - Uses templates from tools/changelog/ to format the output
 
 3. Updating only the (Unreleased) section in CHANGELOG.md
@@ -26,43 +27,29 @@ from __future__ import annotations
 
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
+from changelog import render_changelog
 from release import tf_registry_source
+from shared import git_queries
 
 # Tag that marks the commit where the .changelog directory was first introduced.
 # This tag must be created in the repository before using the changelog generation workflow.
 CHANGELOG_DIR_CREATED_TAG = "changelog-dir-created"
 
 
-def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
-    return subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        check=check,
-    )
-
-
 def get_latest_version_tag() -> str | None:
     """Get the latest version tag (v*.*.*)."""
     try:
-        result = run_command(["git", "tag", "-l", "v*.*.*", "--sort=-version:refname"])
-        tags = result.stdout.strip().split("\n")
-        return tags[0] if tags and tags[0] else None
+        tags = git_queries.load_git_repo().version_tags()
     except subprocess.CalledProcessError:
         return None
+    return tags[0] if tags else None
 
 
 def get_commit_sha(ref: str) -> str | None:
     """Get the commit SHA for a given ref."""
-    try:
-        result = run_command(["git", "rev-list", "-n", "1", ref])
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+    return git_queries.load_git_repo().commit_sha(ref)
 
 
 def get_commit_sha_or_exit(ref: str, error_context: str) -> str:
@@ -76,11 +63,7 @@ def get_commit_sha_or_exit(ref: str, error_context: str) -> str:
 
 def changelog_exists_at_commit(commit_sha: str) -> bool:
     """Check if .changelog directory exists at a given commit."""
-    try:
-        result = run_command(["git", "ls-tree", commit_sha, ".changelog"])
-        return bool(result.stdout.strip())
-    except subprocess.CalledProcessError:
-        return False
+    return git_queries.load_git_repo().path_exists(commit_sha, ".changelog")
 
 
 def get_changelog_dir_created_commit(reason: str) -> str:
@@ -108,21 +91,10 @@ def determine_last_release() -> str:
     return get_changelog_dir_created_commit(f"latest tag {latest_tag} has no .changelog")
 
 
-def get_gopath() -> str:
-    """Get the GOPATH environment variable."""
-    try:
-        result = run_command(["go", "env", "GOPATH"])
-        gopath = result.stdout.strip()
-        if not gopath:
-            raise subprocess.CalledProcessError(1, ["go", "env", "GOPATH"])
-        return gopath
-    except subprocess.CalledProcessError:
-        print("Error: Could not get GOPATH", file=sys.stderr)
-        sys.exit(1)
-
-
 GITHUB_REPO_URL_PLACEHOLDER = "GITHUB_REPO_URL"
 NOTE_TEMPLATE_PATH = "tools/changelog/release-note.tmpl"
+CHANGELOG_TEMPLATE_PATH = "tools/changelog/changelog.tmpl"
+ENTRIES_DIR = ".changelog"
 
 
 def resolve_note_template(repo_dir: Path) -> str:
@@ -133,47 +105,15 @@ def resolve_note_template(repo_dir: Path) -> str:
 
 
 def build_changelog(last_release: str, repo_dir: Path) -> str:
-    """Run changelog-build and return the output."""
-    gopath = get_gopath()
-    changelog_build = Path(gopath) / "bin" / "changelog-build"
-
-    resolved_template = resolve_note_template(repo_dir)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".tmpl", delete=False, encoding="utf-8") as f:
-        f.write(resolved_template)
-        resolved_template_path = f.name
-
-    cmd = [
-        str(changelog_build),
-        "-this-release",
-        "HEAD",
-        "-last-release",
+    """Render the entries added since `last_release` and return the output."""
+    return render_changelog.render_changelog(
+        git_queries.load_git_repo(repo_dir),
         last_release,
-        "-git-dir",
-        ".",
-        "-entries-dir",
-        ".changelog",
-        "-changelog-template",
-        "tools/changelog/changelog.tmpl",
-        "-note-template",
-        resolved_template_path,
-    ]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=repo_dir,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"Error running changelog-build: {e}", file=sys.stderr)
-        if e.stderr:
-            print(e.stderr, file=sys.stderr)
-        sys.exit(1)
-    finally:
-        Path(resolved_template_path).unlink(missing_ok=True)
+        "HEAD",
+        ENTRIES_DIR,
+        repo_dir / CHANGELOG_TEMPLATE_PATH,
+        resolve_note_template(repo_dir),
+    )
 
 
 def build_changelog_content(
@@ -0,0 +1,251 @@
+"""Render changelog entries with our Go-style templates, without the changelog-build binary.
+
+Mirrors HashiCorp go-changelog's `changelog-build`:
+- The entries are the files in the entries directory at `this_release` whose names are
+  absent from it at `last_release`. The issue number is the file name without `.txt`.
+- Every ```release-note:<type>``` block in an entry becomes a note.
+- Notes are ordered by type, body and issue, then grouped by type.
+
+Entries are read straight from git objects through `shared.git_queries`.
+
+Only the text/template subset our templates use is supported: `{{-`/`-}}` trimming, `if`,
+`else`, `range`, `define`, `template`, field chains, string literals, pipelines, and the
+`index` and `sort` functions.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from shared import git_queries
+
+NOTE_PATTERN = re.compile(
+    r"^```release-note:(?P<type>[^\r\n]*)\r?\n?(?P<note>.*?)\r?\n?```", re.MULTILINE | re.DOTALL
+)
+ACTION_PATTERN = re.compile(r"\{\{(-\s)?\s*(.*?)\s*(\s-)?\}\}", re.DOTALL)
+WORD_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|\||[^\s|]+')
+CAMEL_BOUNDARY_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+MAIN_TEMPLATE = ""
+
+
+class TemplateError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Note:
+    type: str
+    body: str
+    issue: str
+
+
+def notes_from_entry(issue: str, content: str) -> list[Note]:
+    return [
+        Note(type=m.group("type"), body=m.group("note"), issue=issue)
+        for m in NOTE_PATTERN.finditer(content)
+    ]
+
+
+def sort_notes(notes: list[Note]) -> list[Note]:
+    return sorted(notes, key=lambda note: (note.type, note.body, note.issue))
+
+
+def entries_between(
+    repo: git_queries.GitRepo, last_release: str, this_release: str, entries_dir: str
+) -> dict[str, str]:
+    """Issue -> entry content for entries added after `last_release`."""
+    before = repo.tree_entries(last_release, entries_dir)
+    return {
+        name.removesuffix(".txt"): repo.blob(sha).decode()
+        for name, sha in repo.tree_entries(this_release, entries_dir).items()
+        if name not in before
+    }
+
+
+@dataclass
+class _Node:
+    kind: str  # text, action, if, range, template
+    value: str = ""
+    body: list[_Node] | None = None
+    orelse: list[_Node] | None = None
+
+
+def _tokens(source: str) -> list[tuple[str, str]]:
+    """("text", text) and ("action", expression) pairs with whitespace trimming applied."""
+    tokens: list[tuple[str, str]] = []
+    pos, trim_next = 0, False
+    for match in ACTION_PATTERN.finditer(source):
+        text = source[pos : match.start()]
+        if trim_next:
+            text = text.lstrip()
+        if match.group(1):
+            text = text.rstrip()
+        if text:
+            tokens.append(("text", text))
+        tokens.append(("action", match.group(2)))
+        pos, trim_next = match.end(), bool(match.group(3))
+    text = source[pos:]
+    if trim_next:
+        text = text.lstrip()
+    if text:
+        tokens.append(("text", text))
+    return tokens
+
+
+def parse_templates(*sources: str) -> dict[str, list[_Node]]:
+    """Templates by name; the first source's top-level content is MAIN_TEMPLATE."""
+    templates: dict[str, list[_Node]] = {}
+    for position, source in enumerate(sources):
+        stack: list[tuple[str, list[_Node], _Node | None]] = [("root", [], None)]
+        for kind, value in _tokens(source):
+            nodes = stack[-1][1]
+            if kind == "text":
+                nodes.append(_Node("text", value))
+                continue
+            keyword, _, rest = value.partition(" ")
+            if keyword in ("if", "range"):
+                node = _Node(keyword, rest.strip(), body=[])
+                nodes.append(node)
+                stack.append((keyword, node.body, node))
+            elif keyword == "define":
+                stack.append(("define", [], _Node("define", rest.strip().strip('"'))))
+            elif keyword == "else":
+                opener, _, node = stack.pop()
+                if node is None or opener not in ("if", "range"):
+                    raise TemplateError("unexpected {{else}}")
+                node.orelse = []
+                stack.append(("else", node.orelse, node))
+            elif keyword == "end":
+                opener, body, node = stack.pop()
+                if node is None:
+                    raise TemplateError("unexpected {{end}}")
+                if opener == "define":
+                    templates[node.value] = body
+            elif keyword == "template":
+                name, _, argument = rest.strip().partition(" ")
+                nodes.append(_Node("template", name.strip('"'), orelse=None, body=None))
+                nodes[-1].orelse = [_Node("action", argument.strip() or ".")]
+            else:
+                nodes.append(_Node("action", value))
+        if len(stack) != 1:
+            raise TemplateError(f"unclosed {{{{{stack[-1][0]}}}}}")
+        if position == 0:
+            templates[MAIN_TEMPLATE] = stack[0][1]
+    return templates
+
+
+def _field(value: object, name: str) -> object:
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, CAMEL_BOUNDARY_PATTERN.sub("_", name).lower())
+
+
+def _index(collection: object, *keys: object) -> object:
+    for key in keys:
+        collection = collection.get(key) if isinstance(collection, dict) else collection[key]  # type: ignore[index]
+    return collection
+
+
+FUNCTIONS: dict[str, Callable[..., object]] = {
+    "index": _index,
+    "sort": lambda notes: sorted(notes, key=lambda note: (note.body, note.issue)),
+}
+
+
+def _operand(word: str, dot: object) -> object:
+    if word.startswith('"'):
+        return word[1:-1].encode().decode("unicode_escape")
+    if word == ".":
+        return dot
+    if word.startswith("."):
+        value = dot
+        for name in word[1:].split("."):
+            value = _field(value, name)
+        return value
+    raise TemplateError(f"unsupported operand {word!r}")
+
+
+def _evaluate(pipeline: str, dot: object) -> object:
+    commands: list[list[str]] = [[]]
+    for word in WORD_PATTERN.findall(pipeline):
+        if word == "|":
+            commands.append([])
+        else:
+            commands[-1].append(word)
+    result: object = None
+    for number, words in enumerate(commands):
+        args = [_operand(word, dot) for word in words[1:]]
+        if number > 0:
+            args.append(result)
+        if words[0] in FUNCTIONS:
+            result = FUNCTIONS[words[0]](*args)
+        elif args:
+            raise TemplateError(f"{words[0]} is not a function")
+        else:
+            result = _operand(words[0], dot)
+    return result
+
+
+def _truthy(value: object) -> bool:
+    return value not in (None, False, 0, "") and not (
+        isinstance(value, list | dict | tuple) and not value
+    )
+
+
+def execute(templates: dict[str, list[_Node]], name: str, dot: object) -> str:
+    out: list[str] = []
+    _execute(templates, templates[name], dot, out)
+    return "".join(out)
+
+
+def _execute(
+    templates: dict[str, list[_Node]], nodes: list[_Node], dot: object, out: list[str]
+) -> None:
+    for node in nodes:
+        if node.kind == "text":
+            out.append(node.value)
+        elif node.kind == "action":
+            value = _evaluate(node.value, dot)
+            if value is not None:
+                out.append(str(value))
+        elif node.kind == "if":
+            branch = node.body if _truthy(_evaluate(node.value, dot)) else node.orelse
+            _execute(templates, branch or [], dot, out)
+        elif node.kind == "range":
+            items = _evaluate(node.value, dot) or []
+            for item in items:  # type: ignore[attr-defined]
+                _execute(templates, node.body or [], item, out)
+            if not items and node.orelse:
+                _execute(templates, node.orelse, dot, out)
+        elif node.kind == "template":
+            if node.value not in templates:
+                raise TemplateError(f"no template {node.value!r}")
+            argument = _evaluate(node.orelse[0].value, dot)  # type: ignore[index]
+            _execute(templates, templates[node.value], argument, out)
+
+
+def render_notes(notes: list[Note], changelog_template: str, note_template: str) -> str:
+    notes_by_type: dict[str, list[Note]] = {}
+    for note in sort_notes(notes):
+        notes_by_type.setdefault(note.type, []).append(note)
+    templates = parse_templates(changelog_template, note_template)
+    return execute(templates, MAIN_TEMPLATE, {"NotesByType": notes_by_type})
+
+
+def render_changelog(
+    repo: git_queries.GitRepo,
+    last_release: str,
+    this_release: str,
+    entries_dir: str,
+    changelog_template: Path,
+    note_template: str,
+) -> str:
+    """changelog-build output for the entries added between the two releases."""
+    entries = entries_between(repo, last_release, this_release, entries_dir)
+    notes = [
+        note for issue, content in entries.items() for note in notes_from_entry(issue, content)
+    ]
+    return render_notes(notes, changelog_template.read_text(encoding="utf-8"), note_template)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+from changelog import build_changelog, render_changelog
+from shared.git_queries import GitRepo
+from shared.git_queries_test import FixtureRepo
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GITHUB_URL = "https://github.com/terraform-mongodbatlas-modules/terraform-mongodbatlas-cluster"
+RELEASES = ["0.2.0", "0.3.0", "0.3.1", "0.4.0"]
+ISSUE_PATTERN = re.compile(r"\[#(\d+)\]")
+
+
+def released_sections() -> dict[str, str]:
+    """Version -> section body of the checked-in CHANGELOG.md."""
+    content = (REPO_ROOT / "CHANGELOG.md").read_text(encoding="utf-8")
+    sections = re.split(r"^## (\S+).*\n", content, flags=re.MULTILINE)
+    return dict(zip(sections[1::2], sections[2::2], strict=True))
+
+
+def note_template() -> str:
+    template = (REPO_ROOT / build_changelog.NOTE_TEMPLATE_PATH).read_text(encoding="utf-8")
+    return template.replace(build_changelog.GITHUB_REPO_URL_PLACEHOLDER, GITHUB_URL)
+
+
+@pytest.fixture(scope="module")
+def released_repo(tmp_path_factory: pytest.TempPathFactory) -> FixtureRepo:
+    """Replays the entry files of each CHANGELOG.md release as commits tagged v<version>."""
+    fixture = FixtureRepo(tmp_path_factory.mktemp("released"))
+    fixture.commit("init", ".changelog/.gitkeep")
+    fixture.git("tag", "v0.1.0")
+    sections = released_sections()
+    for version in RELEASES:
+        for issue in sorted(set(ISSUE_PATTERN.findall(sections[version]))):
+            entry = (REPO_ROOT / ".changelog" / f"{issue}.txt").read_text(encoding="utf-8")
+            fixture.commit(entry, f".changelog/{issue}.txt")
+        fixture.git("tag", f"v{version}")
+    return fixture
+
+
+@pytest.mark.parametrize(("last", "this"), list(zip(["0.1.0", *RELEASES], RELEASES)))
+def test_render_changelog_matches_released_sections(
+    released_repo: FixtureRepo, last: str, this: str
+) -> None:
+    with GitRepo(released_repo.root) as git:
+        output = render_changelog.render_changelog(
+            git,
+            f"v{last}",
+            f"v{this}",
+            ".changelog",
+            REPO_ROOT / build_changelog.CHANGELOG_TEMPLATE_PATH,
+            note_template(),
+        )
+
+    assert output.strip() == released_sections()[this].strip()
+
+
+def test_render_notes_sorts_and_groups() -> None:
+    notes = [
+        render_changelog.Note("bug", "b fix", "2"),
+        render_changelog.Note("bug", "a fix", "3"),
+        render_changelog.Note("note", "n", "1"),
+    ]
+    changelog_template = (
+        '{{- range .NotesByType.bug }}\n{{ template "n" . }}{{ end }}'
+        '{{- if index .NotesByType "breaking-change" }}BREAKING{{ else }}\n-{{ end }}'
+    )
+    note_template = '{{ define "n" }}{{.Body}} #{{.Issue}}{{ end }}'
+
+    output = render_changelog.render_notes(notes, changelog_template, note_template)
+
+    assert output == "\na fix #3\nb fix #2\n-"
+
+
+def test_entries_between_only_returns_new_files(released_repo: FixtureRepo) -> None:
+    with GitRepo(released_repo.root) as git:
+        assert list(render_changelog.entries_between(git, "v0.3.0", "v0.3.1", ".changelog")) == [
+            "128"
+        ]
+        assert render_changelog.entries_between(git, "v0.1.0", "v0.1.0", "missing") == {}
+
+
+def test_parse_templates_rejects_unbalanced_blocks() -> None:
+    with pytest.raises(render_changelog.TemplateError, match="unclosed"):
+        render_changelog.parse_templates("{{ if .X }}")
+    with pytest.raises(render_changelog.TemplateError, match="unexpected"):
+        render_changelog.parse_templates("{{ end }}")
@@ -7,6 +7,16 @@ Usage (from repository root):
     Or use the justfile recipe:
     just extract-regions aws
 
+Atlas and provider region responses are fetched concurrently and cached as JSON next to this
+script with `fetched_at`/`expires_at` metadata. Entries older than `--cache-ttl-hours` are
+refetched (the stale copy is kept if the fetch fails); `--refresh` ignores the cache.
+
+`--fixtures-dir` reads recorded responses (regions.json, {aws,azure,gcp}_regions.json) from a
+directory instead of calling any CLI; `python -m dev.region_fixtures` generates synthetic
+fixtures and benchmarks the pipeline. `--formatter builtin` formats generated files in-process
+instead of running `terraform fmt`. `--index PATH` writes a JSON lookup index for
+`shared.region_index` (forward/reverse maps and per-instance-size availability bitsets).
+
 Requires:
     - atlas CLI (authenticated)
     - aws CLI (authenticated, for AWS regions)
@@ -17,9 +27,68 @@ Requires:
 import argparse
 import json
 import os
+import re
 import subprocess
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
+
+from shared import region_index
+
+DEFAULT_CACHE_TTL_HOURS = 24 * 7
+
+
+def read_cache_entry(cache_file: Path) -> tuple[Any, datetime | None]:
+    """Return (data, expires_at); files written before TTL metadata existed have no expiry
+    and are treated as expired."""
+    if not cache_file.exists():
+        return None, None
+    with open(cache_file) as f:
+        content = json.load(f)
+    if isinstance(content, dict) and "expires_at" in content and "data" in content:
+        return content["data"], datetime.fromisoformat(content["expires_at"])
+    return content, None
+
+
+def write_cache_entry(cache_file: Path, data: Any, ttl: timedelta) -> None:
+    fetched_at = datetime.now(UTC)
+    entry = {
+        "fetched_at": fetched_at.isoformat(),
+        "expires_at": (fetched_at + ttl).isoformat(),
+        "data": data,
+    }
+    with open(cache_file, "w") as f:
+        json.dump(entry, f, indent=2)
+
+
+def load_or_fetch_cached(
+    cache_file: Path,
+    label: str,
+    fetcher: Callable[[], Any],
+    ttl: timedelta,
+    refresh: bool = False,
+) -> Any:
+    """Return fresh cached data, else fetch and cache it; fall back to stale data on failure."""
+    cached, expires_at = read_cache_entry(cache_file)
+    if cached and not refresh and expires_at is not None and datetime.now(UTC) < expires_at:
+        print(f"  {label}: Loaded from {cache_file.name} (expires {expires_at:%Y-%m-%d %H:%M})")
+        return cached
+
+    reason = "refresh requested" if refresh else "expired" if cached else "not cached"
+    print(f"  {label}: Fetching from CLI ({reason})...")
+    data = fetcher()
+    if data:
+        write_cache_entry(cache_file, data, ttl)
+        print(f"  {label}: Written to {cache_file.name}")
+        return data
+    if cached:
+        print(f"  {label}: Fetch failed, using stale {cache_file.name}")
+        return cached
+    print(f"  {label}: No data fetched")
+    return data
 
 
 def fetch_atlas_regions(project_id: str) -> dict:
@@ -127,62 +196,92 @@ def fetch_gcp_regions() -> list[str]:
         return []
 
 
+PROVIDER_FETCHERS: dict[str, Callable[[], list[str]]] = {
+    "aws": fetch_aws_regions,
+    "azure": fetch_azure_regions,
+    "gcp": fetch_gcp_regions,
+}
+
+
+def selected_providers(provider_filter: str | None = None) -> list[str]:
+    if not provider_filter:
+        return list(PROVIDER_FETCHERS)
+    provider_lower = provider_filter.lower()
+    if provider_lower not in PROVIDER_FETCHERS:
+        valid = ", ".join(PROVIDER_FETCHERS)
+        sys.exit(f"Error: Invalid provider: {provider_filter}, valid: {valid}")
+    return [provider_lower]
+
+
 def load_or_fetch_provider_regions(
-    output_dir: Path, provider_filter: str | None = None
+    output_dir: Path,
+    provider_filter: str | None = None,
+    ttl: timedelta = timedelta(hours=DEFAULT_CACHE_TTL_HOURS),
+    refresh: bool = False,
 ) -> dict[str, list[str]]:
-    """Load existing region files or fetch from CLIs.
+    """Load cached region files or fetch from CLIs, all providers concurrently.
 
     Args:
         output_dir: Directory to cache the provider region JSON files
         provider_filter: Optional provider to filter by (aws, azure, gcp)
+        ttl: How long fetched regions stay fresh
+        refresh: Fetch even when the cache is fresh
 
     Returns:
         Dict mapping provider name (lowercase) to list of provider region names
     """
-    all_providers = {
-        "aws": fetch_aws_regions,
-        "azure": fetch_azure_regions,
-        "gcp": fetch_gcp_regions,
-    }
-
-    # Filter to specific provider if requested
-    if provider_filter:
-        provider_lower = provider_filter.lower()
-        if provider_lower in all_providers:
-            providers = {provider_lower: all_providers[provider_lower]}
-        else:
-            valid = ", ".join(all_providers.keys())
-            sys.exit(f"Error: Invalid provider: {provider_filter}, valid: {valid}")
-    else:
-        providers = all_providers
+    providers = selected_providers(provider_filter)
+
+    def load(provider: str) -> list[str]:
+        return load_or_fetch_cached(
+            output_dir / f"{provider}_regions.json",
+            provider.upper(),
+            PROVIDER_FETCHERS[provider],
+            ttl,
+            refresh,
+        )
 
-    all_regions: dict[str, list[str]] = {}
+    with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+        return dict(zip(providers, executor.map(load, providers), strict=True))
 
-    for provider, fetcher in providers.items():
-        output_file = output_dir / f"{provider}_regions.json"
 
-        # Try to load existing file first
-        if output_file.exists():
-            with open(output_file) as f:
-                if regions := json.load(f):
-                    print(f"  {provider.upper()}: Loaded {len(regions)} from {output_file.name}")
-                    all_regions[provider] = regions
-                    continue
+def index_atlas_regions(data: dict) -> dict[str, set[str]]:
+    """Collect every provider's Atlas region names in a single pass over the response."""
+    provider_regions: dict[str, set[str]] = {}
+    for result in data.get("results", []):
+        if not (provider := result.get("provider")):
+            continue
+        regions = provider_regions.setdefault(provider, set())
+        for instance_size in result.get("instanceSizes", []):
+            regions.update(
+                name
+                for region in instance_size.get("availableRegions", [])
+                if (name := region.get("name"))
+            )
+    return provider_regions
 
-        # Fetch from CLI
-        print(f"  {provider.upper()}: Fetching from CLI...")
-        regions = fetcher()
-        all_regions[provider] = regions
 
-        with open(output_file, "w") as f:
-            json.dump(regions, f, indent=2)
+def index_instance_sizes(data: dict) -> dict[str, dict[str, set[str]]]:
+    """Provider -> instance size -> Atlas regions the size is available in."""
+    sizes: dict[str, dict[str, set[str]]] = {}
+    for result in data.get("results", []):
+        if not (provider := result.get("provider")):
+            continue
+        provider_sizes = sizes.setdefault(provider, {})
+        for instance_size in result.get("instanceSizes", []):
+            if not (size_name := instance_size.get("name")):
+                continue
+            provider_sizes.setdefault(size_name, set()).update(
+                name
+                for region in instance_size.get("availableRegions", [])
+                if (name := region.get("name"))
+            )
+    return sizes
 
-        if regions:
-            print(f"  {provider.upper()}: Written {len(regions)} regions to {output_file.name}")
-        else:
-            print(f"  {provider.upper()}: No regions fetched")
 
-    return all_regions
+def write_region_index(index_file: Path, atlas_data: dict, mappings: dict[str, dict]) -> None:
+    index = region_index.build_region_index(index_instance_sizes(atlas_data), mappings)
+    index_file.write_text(json.dumps(index, separators=(",", ":"), sort_keys=True) + "\n")
 
 
 def extract_atlas_regions(data: dict, provider_filter: str | None = None) -> dict[str, set[str]]:
@@ -195,26 +294,11 @@ def extract_atlas_regions(data: dict, provider_filter: str | None = None) -> dic
     Returns:
         Dict mapping provider name (uppercase) to set of Atlas region names
     """
-    provider_regions: dict[str, set[str]] = {}
-    filter_upper = provider_filter.upper() if provider_filter else None
-
-    for result in data.get("results", []):
-        if not (provider := result.get("provider")):
-            continue
-
-        # Skip if filtering and this isn't the requested provider
-        if filter_upper and provider != filter_upper:
-            continue
-
-        if provider not in provider_regions:
-            provider_regions[provider] = set()
-
-        for instance_size in result.get("instanceSizes", []):
-            for region in instance_size.get("availableRegions", []):
-                if region_name := region.get("name"):
-                    provider_regions[provider].add(region_name)
-
-    return provider_regions
+    provider_regions = index_atlas_regions(data)
+    if not provider_filter:
+        return provider_regions
+    filter_upper = provider_filter.upper()
+    return {p: regions for p, regions in provider_regions.items() if p == filter_upper}
 
 
 # =============================================================================
@@ -413,6 +497,7 @@ def generate_terraform_locals(
     mappings: dict[str, dict],
     output_dir: Path,
     include_invalid: bool = False,
+    formatter: Callable[[Path], None] | None = None,
 ) -> Path:
     """Generate a regions.tf file with atlas<->provider region mappings.
 
@@ -421,6 +506,7 @@ def generate_terraform_locals(
         mappings: Region mappings for the provider {atlas_region: {provider_region, valid}}
         output_dir: Directory to write the regions.tf file
         include_invalid: Whether to include invalid/unmapped regions (commented out)
+        formatter: Formats the written file in place (default: terraform fmt)
 
     Returns:
         Path to the generated file
@@ -460,8 +546,7 @@ def generate_terraform_locals(
     with open(output_file, "w") as f:
         f.write("\n".join(lines))
 
-    # Format with terraform fmt
-    _run_terraform_fmt(output_file)
+    (formatter or _run_terraform_fmt)(output_file)
 
     return output_file
 
@@ -471,6 +556,7 @@ def generate_terraform_variable(
     mappings: dict[str, dict],
     output_dir: Path,
     include_invalid: bool = False,
+    formatter: Callable[[Path], None] | None = None,
 ) -> Path:
     """Generate a variables_generated.tf file with an atlas_to_{provider}_region variable."""
     provider_lower = provider.lower()
@@ -512,7 +598,7 @@ def generate_terraform_variable(
     with open(output_file, "w") as f:
         f.write("\n".join(lines))
 
-    _run_terraform_fmt(output_file)
+    (formatter or _run_terraform_fmt)(output_file)
     return output_file
 
 
@@ -531,6 +617,57 @@ def _run_terraform_fmt(file_path: Path) -> None:
     )
 
 
+_ASSIGNMENT_PATTERN = re.compile(r"^(\s*)([\w-]+)\s*=(?!=)\s*(.*)$")
+_HEREDOC_START_PATTERN = re.compile(r"<<-?(\w+)\s*$")
+
+
+def align_assignments(text: str) -> str:
+    """Align `=` of consecutive attributes at the same indent, like `terraform fmt`.
+
+    Covers the layout this script generates (flat maps, heredocs); it is not a general HCL
+    formatter.
+    """
+    out: list[str] = []
+    group: list[tuple[str, str, str]] = []
+
+    def flush() -> None:
+        width = max((len(key) for _, key, _ in group), default=0)
+        out.extend(f"{indent}{key.ljust(width)} = {value}" for indent, key, value in group)
+        group.clear()
+
+    heredoc_end = None
+    for line in text.splitlines():
+        if heredoc_end is not None:
+            out.append(line)
+            if line.strip() == heredoc_end:
+                heredoc_end = None
+            continue
+        match = _ASSIGNMENT_PATTERN.match(line)
+        if match and (not group or group[0][0] == match.group(1)):
+            group.append((match.group(1), match.group(2), match.group(3)))
+        else:
+            flush()
+            if match:
+                group.append((match.group(1), match.group(2), match.group(3)))
+            else:
+                out.append(line)
+        if heredoc := _HEREDOC_START_PATTERN.search(line):
+            flush()
+            heredoc_end = heredoc.group(1)
+    flush()
+    return "\n".join(out) + ("\n" if text.endswith("\n") else "")
+
+
+def format_in_process(file_path: Path) -> None:
+    file_path.write_text(align_assignments(file_path.read_text()))
+
+
+FORMATTERS: dict[str, Callable[[Path], None]] = {
+    "terraform": _run_terraform_fmt,
+    "builtin": format_in_process,
+}
+
+
 def print_usage_snippet(provider: str) -> None:
     """Print Terraform usage snippet for region lookup."""
     p = provider.lower()
@@ -576,40 +713,62 @@ check "valid_region" {{
     print(snippet)
 
 
-def load_or_fetch_atlas_regions(cache_dir: Path, project_id: str | None) -> dict:
-    """Load existing Atlas regions file or fetch from Atlas CLI.
+def load_or_fetch_atlas_regions(
+    cache_dir: Path,
+    project_id: str | None,
+    ttl: timedelta = timedelta(hours=DEFAULT_CACHE_TTL_HOURS),
+    refresh: bool = False,
+) -> dict:
+    """Load the cached Atlas regions file or fetch from Atlas CLI.
 
     Args:
         cache_dir: Directory to cache the regions.json file
         project_id: Atlas project ID (required if fetching from CLI)
+        ttl: How long the fetched response stays fresh
+        refresh: Fetch even when the cache is fresh
 
     Returns:
         Raw API response dict from listClusterProviderRegions
     """
     output_file = cache_dir / "regions.json"
 
-    # Try to load existing file first
-    if output_file.exists():
-        with open(output_file) as f:
-            if data := json.load(f):
-                print(f"  ATLAS: Loaded from {output_file.name}")
-                return data
-
-    # Fetch from CLI
-    if not project_id:
-        print("  ATLAS: No cached file and MONGODB_ATLAS_PROJECT_ID not set")
-        print("  Set MONGODB_ATLAS_PROJECT_ID env var to fetch from Atlas CLI")
-        return {}
-
-    print(f"  ATLAS: Fetching from CLI (project: {project_id})...")
-    data = fetch_atlas_regions(project_id)
-
-    if data:
-        with open(output_file, "w") as f:
-            json.dump(data, f, indent=2)
-        print(f"  ATLAS: Written to {output_file.name}")
-
-    return data
+    def fetch() -> dict:
+        if not project_id:
+            print("  ATLAS: MONGODB_ATLAS_PROJECT_ID not set, cannot fetch from Atlas CLI")
+            return {}
+        return fetch_atlas_regions(project_id)
+
+    return load_or_fetch_cached(output_file, "ATLAS", fetch, ttl, refresh)
+
+
+def load_fixture_regions(
+    fixtures_dir: Path, provider_filter: str | None = None
+) -> tuple[dict, dict[str, list[str]]]:
+    """Read recorded Atlas and provider responses from fixtures_dir without calling any CLI."""
+    atlas_data, _ = read_cache_entry(fixtures_dir / "regions.json")
+    print(f"  ATLAS: Loaded fixture from {fixtures_dir}")
+    provider_regions = {}
+    for provider in selected_providers(provider_filter):
+        regions, _ = read_cache_entry(fixtures_dir / f"{provider}_regions.json")
+        provider_regions[provider] = regions or []
+        print(f"  {provider.upper()}: Loaded {len(provider_regions[provider])} from fixture")
+    return atlas_data or {}, provider_regions
+
+
+def load_or_fetch_all(
+    cache_dir: Path,
+    project_id: str | None,
+    provider_filter: str | None = None,
+    ttl: timedelta = timedelta(hours=DEFAULT_CACHE_TTL_HOURS),
+    refresh: bool = False,
+) -> tuple[dict, dict[str, list[str]]]:
+    """Load or fetch the Atlas response and the provider regions concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        atlas = executor.submit(load_or_fetch_atlas_regions, cache_dir, project_id, ttl, refresh)
+        providers = executor.submit(
+            load_or_fetch_provider_regions, cache_dir, provider_filter, ttl, refresh
+        )
+        return atlas.result(), providers.result()
 
 
 def parse_args() -> argparse.Namespace:
@@ -643,6 +802,33 @@ def parse_args() -> argparse.Namespace:
         default="locals",
         help="'variable' => variables_generated.tf, 'locals' => regions_{provider}.tf",
     )
+    parser.add_argument(
+        "--fixtures-dir",
+        type=Path,
+        help="Read recorded Atlas/provider responses from this directory instead of the CLIs",
+    )
+    parser.add_argument(
+        "--formatter",
+        choices=sorted(FORMATTERS),
+        default="terraform",
+        help="How to format generated .tf files (builtin runs in-process without terraform)",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        help="Also write a JSON region lookup index (see shared/region_index.py) to this path",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Refetch Atlas and provider regions even if the cached responses are fresh",
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_CACHE_TTL_HOURS,
+        help=f"Hours before cached responses are refetched (default: {DEFAULT_CACHE_TTL_HOURS})",
+    )
     return parser.parse_args()
 
 
@@ -658,19 +844,21 @@ def main():
     output_dir = args.output_dir or script_dir  # For .tf files only
     fail_on_unmapped = args.fail_on_unmapped
 
-    # Step 1: Load or fetch Atlas regions
-    print("=== Step 1: Load/fetch Atlas regions ===")
-    atlas_data = load_or_fetch_atlas_regions(script_dir, project_id)
+    # Steps 1-2: Load or fetch Atlas and provider regions concurrently (JSON caches in script_dir)
+    print("=== Steps 1-2: Load/fetch Atlas and provider regions ===")
+    ttl = timedelta(hours=args.cache_ttl_hours)
+    if args.fixtures_dir:
+        atlas_data, provider_regions = load_fixture_regions(args.fixtures_dir, provider)
+    else:
+        atlas_data, provider_regions = load_or_fetch_all(
+            script_dir, project_id, provider, ttl, refresh=args.refresh
+        )
     if not atlas_data:
         sys.exit(
             "Error: No Atlas regions data available."
             " Either provide regions.json or set MONGODB_ATLAS_PROJECT_ID env var."
         )
 
-    # Step 2: Load or fetch provider regions (JSON files go to script_dir)
-    print("\n=== Step 2: Load/fetch provider regions ===")
-    provider_regions = load_or_fetch_provider_regions(script_dir, provider)
-
     # Step 3: Extract Atlas regions from API response (filtered by provider if specified)
     print("\n=== Step 3: Extract Atlas regions ===")
     atlas_regions = extract_atlas_regions(atlas_data, provider)
@@ -690,6 +878,10 @@ def main():
         print(f"\n❌ Found {invalid_count} unmapped region(s). Exiting with error.")
         sys.exit(1)
 
+    if args.index:
+        write_region_index(args.index, atlas_data, mappings)
+        print(f"\nRegion index written to {args.index}")
+
     # Step 5: Generate output
     if provider:
         if provider_upper not in mappings:
@@ -705,6 +897,7 @@ def main():
             mappings[provider_upper],
             output_dir,
             include_invalid=include_invalid,
+            formatter=FORMATTERS[args.formatter],
         )
         print(f"\nGenerated {output_file}")
         print_usage_snippet(provider)
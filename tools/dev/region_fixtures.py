@@ -0,0 +1,181 @@
+"""Synthetic fixtures and a benchmark for the extract_regions pipeline.
+
+`generate` writes recorded-style responses (regions.json, {aws,azure,gcp}_regions.json) that
+`extract_regions --fixtures-dir` reads without any CLI. `bench` times extract -> validate ->
+render on synthetic (or recorded) fixtures, using the in-process formatter by default.
+
+Usage:
+    uv run --directory tools python -m dev.region_fixtures generate OUT_DIR --instance-sizes 200
+    uv run --directory tools python -m dev.region_fixtures bench --instance-sizes 200 --regions 500
+    uv run --directory tools python -m dev.region_fixtures bench --fixtures-dir OUT_DIR
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dev import extract_regions
+
+DEFAULT_INSTANCE_SIZES = 50
+DEFAULT_REGIONS = 100
+# Share of generated Atlas regions that the provider region list does not contain.
+UNKNOWN_REGION_RATIO = 0.05
+
+
+def _aws_regions(count: int) -> list[str]:
+    return [f"SYNTH_{i // 9}_REGION_{i % 9 + 1}" for i in range(count)]
+
+
+def _mapped_regions(region_map: dict[str, str | None], count: int, prefix: str) -> list[str]:
+    known = sorted(region_map)
+    return known[:count] + [f"{prefix}_SYNTH_{i}" for i in range(count - len(known))]
+
+
+def synthetic_responses(
+    instance_sizes: int = DEFAULT_INSTANCE_SIZES,
+    regions: int = DEFAULT_REGIONS,
+    seed: int = 0,
+) -> tuple[dict, dict[str, list[str]]]:
+    """An Atlas listClusterProviderRegions response and provider region lists.
+
+    Each provider gets `regions` Atlas regions spread over `instance_sizes` instance sizes;
+    AWS names are synthetic, Azure and GCP start with the static map keys so mappings resolve.
+    """
+    rng = random.Random(seed)
+    atlas_regions = {
+        "AWS": _aws_regions(regions),
+        "AZURE": _mapped_regions(extract_regions.AZURE_REGION_MAP, regions, "AZURE"),
+        "GCP": _mapped_regions(extract_regions.GCP_REGION_MAP, regions, "GCP"),
+    }
+    results = []
+    for provider, names in atlas_regions.items():
+        sizes = []
+        for i in range(instance_sizes):
+            # The first size offers every region so each one shows up in the extract.
+            available = names if i == 0 else rng.sample(names, k=max(1, len(names) // 2))
+            sizes.append(
+                {"name": f"M{(i + 1) * 10}", "availableRegions": [{"name": n} for n in available]}
+            )
+        results.append({"provider": provider, "instanceSizes": sizes})
+
+    provider_regions = {}
+    for provider, names in atlas_regions.items():
+        mapped = extract_regions.create_validated_mappings({provider: set(names)}, {})
+        transformed = [
+            info["provider_region"]
+            for info in mapped[provider].values()
+            if info["provider_region"] is not None
+        ]
+        keep = len(transformed) - int(len(transformed) * UNKNOWN_REGION_RATIO)
+        provider_regions[provider.lower()] = sorted(rng.sample(transformed, k=keep))
+    return {"results": results}, provider_regions
+
+
+def write_fixtures(
+    fixtures_dir: Path, atlas_data: dict, provider_regions: dict[str, list[str]]
+) -> None:
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    (fixtures_dir / "regions.json").write_text(json.dumps(atlas_data, indent=2))
+    for provider, regions in provider_regions.items():
+        (fixtures_dir / f"{provider}_regions.json").write_text(json.dumps(regions, indent=2))
+
+
+def run_pipeline(
+    atlas_data: dict,
+    provider_regions: dict[str, list[str]],
+    output_dir: Path,
+    formatter: Callable[[Path], None] = extract_regions.format_in_process,
+) -> dict[str, float]:
+    """Run extract -> validate -> render once; return seconds per stage."""
+    timings = {}
+    start = time.perf_counter()
+    atlas_regions = extract_regions.extract_atlas_regions(atlas_data)
+    timings["extract"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mappings = extract_regions.create_validated_mappings(atlas_regions, provider_regions)
+    timings["validate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for provider, provider_mappings in mappings.items():
+        extract_regions.generate_terraform_locals(
+            provider, provider_mappings, output_dir, formatter=formatter
+        )
+    timings["render"] = time.perf_counter() - start
+    return timings
+
+
+def benchmark(
+    atlas_data: dict,
+    provider_regions: dict[str, list[str]],
+    iterations: int,
+    formatter: Callable[[Path], None] = extract_regions.format_in_process,
+) -> dict[str, list[float]]:
+    runs: dict[str, list[float]] = {}
+    with tempfile.TemporaryDirectory(prefix="region-bench-") as output_dir:
+        for _ in range(iterations):
+            for stage, seconds in run_pipeline(
+                atlas_data, provider_regions, Path(output_dir), formatter
+            ).items():
+                runs.setdefault(stage, []).append(seconds)
+    return runs
+
+
+def print_benchmark(runs: dict[str, list[float]]) -> None:
+    print(f"{'stage':10} {'min ms':>10} {'median ms':>10} {'max ms':>10}")
+    totals = [sum(stage_runs) for stage_runs in zip(*runs.values(), strict=True)]
+    for stage, seconds in [*runs.items(), ("total", totals)]:
+        print(
+            f"{stage:10} {min(seconds) * 1000:10.2f} {statistics.median(seconds) * 1000:10.2f}"
+            f" {max(seconds) * 1000:10.2f}"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("generate", "bench"):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--instance-sizes", type=int, default=DEFAULT_INSTANCE_SIZES)
+        sub.add_argument("--regions", type=int, default=DEFAULT_REGIONS, help="Per provider")
+        sub.add_argument("--seed", type=int, default=0)
+        if name == "generate":
+            sub.add_argument("fixtures_dir", type=Path)
+        else:
+            sub.add_argument("--fixtures-dir", type=Path, help="Use recorded fixtures instead")
+            sub.add_argument("--iterations", type=int, default=5)
+            sub.add_argument(
+                "--formatter", choices=sorted(extract_regions.FORMATTERS), default="builtin"
+            )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.command == "bench" and args.fixtures_dir:
+        atlas_data, provider_regions = extract_regions.load_fixture_regions(args.fixtures_dir)
+    else:
+        atlas_data, provider_regions = synthetic_responses(
+            args.instance_sizes, args.regions, args.seed
+        )
+
+    if args.command == "generate":
+        write_fixtures(args.fixtures_dir, atlas_data, provider_regions)
+        print(f"Wrote fixtures to {args.fixtures_dir}")
+        return
+
+    runs = benchmark(
+        atlas_data, provider_regions, args.iterations, extract_regions.FORMATTERS[args.formatter]
+    )
+    print_benchmark(runs)
+
+
+if __name__ == "__main__":
+    main()
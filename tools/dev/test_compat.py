@@ -1,33 +1,64 @@
 """Terraform CLI version compatibility testing.
 
-Runs `terraform init -backend=false` and `terraform validate` across all configured
-Terraform versions (defined in .terraform-versions.yaml) for the root module and all examples.
+Runs `terraform validate` across all configured Terraform versions (defined in
+.terraform-versions.yaml) for the root module and all examples. Every (version, target) job
+runs in its own work dir that mirrors the repo layout with symlinks, so all jobs can run in
+parallel without sharing `.terraform` directories.
+
+Providers are installed once per version: a pre-warm step runs `terraform init -backend=false`
+on a config requiring every provider the targets declare. Jobs link that provider directory,
+copy its lock file and write the local module manifest, so a job only runs `validate`. Jobs
+with non-local module sources, or that fail on the fast path, fall back to a full
+`terraform init -backend=false`.
+
+Passing jobs are cached by Terraform version and a hash of the target's `.tf` files, the
+local modules they reference and the lock file the version's pre-warm init resolved, so a new
+provider release invalidates the cache. Computing that key needs the pre-warm, so even a fully
+cached run installs and pre-warms every version; only `validate` is skipped. Unchanged jobs
+are reported as cached passes. Use `--no-cache` to force a full run.
+
+Init and validate durations are recorded per job and summarized as per-version and
+per-target latency histograms plus a critical-path estimate per worker count. `--json` and
+`--junit` write machine-readable reports.
 
 Usage:
-    uv run --directory tools python -m dev.test_compat
+    uv run --directory tools python -m dev.test_compat [--no-cache] [--json F] [--junit F]
     # or via just:
     just test-compat
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import heapq
+import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
-import threading
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import yaml
 
 from dev import REPO_ROOT, VERSIONS_FILE
-from shared import tf_retry
+from shared import tf_modules, tf_retry
 
 MAX_WORKERS = min(os.cpu_count() or 4, 8)
+HISTOGRAM_WIDTH = 30
+CRITICAL_PATH_WORKERS = (1, 2, 4, 8, 16)
+CACHE_FILE = Path(__file__).parent / ".compat_cache.json"
+# Bump when the job definition (commands, work dir layout) changes to invalidate old entries.
+CACHE_SCHEMA = "3"
+LOCK_FILE = ".terraform.lock.hcl"
+PROVIDERS_DIR = Path(".terraform/providers")
 
 
 @dataclass
@@ -36,14 +67,20 @@ class TestResult:
     target: str
     passed: bool
     output: str
+    cached: bool = False
+    init_seconds: float = 0.0
+    validate_seconds: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.init_seconds + self.validate_seconds
 
 
 @dataclass
 class TestJob:
     version: str
     target: Path
-    use_temp_dir: bool
-    target_lock: threading.Lock
+    cache_key: str | None = None
 
 
 def load_versions(config_path: Path) -> list[str]:
@@ -62,71 +99,220 @@ def discover_targets() -> list[Path]:
     return targets
 
 
-def copy_module_files(source: Path, dest: Path) -> None:
-    for tf_file in source.glob("*.tf"):
-        shutil.copy2(tf_file, dest / tf_file.name)
-    modules_dir = source / "modules"
+def target_name(target: Path, repo_root: Path = REPO_ROOT) -> str:
+    return "root" if target == repo_root else target.name
+
+
+def _is_work_data(path: Path) -> bool:
+    return path.name.startswith(".") or path.name.startswith("terraform.tfstate")
+
+
+def link_entry(source: Path, dest: Path) -> None:
+    """Symlink source to dest, copying instead where symlinks are unavailable."""
+    try:
+        dest.symlink_to(source, target_is_directory=source.is_dir())
+    except OSError:
+        if source.is_dir():
+            shutil.copytree(source, dest)
+        else:
+            shutil.copy2(source, dest)
+
+
+def prepare_work_dir(target: Path, work_root: Path, repo_root: Path = REPO_ROOT) -> Path:
+    """Mirror the module (and the target example) under work_root and return the job dir.
+
+    Examples reference the root module with relative sources such as `../..`, so the
+    repo layout is kept: root `*.tf` and `modules/` are linked into work_root, and an
+    example's entries are linked into work_root/examples/<name>.
+    """
+    for tf_file in repo_root.glob("*.tf"):
+        link_entry(tf_file, work_root / tf_file.name)
+    modules_dir = repo_root / "modules"
     if modules_dir.exists():
-        shutil.copytree(modules_dir, dest / "modules")
+        link_entry(modules_dir, work_root / "modules")
+    if target == repo_root:
+        return work_root
+    work_dir = work_root / target.relative_to(repo_root)
+    work_dir.mkdir(parents=True)
+    for entry in target.iterdir():
+        if not _is_work_data(entry):
+            link_entry(entry, work_dir / entry.name)
+    return work_dir
+
+
+def estimate_cost(target: Path) -> int:
+    """Relative job cost: bytes of Terraform config in the target and its nested modules."""
+    tf_files = list(target.glob("*.tf"))
+    nested_modules = target / "modules"
+    if nested_modules.exists():
+        tf_files.extend(nested_modules.rglob("*.tf"))
+    return sum(f.stat().st_size for f in tf_files)
+
+
+def schedule_jobs(versions: list[str], targets: list[Path]) -> list[TestJob]:
+    """All (version, target) jobs, slowest targets first so the pool drains evenly."""
+    costs = {target: estimate_cost(target) for target in targets}
+    ordered = sorted(targets, key=lambda t: costs[t], reverse=True)
+    return [TestJob(version=version, target=target) for target in ordered for version in versions]
+
+
+def job_cache_key(job: TestJob, warm_dir: Path | None, repo_root: Path = REPO_ROOT) -> str | None:
+    """Hash of the job's inputs, or None when its providers were not resolved (not cacheable).
+
+    Providers are keyed by the lock file of the version's pre-warm init, which is what the job
+    validates against, so a new provider release invalidates cached passes.
+    """
+    lock_file = warm_dir / LOCK_FILE if warm_dir is not None else None
+    if lock_file is None or not lock_file.exists():
+        return None
+    digest = hashlib.sha256(f"{CACHE_SCHEMA}\n{job.version}\n".encode())
+    root = repo_root.resolve()
+    for module_dir in tf_modules.local_module_dirs(job.target):
+        rel_dir = module_dir.relative_to(root) if module_dir.is_relative_to(root) else module_dir
+        for tf_file in sorted(module_dir.glob("*.tf")):
+            digest.update(f"{rel_dir / tf_file.name}\n".encode())
+            digest.update(tf_file.read_bytes())
+    digest.update(lock_file.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cache(cache_file: Path) -> dict[str, dict[str, str]]:
+    if not cache_file.exists():
+        return {}
+    try:
+        return json.loads(cache_file.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_cache(cache_file: Path, entries: dict[str, dict[str, str]]) -> None:
+    cache_file.write_text(json.dumps(entries, indent=2, sort_keys=True) + "\n")
+
+
+def terraform_cmd(version: str, *args: str) -> list[str]:
+    return ["mise", "x", f"terraform@{version}", "--", "terraform", *args]
+
+
+def prewarm_providers(version: str, targets: list[Path], warm_root: Path) -> Path:
+    """Install every provider the targets require once for version; return the warm dir.
+
+    Raises tf_retry.TerraformInitError when init fails.
+    """
+    warm_dir = warm_root / f"terraform-{version}"
+    warm_dir.mkdir(parents=True)
+    module_dirs = sorted({d for t in targets for d in tf_modules.local_module_dirs(t)})
+    requirements = tf_modules.provider_requirements(module_dirs)
+    (warm_dir / "versions.tf").write_text(tf_modules.render_required_providers(requirements))
+    tf_retry.run_terraform_init(terraform_cmd(version, "init", "-backend=false"), warm_dir)
+    return warm_dir
+
+
+def prewarm_versions(versions: list[str], targets: list[Path], warm_root: Path) -> dict[str, Path]:
+    """Pre-warm providers for all versions concurrently; versions that fail are left out."""
+    print(f"Pre-warming providers for {len(versions)} Terraform versions...")
 
+    def prewarm(version: str) -> tuple[str, Path | None, str]:
+        try:
+            return version, prewarm_providers(version, targets, warm_root), ""
+        except tf_retry.TerraformInitError as e:
+            return version, None, e.stderr.strip()
+
+    warm_dirs: dict[str, Path] = {}
+    with ThreadPoolExecutor(max_workers=max(len(versions), 1)) as executor:
+        for version, warm_dir, error in executor.map(prewarm, versions):
+            if warm_dir is None:
+                print(f"  terraform@{version}: FAIL, jobs will run a full init")
+                print(f"    Error: {error}", file=sys.stderr)
+            else:
+                warm_dirs[version] = warm_dir
+                print(f"  terraform@{version}: ok")
+    print()
+    return warm_dirs
+
+
+def link_warm_providers(work_dir: Path, warm_dir: Path) -> bool:
+    """Set work_dir up as if initialized against warm_dir; False when init is still needed."""
+    manifest = tf_modules.module_manifest(work_dir)
+    if manifest is None:
+        return False
+    (work_dir / PROVIDERS_DIR).parent.mkdir(parents=True, exist_ok=True)
+    warm_providers = warm_dir / PROVIDERS_DIR
+    if warm_providers.exists():
+        link_entry(warm_providers, work_dir / PROVIDERS_DIR)
+    shutil.copyfile(warm_dir / LOCK_FILE, work_dir / LOCK_FILE)
+    tf_modules.write_module_manifest(work_dir, manifest)
+    return True
 
-def _run_validate(job: TestJob) -> TestResult:
-    target_name = job.target.name if job.target.name != job.target.parent.name else "root"
-    work_dir = job.target
-    temp_dir_path = None
 
-    if job.use_temp_dir:
-        temp_dir_path = tempfile.mkdtemp(prefix=f"tf-compat-{target_name}-")
-        work_dir = Path(temp_dir_path)
-        copy_module_files(job.target, work_dir)
+def reset_work_dir(work_dir: Path) -> None:
+    """Drop fast-path init artifacts so a full `terraform init` starts clean."""
+    terraform_dir = work_dir / ".terraform"
+    if terraform_dir.exists():
+        shutil.rmtree(terraform_dir)
+    (work_dir / LOCK_FILE).unlink(missing_ok=True)
+
+
+def run_validate(job: TestJob, warm_dir: Path | None = None) -> TestResult:
+    name = target_name(job.target)
+    temp_dir_path = tempfile.mkdtemp(prefix=f"tf-compat-{name}-{job.version}-")
+    work_dir = prepare_work_dir(job.target, Path(temp_dir_path))
+    validate_cmd = terraform_cmd(job.version, "validate")
 
     try:
-        init_cmd = [
-            "mise",
-            "x",
-            f"terraform@{job.version}",
-            "--",
-            "terraform",
-            "init",
-            "-backend=false",
-        ]
+        start = time.perf_counter()
+        if warm_dir is not None and link_warm_providers(work_dir, warm_dir):
+            init_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            validate_result = subprocess.run(
+                validate_cmd, cwd=work_dir, capture_output=True, text=True
+            )
+            validate_seconds = time.perf_counter() - start
+            if validate_result.returncode == 0:
+                return TestResult(
+                    version=job.version,
+                    target=name,
+                    passed=True,
+                    output="",
+                    init_seconds=init_seconds,
+                    validate_seconds=validate_seconds,
+                )
+            # Confirm fast-path failures with a full init before reporting them.
+            reset_work_dir(work_dir)
+
+        start = time.perf_counter()
         try:
-            tf_retry.run_terraform_init(init_cmd, work_dir)
+            tf_retry.run_terraform_init(
+                terraform_cmd(job.version, "init", "-backend=false"), work_dir
+            )
         except tf_retry.TerraformInitError as e:
             return TestResult(
                 version=job.version,
-                target=target_name,
+                target=name,
                 passed=False,
                 output=f"init failed: {e.stderr}",
+                init_seconds=time.perf_counter() - start,
             )
+        init_seconds = time.perf_counter() - start
 
-        validate_cmd = ["mise", "x", f"terraform@{job.version}", "--", "terraform", "validate"]
+        start = time.perf_counter()
         validate_result = subprocess.run(validate_cmd, cwd=work_dir, capture_output=True, text=True)
+        validate_seconds = time.perf_counter() - start
 
-        if validate_result.returncode == 0:
-            return TestResult(version=job.version, target=target_name, passed=True, output="")
-
+        passed = validate_result.returncode == 0
         return TestResult(
             version=job.version,
-            target=target_name,
-            passed=False,
-            output=validate_result.stderr or validate_result.stdout,
+            target=name,
+            passed=passed,
+            output="" if passed else validate_result.stderr or validate_result.stdout,
+            init_seconds=init_seconds,
+            validate_seconds=validate_seconds,
         )
     finally:
-        if temp_dir_path:
-            shutil.rmtree(temp_dir_path, ignore_errors=True)
-
-
-def run_validate(job: TestJob) -> TestResult:
-    if job.use_temp_dir:
-        return _run_validate(job)
-
-    with job.target_lock:
-        return _run_validate(job)
+        shutil.rmtree(temp_dir_path, ignore_errors=True)
 
 
 def print_summary(results: list[TestResult]) -> None:
-    versions = sorted(set(r.version for r in results), key=lambda v: [int(x) for x in v.split(".")])
+    versions = sorted(set(r.version for r in results), key=version_key)
     print("\n" + "=" * 60)
     print("Terraform Version Compatibility Results")
     print("=" * 60)
@@ -139,7 +325,9 @@ def print_summary(results: list[TestResult]) -> None:
         status = "PASS" if passed == total else "FAIL"
         if status == "FAIL":
             all_passed = False
-        print(f"  {version:8} : {status} ({passed}/{total} targets)")
+        cached = sum(1 for r in version_results if r.cached)
+        cached_note = f", {cached} cached" if cached else ""
+        print(f"  {version:8} : {status} ({passed}/{total} targets{cached_note})")
 
     print("=" * 60)
 
@@ -157,70 +345,216 @@ def print_summary(results: list[TestResult]) -> None:
         print(f"\n{len(failures)} failure(s) detected.")
 
 
-def preinstall_versions(versions: list[str]) -> bool:
-    print("Pre-installing Terraform versions...")
-    for version in versions:
-        print(f"  Installing terraform@{version}...", end=" ", flush=True)
-        result = subprocess.run(
-            ["mise", "install", f"terraform@{version}"], capture_output=True, text=True
+def version_key(version: str) -> list[int]:
+    return [int(x) for x in version.split(".")]
+
+
+def format_histogram(
+    title: str, results: list[TestResult], key: Callable[[TestResult], str]
+) -> list[str]:
+    """One bar per group, scaled to the slowest group's total executed time."""
+    groups: dict[str, list[float]] = {}
+    for r in results:
+        if not r.cached:
+            groups.setdefault(key(r), []).append(r.duration)
+    if not groups:
+        return []
+    totals = {name: sum(durations) for name, durations in groups.items()}
+    longest = max(totals.values()) or 1.0
+    lines = [f"{title} (total / mean / max seconds):"]
+    for name, durations in sorted(groups.items(), key=lambda item: totals[item[0]], reverse=True):
+        bar = "#" * max(1, round(HISTOGRAM_WIDTH * totals[name] / longest))
+        mean = totals[name] / len(durations)
+        lines.append(
+            f"  {name:40.40} {bar:<{HISTOGRAM_WIDTH}} "
+            f"{totals[name]:7.1f} / {mean:5.1f} / {max(durations):5.1f}"
+        )
+    return lines
+
+
+def estimate_makespan(durations: list[float], workers: int) -> float:
+    """Wall time of running durations in order on a pool of `workers` (greedy list scheduling)."""
+    finish_times = [0.0] * max(workers, 1)
+    for duration in durations:
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
+
+
+def print_timing_report(results: list[TestResult], wall_seconds: float) -> None:
+    executed = [r for r in results if not r.cached]
+    if not executed:
+        return
+    print()
+    for line in format_histogram("Per-version latency", executed, lambda r: r.version):
+        print(line)
+    print()
+    for line in format_histogram("Per-target latency", executed, lambda r: r.target):
+        print(line)
+    durations = sorted((r.duration for r in executed), reverse=True)
+    init_total = sum(r.init_seconds for r in executed)
+    validate_total = sum(r.validate_seconds for r in executed)
+    print()
+    print(
+        f"Job time: {sum(durations):.1f}s (init {init_total:.1f}s, validate {validate_total:.1f}s),"
+        f" wall time {wall_seconds:.1f}s with {MAX_WORKERS} workers"
+    )
+    print(f"Critical path (slowest job): {durations[0]:.1f}s")
+    estimates = ", ".join(
+        f"{w} workers ~{estimate_makespan(durations, w):.1f}s" for w in CRITICAL_PATH_WORKERS
+    )
+    print(f"Estimated wall time: {estimates}")
+
+
+def write_json_report(path: Path, results: list[TestResult], wall_seconds: float) -> None:
+    report = {
+        "wall_seconds": wall_seconds,
+        "max_workers": MAX_WORKERS,
+        "results": [asdict(r) | {"duration": r.duration} for r in results],
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def write_junit_report(path: Path, results: list[TestResult]) -> None:
+    suites = ET.Element("testsuites", name="terraform-compat")
+    for version in sorted({r.version for r in results}, key=version_key):
+        version_results = sorted(
+            (r for r in results if r.version == version), key=lambda r: r.target
+        )
+        suite = ET.SubElement(
+            suites,
+            "testsuite",
+            name=f"terraform-{version}",
+            tests=str(len(version_results)),
+            failures=str(sum(1 for r in version_results if not r.passed)),
+            time=f"{sum(r.duration for r in version_results):.3f}",
         )
+        for r in version_results:
+            case = ET.SubElement(
+                suite,
+                "testcase",
+                classname=f"terraform-{version}",
+                name=r.target,
+                time=f"{r.duration:.3f}",
+            )
+            if not r.passed:
+                failure = ET.SubElement(case, "failure", message="terraform validate failed")
+                failure.text = r.output
+            elif r.cached:
+                ET.SubElement(case, "system-out").text = "cached pass"
+    ET.indent(suites)
+    ET.ElementTree(suites).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def install_version(version: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["mise", "install", f"terraform@{version}"], capture_output=True, text=True
+    )
+
+
+def preinstall_versions(versions: list[str]) -> bool:
+    print(f"Pre-installing {len(versions)} Terraform versions concurrently...")
+    with ThreadPoolExecutor(max_workers=max(len(versions), 1)) as executor:
+        results = list(executor.map(install_version, versions))
+    all_installed = True
+    for version, result in zip(versions, results, strict=True):
         if result.returncode != 0:
-            print("FAIL")
+            print(f"  terraform@{version}: FAIL")
             print(f"    Error: {result.stderr.strip()}", file=sys.stderr)
-            return False
-        print("ok")
+            all_installed = False
+        else:
+            print(f"  terraform@{version}: ok")
     print()
-    return True
+    return all_installed
+
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Terraform CLI version compatibility testing")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached passes and run every (version, target) job",
+    )
+    parser.add_argument("--json", type=Path, help="Write per-job results and durations as JSON")
+    parser.add_argument("--junit", type=Path, help="Write a JUnit XML report")
+    return parser.parse_args(argv)
 
-def main() -> int:
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     if not VERSIONS_FILE.exists():
         print(f"Error: {VERSIONS_FILE} not found", file=sys.stderr)
         return 1
 
     versions = load_versions(VERSIONS_FILE)
-
+    targets = discover_targets()
+    jobs = schedule_jobs(versions, targets)
+    cache = {} if args.no_cache else load_cache(CACHE_FILE)
     if not preinstall_versions(versions):
         return 1
 
-    targets = discover_targets()
-
-    jobs: list[TestJob] = []
-    # Serialize Terraform versions per target because examples share on-disk working data.
-    target_locks = {target: threading.Lock() for target in targets}
-    # Always use temp dirs for root module to avoid .terraform directory conflicts
-    # when running multiple versions in parallel
-    for version in versions:
-        for target in targets:
-            is_root = target == REPO_ROOT
-            jobs.append(
-                TestJob(
-                    version=version,
-                    target=target,
-                    use_temp_dir=is_root,
-                    target_lock=target_locks[target],
-                )
-            )
-
     total_jobs = len(jobs)
     print(f"Testing {len(versions)} Terraform versions against {len(targets)} targets...")
     print(f"Versions: {', '.join(versions)}")
     print(f"Targets: root + {len(targets) - 1} examples")
-    print(f"Running {total_jobs} jobs with {MAX_WORKERS} workers...")
     print()
 
-    results: list[TestResult] = []
-    completed = 0
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(run_validate, job): job for job in jobs}
-        for future in as_completed(futures):
-            result = future.result()
-            results.append(result)
-            completed += 1
-            status = "ok" if result.passed else "FAIL"
-            print(f"  [{completed}/{total_jobs}] {result.version} / {result.target}: {status}")
-
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="tf-compat-warm-") as warm_root:
+        # Cache keys include the providers each version resolves to, so warm every version.
+        warm_dirs = prewarm_versions(versions, targets, Path(warm_root))
+        for job in jobs:
+            job.cache_key = job_cache_key(job, warm_dirs.get(job.version))
+        cached_jobs = [job for job in jobs if job.cache_key is not None and job.cache_key in cache]
+        pending = [job for job in jobs if job not in cached_jobs]
+        print(f"Cached passes: {len(cached_jobs)}/{total_jobs}")
+
+        results = [
+            TestResult(
+                version=job.version,
+                target=target_name(job.target),
+                passed=True,
+                output="",
+                cached=True,
+            )
+            for job in cached_jobs
+        ]
+        passed_jobs = list(cached_jobs)
+        completed = len(results)
+        print(f"Running {len(pending)} jobs with {MAX_WORKERS} workers...")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(run_validate, job, warm_dirs.get(job.version)): job
+                for job in pending
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if result.passed:
+                    passed_jobs.append(futures[future])
+                completed += 1
+                status = "ok" if result.passed else "FAIL"
+                print(
+                    f"  [{completed}/{total_jobs}] {result.version} / {result.target}: {status}"
+                    f" ({result.duration:.1f}s)"
+                )
+    wall_seconds = time.perf_counter() - start
+
+    save_cache(
+        CACHE_FILE,
+        {
+            job.cache_key: {"version": job.version, "target": target_name(job.target)}
+            for job in passed_jobs
+            if job.cache_key is not None
+        },
+    )
     print_summary(results)
+    print_timing_report(results, wall_seconds)
+    if args.json:
+        write_json_report(args.json, results, wall_seconds)
+        print(f"JSON report written to {args.json}")
+    if args.junit:
+        write_junit_report(args.junit, results)
+        print(f"JUnit report written to {args.junit}")
     return 0 if all(r.passed for r in results) else 1
 
 
@@ -0,0 +1,431 @@
+"""Incremental build graph for the generated documentation.
+
+Models every generated file as the output of a node with declared input files, instead of the
+chain of separate processes behind `just docs`:
+
+    readme            README.md: terraform-docs, tfdocs_links, grouped inputs, TOC/TABLES/
+                      GETTING_STARTED sections
+    example:<folder>  examples/<folder>/README.md and versions.tf
+
+A node's key hashes its input files, its parameters and the generator sources. A node is fresh
+when its key and the hashes of its outputs on disk match the state file (`.build_state.json`,
+git-ignored), otherwise it is rebuilt. A node whose inputs include another node's outputs
+depends on it and sees that node's freshly built content; independent nodes build in parallel.
+`--check` builds the same graph in memory, writes nothing and lists the outputs that differ
+from disk. Format `.tf` files first (`just fmt`), as `just docs` does.
+
+Usage:
+    just docs-build [--check] [--force] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from docs import (
+    config_loader,
+    doc_utils,
+    examples_readme,
+    generate_inputs_from_readme,
+    root_readme,
+    tfdocs_links,
+)
+from release import tf_registry_source
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+STATE_FILE = Path(__file__).parent / ".build_state.json"
+STATE_SCHEMA = 1
+README = Path("README.md")
+EXAMPLES_DIR = Path("examples")
+EXAMPLES_CONFIG = Path("docs/examples.yaml")
+INPUTS_GROUPS_CONFIG = Path("docs/inputs_groups.yaml")
+TERRAFORM_DOCS_CONFIG = Path(".terraform-docs.yml")
+GENERATOR_MODULES = (
+    config_loader,
+    doc_utils,
+    examples_readme,
+    generate_inputs_from_readme,
+    root_readme,
+    tfdocs_links,
+)
+
+
+class BuildError(Exception):
+    """A node could not be built; the message explains why."""
+
+
+class Workspace:
+    """Repository files as seen by the build: outputs built in this run shadow the disk."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.overlay: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def read(self, path: Path) -> str | None:
+        with self._lock:
+            if path in self.overlay:
+                return self.overlay[path]
+        full_path = self.root / path
+        return full_path.read_text(encoding="utf-8") if full_path.is_file() else None
+
+    def publish(self, outputs: dict[Path, str]) -> None:
+        with self._lock:
+            self.overlay.update(outputs)
+
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    inputs: tuple[Path, ...]
+    outputs: tuple[Path, ...]
+    build: Callable[[Workspace], dict[Path, str]]
+    params: tuple[str, ...] = ()
+
+
+@dataclass
+class BuildReport:
+    built: list[str] = field(default_factory=list)
+    fresh: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    stale_files: list[Path] = field(default_factory=list)
+
+
+def content_hash(content: str | None) -> str:
+    if content is None:
+        return "missing"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def sources_digest(modules: Iterable[object] = GENERATOR_MODULES) -> str:
+    """Changing any generator invalidates every node."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())  # type: ignore[attr-defined]
+    return digest.hexdigest()
+
+
+def node_key(node: Node, workspace: Workspace, sources: str) -> str:
+    # A node's own outputs (README.md is both read and written) are covered by the output
+    # hashes recorded in the state file instead.
+    digest = hashlib.sha256(sources.encode())
+    for param in node.params:
+        digest.update(f"param:{param}\0".encode())
+    for path in node.inputs:
+        if path not in node.outputs:
+            digest.update(f"{path}\0{content_hash(workspace.read(path))}\0".encode())
+    return digest.hexdigest()
+
+
+def dependencies(nodes: list[Node]) -> dict[str, set[str]]:
+    producers: dict[Path, str] = {}
+    for node in nodes:
+        for output in node.outputs:
+            if output in producers:
+                raise ValueError(
+                    f"{output} is produced by both {producers[output]} and {node.name}"
+                )
+            producers[output] = node.name
+    return {
+        node.name: {
+            producers[path]
+            for path in node.inputs
+            if path in producers and producers[path] != node.name
+        }
+        for node in nodes
+    }
+
+
+def load_state(state_file: Path) -> dict[str, dict]:
+    if not state_file.exists():
+        return {}
+    try:
+        raw = json.loads(state_file.read_text())
+    except ValueError:
+        return {}
+    return raw.get("nodes", {}) if raw.get("schema") == STATE_SCHEMA else {}
+
+
+def save_state(state_file: Path, nodes: dict[str, dict]) -> None:
+    payload = {"schema": STATE_SCHEMA, "nodes": nodes}
+    state_file.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def _run_node(
+    node: Node, workspace: Workspace, recorded: dict | None, sources: str, force: bool
+) -> tuple[str, dict[Path, str] | None]:
+    """(key, outputs), outputs None when the node is fresh."""
+    key = node_key(node, workspace, sources)
+    if not force and recorded is not None and recorded.get("key") == key:
+        on_disk = {str(path): content_hash(workspace.read(path)) for path in node.outputs}
+        if recorded.get("outputs") == on_disk:
+            return key, None
+    outputs = node.build(workspace)
+    if undeclared := set(outputs) - set(node.outputs):
+        raise BuildError(f"undeclared outputs: {sorted(map(str, undeclared))}")
+    return key, outputs
+
+
+def run_graph(
+    nodes: list[Node],
+    workspace: Workspace,
+    state: dict[str, dict],
+    *,
+    check: bool = False,
+    force: bool = False,
+    max_workers: int | None = None,
+) -> BuildReport:
+    """Build stale nodes, dependencies first; `state` is updated in place unless `check`."""
+    deps = dependencies(nodes)
+    by_name = {node.name: node for node in nodes}
+    sources = sources_digest()
+    report = BuildReport()
+    done: set[str] = set()
+    unusable: set[str] = set()
+    pending = [node.name for node in nodes]
+    running: dict[Future, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for name in list(pending):
+                if deps[name] & unusable:
+                    pending.remove(name)
+                    unusable.add(name)
+                    report.skipped.append(name)
+                elif deps[name] <= done:
+                    pending.remove(name)
+                    future = executor.submit(
+                        _run_node, by_name[name], workspace, state.get(name), sources, force
+                    )
+                    running[future] = name
+            if not running:
+                if pending:
+                    raise ValueError(f"dependency cycle between {sorted(pending)}")
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    key, outputs = future.result()
+                except (
+                    BuildError,
+                    OSError,
+                    ValueError,
+                    subprocess.CalledProcessError,
+                    SystemExit,
+                ) as exc:
+                    report.failed[name] = str(exc) or type(exc).__name__
+                    unusable.add(name)
+                    continue
+                done.add(name)
+                if outputs is None:
+                    report.fresh.append(name)
+                    continue
+                report.built.append(name)
+                for path, content in outputs.items():
+                    if workspace.read(path) != content:
+                        report.stale_files.append(path)
+                        if not check:
+                            doc_utils.write_if_changed(workspace.root / path, content)
+                workspace.publish(outputs)
+                if not check:
+                    state[name] = {
+                        "key": key,
+                        "outputs": {
+                            str(path): content_hash(outputs.get(path))
+                            for path in by_name[name].outputs
+                        },
+                    }
+    return report
+
+
+def run_terraform_docs(root: Path, readme: str) -> str:
+    """Inject terraform-docs output into `readme` without touching the working tree."""
+    if shutil.which("terraform-docs") is None:
+        raise BuildError("terraform-docs not found on PATH")
+    with tempfile.TemporaryDirectory(prefix="docs-build-") as tmp:
+        module_dir = Path(tmp)
+        for tf_file in sorted(root.glob("*.tf")):
+            (module_dir / tf_file.name).symlink_to(tf_file)
+        (module_dir / README).write_text(readme, encoding="utf-8")
+        subprocess.run(
+            ["terraform-docs", "-c", str(root / TERRAFORM_DOCS_CONFIG), str(module_dir)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return (module_dir / README).read_text(encoding="utf-8")
+
+
+@functools.cache
+def terraform_docs_version() -> str:
+    if shutil.which("terraform-docs") is None:
+        return "missing"
+    result = subprocess.run(["terraform-docs", "--version"], capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def build_readme(workspace: Workspace, config: dict) -> dict[Path, str]:
+    readme = workspace.read(README)
+    if readme is None:
+        raise BuildError(f"{README} not found")
+    readme = run_terraform_docs(workspace.root, readme)
+    readme = tfdocs_links.fix_readme_links(readme)
+    readme = generate_inputs_from_readme.group_inputs(readme, workspace.root / INPUTS_GROUPS_CONFIG)
+    readme, _ = root_readme.update_readme_sections(readme, workspace.root, config)
+    return {README: readme}
+
+
+def readme_node(root: Path, config: dict, example_dirs: list[Path]) -> Node:
+    examples_cfg = config_loader.parse_examples_readme_config(config)
+    inputs = [
+        README,
+        TERRAFORM_DOCS_CONFIG,
+        INPUTS_GROUPS_CONFIG,
+        EXAMPLES_CONFIG,
+        Path(examples_cfg.readme_template or "docs/example_readme.md"),
+        *(tf_file.relative_to(root) for tf_file in sorted(root.glob("*.tf"))),
+    ]
+    # TABLES resolve example folders by name and may read a file per folder for auto columns.
+    for table in config_loader.parse_tables_config(config):
+        for auto_column in table.auto_columns.values():
+            inputs += [EXAMPLES_DIR / d.name / auto_column.file for d in example_dirs]
+    return Node(
+        name="readme",
+        inputs=tuple(dict.fromkeys(inputs)),
+        outputs=(README,),
+        build=functools.partial(build_readme, config=config),
+        params=(terraform_docs_version(), *(d.name for d in example_dirs)),
+    )
+
+
+def build_example(workspace: Workspace, render: Callable[[], dict[Path, str]]) -> dict[Path, str]:
+    return {path.relative_to(workspace.root): content for path, content in render().items()}
+
+
+def example_nodes(
+    root: Path, config: dict, example_dirs: list[Path], registry_source: str
+) -> list[Node]:
+    examples_cfg = config_loader.parse_examples_readme_config(config)
+    template_path = Path(examples_cfg.readme_template)
+    template = (root / template_path).read_text(encoding="utf-8")
+    base_versions_tf = examples_readme.load_root_versions_tf(root)
+    nodes = []
+    for example_dir in example_dirs:
+        if examples_readme.should_skip_example(example_dir.name, examples_cfg.skip_examples):
+            continue
+        rel_dir = example_dir.relative_to(root)
+        outputs = [rel_dir / "README.md"]
+        example_name = examples_readme.get_example_name(example_dir.name, config)
+        if examples_readme.should_generate_versions_tf(
+            example_name, example_dir, examples_cfg.versions_tf
+        ):
+            outputs.append(rel_dir / "versions.tf")
+        render = functools.partial(
+            examples_readme.render_example,
+            example_dir,
+            template,
+            base_versions_tf,
+            config,
+            registry_source,
+            examples_cfg,
+        )
+        nodes.append(
+            Node(
+                name=f"example:{example_dir.name}",
+                inputs=(
+                    template_path,
+                    EXAMPLES_CONFIG,
+                    Path("versions.tf"),
+                    *(tf_file.relative_to(root) for tf_file in sorted(example_dir.glob("*.tf"))),
+                ),
+                outputs=tuple(outputs),
+                build=functools.partial(build_example, render=render),
+                params=(registry_source,),
+            )
+        )
+    return nodes
+
+
+def docs_graph(root: Path, registry_source: str) -> list[Node]:
+    config = config_loader.load_examples_config(repo_root=root)
+    example_dirs = examples_readme.find_example_folders(root / EXAMPLES_DIR)
+    return [
+        readme_node(root, config, example_dirs),
+        *example_nodes(root, config, example_dirs, registry_source),
+    ]
+
+
+def print_report(report: BuildReport, check: bool) -> None:
+    for name in report.built:
+        print(f"{'checked' if check else 'built':>7}  {name}")
+    for name in report.fresh:
+        print(f"{'fresh':>7}  {name}")
+    for name in report.skipped:
+        print(f"{'skipped':>7}  {name} (a dependency failed)")
+    for name, error in report.failed.items():
+        print(f"{'FAILED':>7}  {name}: {error}")
+    print()
+    action = "out of date" if check else "updated"
+    print(
+        f"{len(report.built)} built, {len(report.fresh)} fresh, "
+        f"{len(report.stale_files)} file(s) {action}"
+    )
+    for path in report.stale_files:
+        print(f"  - {path}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="Report out-of-date files, write nothing"
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild every node")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Parallel node builds")
+    parser.add_argument(
+        "--registry-source", help="Module registry source (default: from the git remote)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        registry_source = args.registry_source or tf_registry_source.get_registry_source()
+    except (subprocess.CalledProcessError, ValueError) as e:
+        print(f"Error: Failed to get registry source: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    state = load_state(STATE_FILE)
+    report = run_graph(
+        docs_graph(REPO_ROOT, registry_source),
+        Workspace(REPO_ROOT),
+        state,
+        check=args.check,
+        force=args.force,
+        max_workers=args.jobs,
+    )
+    if not args.check:
+        save_state(STATE_FILE, state)
+    print_report(report, args.check)
+
+    if report.failed or report.skipped:
+        sys.exit(1)
+    if args.check and report.stale_files:
+        print()
+        print("Run 'just docs-build' to update documentation")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from docs import build as mod
+from docs import config_loader
+
+REGISTRY_SOURCE = "terraform-mongodbatlas-modules/cluster/mongodbatlas"
+
+
+def upper_node(name: str, source: str, target: str, builds: list[str]) -> mod.Node:
+    """Node writing `target` as the upper-cased content of `source`."""
+
+    def build(workspace: mod.Workspace) -> dict[Path, str]:
+        builds.append(name)
+        return {Path(target): (workspace.read(Path(source)) or "").upper()}
+
+    return mod.Node(name=name, inputs=(Path(source),), outputs=(Path(target),), build=build)
+
+
+def run(nodes: list[mod.Node], root: Path, state: dict, **kwargs) -> mod.BuildReport:
+    return mod.run_graph(nodes, mod.Workspace(root), state, **kwargs)
+
+
+def test_rebuilds_only_stale_nodes(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    builds: list[str] = []
+    nodes = [
+        upper_node("a", "a.txt", "A.txt", builds),
+        upper_node("b", "b.txt", "B.txt", builds),
+    ]
+    state: dict = {}
+
+    report = run(nodes, tmp_path, state)
+    assert sorted(report.built) == ["a", "b"]
+    assert (tmp_path / "A.txt").read_text() == "A"
+
+    report = run(nodes, tmp_path, state)
+    assert sorted(report.fresh) == ["a", "b"]
+
+    (tmp_path / "b.txt").write_text("b2")
+    (tmp_path / "A.txt").write_text("edited by hand")
+    builds.clear()
+    report = run(nodes, tmp_path, state)
+    assert sorted(builds) == ["a", "b"]
+    assert sorted(map(str, report.stale_files)) == ["A.txt", "B.txt"]
+    assert (tmp_path / "A.txt").read_text() == "A"
+    assert (tmp_path / "B.txt").read_text() == "B2"
+
+
+def test_check_writes_nothing_and_reports_stale(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "A.txt").write_text("stale")
+    state: dict = {}
+
+    report = run([upper_node("a", "a.txt", "A.txt", [])], tmp_path, state, check=True)
+
+    assert report.stale_files == [Path("A.txt")]
+    assert (tmp_path / "A.txt").read_text() == "stale"
+    assert state == {}
+
+
+def test_dependents_read_outputs_built_in_the_same_run(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("x")
+    builds: list[str] = []
+    nodes = [
+        mod.Node(
+            name="second",
+            inputs=(Path("A.txt"),),
+            outputs=(Path("B.txt"),),
+            build=lambda ws: {Path("B.txt"): f"<{ws.read(Path('A.txt'))}>"},
+        ),
+        upper_node("first", "a.txt", "A.txt", builds),
+    ]
+    assert mod.dependencies(nodes) == {"second": {"first"}, "first": set()}
+
+    report = run(nodes, tmp_path, {}, check=True)
+
+    assert report.built == ["first", "second"]
+    assert sorted(map(str, report.stale_files)) == ["A.txt", "B.txt"]
+    assert not (tmp_path / "B.txt").exists()
+
+
+def test_failed_node_skips_dependents(tmp_path: Path) -> None:
+    def fail(_workspace: mod.Workspace) -> dict[Path, str]:
+        raise mod.BuildError("boom")
+
+    nodes = [
+        mod.Node(name="first", inputs=(), outputs=(Path("A.txt"),), build=fail),
+        upper_node("second", "A.txt", "B.txt", []),
+    ]
+
+    report = run(nodes, tmp_path, {})
+
+    assert report.failed == {"first": "boom"}
+    assert report.skipped == ["second"]
+
+
+def test_duplicate_outputs_rejected() -> None:
+    nodes = [upper_node("a", "a", "out", []), upper_node("b", "b", "out", [])]
+    with pytest.raises(ValueError, match="produced by both"):
+        mod.dependencies(nodes)
+
+
+def test_parse_examples_readme_config_is_repeatable() -> None:
+    config = {
+        "examples_readme": {
+            "readme_template": "t.md",
+            "template_vars": {"skip_rules": [{"context_pattern": "dev"}], "x": "y"},
+        }
+    }
+    first = config_loader.parse_examples_readme_config(config)
+    second = config_loader.parse_examples_readme_config(config)
+    assert first.template_vars.skip_rules == second.template_vars.skip_rules != []
+
+
+def test_example_nodes_match_committed_docs() -> None:
+    config = config_loader.load_examples_config(repo_root=mod.REPO_ROOT)
+    example_dirs = mod.examples_readme.find_example_folders(mod.REPO_ROOT / mod.EXAMPLES_DIR)
+    nodes = mod.example_nodes(mod.REPO_ROOT, config, example_dirs, REGISTRY_SOURCE)
+
+    report = run(nodes, mod.REPO_ROOT, {}, check=True)
+
+    assert report.failed == {}
+    assert len(report.built) == len(nodes)
+    assert report.stale_files == []
@@ -94,7 +94,8 @@ def parse_examples_readme_config(config_dict: dict) -> ExamplesReadmeConfig:
     examples_readme_dict = config_dict.get("examples_readme", {})
     code_snippet_files_dict = examples_readme_dict.get("code_snippet_files", {})
     code_snippet_files = CodeSnippetFilesConfig(**code_snippet_files_dict)
-    template_vars_dict = examples_readme_dict.get("template_vars", {})
+    # Copied so parsing the same config dict twice still sees `skip_rules`.
+    template_vars_dict = dict(examples_readme_dict.get("template_vars", {}))
     skip_rules_list = template_vars_dict.pop("skip_rules", [])
     skip_rules = [SkipRule(**rule) for rule in skip_rules_list]
     template_vars = TemplateVarsConfig(skip_rules=skip_rules, vars=template_vars_dict)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from dataclasses import dataclass
+from pathlib import Path
 
 from docs.config_loader import SkipRule
 
@@ -23,13 +26,79 @@ def should_skip_template_var(
     Returns:
         True if the variable should be skipped (replaced with empty/removed).
     """
-    if not skip_rules:
-        return False
+    return var_key in skipped_template_vars(context_name, skip_rules)
+
+
+def skipped_template_vars(context_name: str, skip_rules: list[SkipRule] | None) -> set[str]:
+    """All template variable keys skipped for `context_name`, resolved in one pass."""
     context_name_lower = context_name.lower()
-    for rule in skip_rules:
-        if rule.context_pattern.lower() in context_name_lower and var_key in rule.skip_vars:
-            return True
-    return False
+    return {
+        var_key
+        for rule in skip_rules or []
+        if rule.context_pattern.lower() in context_name_lower
+        for var_key in rule.skip_vars
+    }
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template split once into lines of literal and placeholder segments.
+
+    Each line is `(literals, names)` with `len(literals) == len(names) + 1`; placeholders are
+    stored by their uppercase name.
+    """
+
+    lines: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]
+
+    def render(
+        self,
+        template_vars: dict[str, str],
+        context_name: str = ROOT_CONTEXT_NAME,
+        skip_rules: list[SkipRule] | None = None,
+        fields: dict[str, str] | None = None,
+    ) -> str:
+        """Substitute placeholders in one pass.
+
+        `fields` (uppercase name -> value) are inserted verbatim. Other placeholders resolve
+        against `template_vars` by lowercase key; a line is dropped when any of them is empty,
+        missing or skipped for `context_name`.
+        """
+        fields = fields or {}
+        skipped = skipped_template_vars(context_name, skip_rules)
+        output = []
+        for literals, names in self.lines:
+            if not names:
+                output.append(literals[0])
+                continue
+            parts = [literals[0]]
+            for name, literal in zip(names, literals[1:], strict=True):
+                if name in fields:
+                    value = fields[name]
+                else:
+                    key = name.lower()
+                    value = "" if key in skipped else template_vars.get(key, "").rstrip("\n")
+                    if not value:
+                        break
+                parts += (value, literal)
+            else:
+                output.append("".join(parts))
+        return "\n".join(output)
+
+
+@functools.cache
+def compile_template(content: str) -> CompiledTemplate:
+    lines = []
+    for line in content.split("\n"):
+        literals = []
+        names = []
+        position = 0
+        for match in TEMPLATE_VAR_PATTERN.finditer(line):
+            literals.append(line[position : match.start()])
+            names.append(match.group("var_name"))
+            position = match.end()
+        literals.append(line[position:])
+        lines.append((tuple(literals), tuple(names)))
+    return CompiledTemplate(tuple(lines))
 
 
 def apply_template_vars(
@@ -53,43 +122,7 @@ def apply_template_vars(
     Returns:
         Content with placeholders replaced (or lines removed for empty values).
     """
-    lines = content.split("\n")
-    result_lines = []
-
-    for line in lines:
-        matches = list(TEMPLATE_VAR_PATTERN.finditer(line))
-        if not matches:
-            result_lines.append(line)
-            continue
-
-        # Check all matches - if any would be empty, skip the entire line
-        skip_line = False
-        replacements: list[tuple[str, str]] = []
-
-        for match in matches:
-            var_name_upper = match.group("var_name")
-            var_key = var_name_upper.lower()
-            value = template_vars.get(var_key, "")
-
-            if should_skip_template_var(context_name, var_key, skip_rules):
-                value = ""
-
-            if not value:
-                skip_line = True
-                break
-
-            placeholder = f"{{{{ .{var_name_upper} }}}}"
-            replacements.append((placeholder, value.rstrip("\n")))
-
-        if skip_line:
-            continue
-
-        result_line = line
-        for placeholder, value in replacements:
-            result_line = result_line.replace(placeholder, value)
-        result_lines.append(result_line)
-
-    return "\n".join(result_lines)
+    return compile_template(content).render(template_vars, context_name, skip_rules)
 
 
 def _build_warning_text(description: str, regenerate_command: str) -> str:
@@ -108,3 +141,13 @@ def generate_header_comment(description: str, regenerate_command: str) -> str:
 def generate_header_comment_for_section(description: str, regenerate_command: str) -> str:
     warning_text = _build_warning_text(description, regenerate_command)
     return f"@generated\n{warning_text}"
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write `content` via a temp file and rename, skipping files that already match."""
+    if path.is_file() and path.read_text(encoding="utf-8") == content:
+        return False
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(content, encoding="utf-8")
+    tmp.replace(path)
+    return True
@@ -147,3 +147,32 @@ def test_should_skip_template_var_case_insensitive_context() -> None:
         )
     ]
     assert doc_utils.should_skip_template_var("development", "production_var", skip_rules_upper)
+
+
+def test_compiled_template_reused_and_rendered_per_context() -> None:
+    content = "# {{ .NAME }}\n{{ .PRODUCTION_CONSIDERATIONS }}\n{{.DESCRIPTION}}\nend"
+    compiled = doc_utils.compile_template(content)
+    assert doc_utils.compile_template(content) is compiled
+    skip_rules = [SkipRule(context_pattern="dev", skip_vars=["production_considerations"])]
+    template_vars = {"production_considerations": "Prod notes\n"}
+
+    prod = compiled.render(
+        template_vars, "Production", skip_rules, fields={"NAME": "Prod", "DESCRIPTION": ""}
+    )
+    dev = compiled.render(
+        template_vars, "Dev Cluster", skip_rules, fields={"NAME": "Dev", "DESCRIPTION": "d"}
+    )
+
+    # Fields are inserted verbatim, even when empty; template vars drop their line.
+    assert prod == "# Prod\nProd notes\n\nend"
+    assert dev == "# Dev\nd\nend"
+
+
+def test_skipped_template_vars_merges_matching_rules() -> None:
+    skip_rules = [
+        SkipRule(context_pattern="dev", skip_vars=["a"]),
+        SkipRule(context_pattern="cluster", skip_vars=["b"]),
+        SkipRule(context_pattern="prod", skip_vars=["c"]),
+    ]
+    assert doc_utils.skipped_template_vars("Dev Cluster", skip_rules) == {"a", "b"}
+    assert doc_utils.skipped_template_vars("root", None) == set()
@@ -1,12 +1,18 @@
 """Generate README.md and versions.tf files for examples using terraform-docs config."""
 
 import argparse
+import functools
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from docs import config_loader, doc_utils
+from release import tf_registry_source
+
+LOCAL_ROOT_SOURCE_PATTERN = re.compile(r'source\s*=\s*"\.\.\/\.\.\/?"')
 
 
 def load_template(template_path: Path) -> str:
@@ -58,13 +64,7 @@ def get_example_description(folder_name: str, config: dict) -> str:
 
 
 def get_registry_source() -> str:
-    result = subprocess.run(
-        ["just", "tf-registry-source"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip()
+    return tf_registry_source.get_registry_source()
 
 
 def get_example_terraform_files(
@@ -86,19 +86,21 @@ def get_example_terraform_files(
     return main_content, additional_contents, other_files
 
 
+@functools.cache
+def registry_source_pattern(registry_source: str) -> re.Pattern[str]:
+    """Compiled once per registry source rather than once per file."""
+    return re.compile(rf'(source\s*=\s*"{re.escape(registry_source)}")')
+
+
 def transform_main_tf_for_registry(
     main_tf_content: str, registry_source: str, version: str | None = None
 ) -> str:
-    transformed = re.sub(
-        r'source\s*=\s*"\.\.\/\.\.\/?"',
-        f'source  = "{registry_source}"',
-        main_tf_content,
-    )
+    source_line = f'source  = "{registry_source}"'
+    transformed = LOCAL_ROOT_SOURCE_PATTERN.sub(lambda _: source_line, main_tf_content)
     if version:
-        transformed = re.sub(
-            rf'(source\s*=\s*"{re.escape(registry_source)}")',
-            rf'\1\n  version = "{version}"',
-            transformed,
+        version_line = f'\n  version = "{version}"'
+        transformed = registry_source_pattern(registry_source).sub(
+            lambda match: match.group(1) + version_line, transformed
         )
     return transformed
 
@@ -153,15 +155,13 @@ def generate_readme(
         )
         + "\n"
     )
-    content = template.replace("{{ .NAME }}", example_name)
-    content = content.replace("{{ .DESCRIPTION }}", description)
     code_snippet = generate_code_snippet(example_dir, registry_source, version, additional_files)
-    content = content.replace("{{ .CODE_SNIPPET }}", code_snippet)
-    content = doc_utils.apply_template_vars(
-        content,
+    # Compiled once per template and reused for every example.
+    content = doc_utils.compile_template(template).render(
         template_vars,
         context_name=example_name,
         skip_rules=skip_rules,
+        fields={"NAME": example_name, "DESCRIPTION": description, "CODE_SNIPPET": code_snippet},
     )
     lines = content.split("\n")
     if lines and lines[0].strip().startswith("<!--") and "used to generate" in lines[0]:
@@ -237,7 +237,7 @@ def should_generate_versions_tf(
     return not versions_tf_config.generate_when_missing_only
 
 
-def process_example(
+def render_example(
     example_dir: Path,
     template: str,
     base_versions_tf: str,
@@ -245,18 +245,14 @@ def process_example(
     registry_source: str,
     examples_readme_config: config_loader.ExamplesReadmeConfig,
     version: str | None = None,
-    dry_run: bool = False,
     skip_readme: bool = False,
     skip_versions: bool = False,
-    check: bool = False,
-) -> tuple[bool, bool, bool]:
+) -> dict[Path, str]:
+    """Generated file path -> content for one example, without touching the filesystem."""
     example_name = get_example_name(example_dir.name, config)
-    readme_generated = False
-    versions_generated = False
-    has_changes = False
+    outputs: dict[Path, str] = {}
     if not skip_readme:
-        readme_path = example_dir / "README.md"
-        readme_content = generate_readme(
+        outputs[example_dir / "README.md"] = generate_readme(
             template,
             example_name,
             example_dir,
@@ -267,35 +263,129 @@ def process_example(
             examples_readme_config.template_vars.skip_rules,
             description=get_example_description(example_dir.name, config),
         )
-        if check and readme_path.exists():
-            existing_content = readme_path.read_text(encoding="utf-8")
-            if existing_content != readme_content:
-                has_changes = True
-        elif check:
-            has_changes = True
-        if not dry_run and not check:
-            readme_path.write_text(readme_content, encoding="utf-8")
-        readme_generated = True
-    if not skip_versions:
-        if should_generate_versions_tf(
-            example_name, example_dir, examples_readme_config.versions_tf
-        ):
-            versions_path = example_dir / "versions.tf"
-            versions_content = generate_versions_tf(
-                base_versions_tf, examples_readme_config.versions_tf.add
-            )
-            if check and versions_path.exists():
-                existing_content = versions_path.read_text(encoding="utf-8")
-                if existing_content != versions_content:
-                    has_changes = True
-            elif check:
+    if not skip_versions and should_generate_versions_tf(
+        example_name, example_dir, examples_readme_config.versions_tf
+    ):
+        outputs[example_dir / "versions.tf"] = generate_versions_tf(
+            base_versions_tf, examples_readme_config.versions_tf.add
+        )
+    return outputs
+
+
+def process_example(
+    example_dir: Path,
+    template: str,
+    base_versions_tf: str,
+    config: dict,
+    registry_source: str,
+    examples_readme_config: config_loader.ExamplesReadmeConfig,
+    version: str | None = None,
+    dry_run: bool = False,
+    skip_readme: bool = False,
+    skip_versions: bool = False,
+    check: bool = False,
+) -> tuple[bool, bool, bool]:
+    outputs = render_example(
+        example_dir,
+        template,
+        base_versions_tf,
+        config,
+        registry_source,
+        examples_readme_config,
+        version,
+        skip_readme,
+        skip_versions,
+    )
+    has_changes = False
+    for path, content in outputs.items():
+        if check:
+            if not path.exists() or path.read_text(encoding="utf-8") != content:
                 has_changes = True
-            if not dry_run and not check:
-                versions_path.write_text(versions_content, encoding="utf-8")
-            versions_generated = True
+        elif not dry_run:
+            path.write_text(content, encoding="utf-8")
+    readme_generated = example_dir / "README.md" in outputs
+    versions_generated = example_dir / "versions.tf" in outputs
     return readme_generated, versions_generated, has_changes
 
 
+@dataclass
+class ExampleResult:
+    name: str
+    skipped: bool = False
+    readme_generated: bool = False
+    versions_generated: bool = False
+    has_changes: bool = False
+
+    @property
+    def files(self) -> list[str]:
+        files = []
+        if self.readme_generated:
+            files.append("README.md")
+        if self.versions_generated:
+            files.append("versions.tf")
+        return files
+
+
+@dataclass
+class ExamplesReport:
+    results: list[ExampleResult] = field(default_factory=list)
+
+    @property
+    def readme_count(self) -> int:
+        return sum(r.readme_generated for r in self.results)
+
+    @property
+    def versions_count(self) -> int:
+        return sum(r.versions_generated for r in self.results)
+
+    @property
+    def skipped_count(self) -> int:
+        return sum(r.skipped for r in self.results)
+
+    @property
+    def changed(self) -> list[str]:
+        return [r.name for r in self.results if r.has_changes]
+
+
+def process_examples(
+    example_folders: list[Path],
+    template: str,
+    base_versions_tf: str,
+    config: dict,
+    registry_source: str,
+    examples_readme_config: config_loader.ExamplesReadmeConfig,
+    skip_list: list[str] | None = None,
+    version: str | None = None,
+    dry_run: bool = False,
+    skip_readme: bool = False,
+    skip_versions: bool = False,
+    check: bool = False,
+    max_workers: int | None = None,
+) -> ExamplesReport:
+    """Process examples in a thread pool; results keep the order of `example_folders`."""
+
+    def process(example_dir: Path) -> ExampleResult:
+        if should_skip_example(example_dir.name, skip_list):
+            return ExampleResult(example_dir.name, skipped=True)
+        readme_gen, versions_gen, has_changes = process_example(
+            example_dir,
+            template,
+            base_versions_tf,
+            config,
+            registry_source,
+            examples_readme_config,
+            version=version,
+            dry_run=dry_run,
+            skip_readme=skip_readme,
+            skip_versions=skip_versions,
+            check=check,
+        )
+        return ExampleResult(example_dir.name, False, readme_gen, versions_gen, has_changes)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return ExamplesReport(list(executor.map(process, example_folders)))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate README.md and versions.tf files for examples"
@@ -308,6 +398,7 @@ def main() -> None:
     parser.add_argument(
         "--version", type=str, default=None, help="Module version for code snippets"
     )
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Examples processed at once")
     args = parser.parse_args()
 
     root_dir = Path.cwd()
@@ -330,7 +421,7 @@ def main() -> None:
 
     try:
         registry_source = get_registry_source()
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, ValueError) as e:
         print(f"Error: Failed to get registry source: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -351,52 +442,37 @@ def main() -> None:
     print(f"Found {len(example_folders)} example folders")
     print()
 
-    total_readme = 0
-    total_versions = 0
-    total_skipped = 0
-    examples_with_changes = []
-
-    for example_dir in example_folders:
-        if should_skip_example(example_dir.name, skip_list):
-            total_skipped += 1
-            print(f"- {example_dir.name} (skipped)")
+    report = process_examples(
+        example_folders,
+        template,
+        base_versions_tf,
+        config,
+        registry_source,
+        examples_readme_config,
+        skip_list=skip_list,
+        version=args.version,
+        dry_run=args.dry_run,
+        skip_readme=args.skip_readme,
+        skip_versions=args.skip_versions,
+        check=args.check,
+        max_workers=args.jobs,
+    )
+    for result in report.results:
+        if result.skipped:
+            print(f"- {result.name} (skipped)")
             continue
-        readme_gen, versions_gen, has_changes = process_example(
-            example_dir,
-            template,
-            base_versions_tf,
-            config,
-            registry_source,
-            examples_readme_config,
-            version=args.version,
-            dry_run=args.dry_run,
-            skip_readme=args.skip_readme,
-            skip_versions=args.skip_versions,
-            check=args.check,
-        )
-        if readme_gen:
-            total_readme += 1
-        if versions_gen:
-            total_versions += 1
-        if has_changes:
-            examples_with_changes.append(example_dir.name)
-        files = []
-        if readme_gen:
-            files.append("README.md")
-        if versions_gen:
-            files.append("versions.tf")
         if args.check:
-            prefix = "x" if has_changes else "ok"
+            prefix = "x" if result.has_changes else "ok"
         else:
             prefix = "->" if args.dry_run else "ok"
-        files_str = ", ".join(files) if files else "no files"
-        print(f"{prefix} {example_dir.name} ({files_str})")
+        files_str = ", ".join(result.files) if result.files else "no files"
+        print(f"{prefix} {result.name} ({files_str})")
 
     print()
     if args.check:
-        if examples_with_changes:
-            print(f"ERROR: {len(examples_with_changes)} example(s) have outdated documentation:")
-            for example_name in examples_with_changes:
+        if report.changed:
+            print(f"ERROR: {len(report.changed)} example(s) have outdated documentation:")
+            for example_name in report.changed:
                 print(f"  - {example_name}")
             print()
             print("Run 'just gen-examples' to update documentation")
@@ -405,8 +481,11 @@ def main() -> None:
             print("All example documentation is up to date")
     else:
         action = "would be generated" if args.dry_run else "generated"
-        print(f"Summary: {total_readme} READMEs {action}, {total_versions} versions.tf {action}")
-        print(f"  {total_skipped} skipped")
+        print(
+            f"Summary: {report.readme_count} READMEs {action}, "
+            f"{report.versions_count} versions.tf {action}"
+        )
+        print(f"  {report.skipped_count} skipped")
 
 
 if __name__ == "__main__":
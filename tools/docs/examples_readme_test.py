@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+from docs import config_loader
 from docs import examples_readme as mod
 
 
@@ -72,3 +75,46 @@ def test_get_example_description_first_match_wins() -> None:
         ],
     }
     assert mod.get_example_description("01_basic", config) == "First"
+
+
+def test_transform_main_tf_for_registry_adds_version() -> None:
+    main_tf = 'module "cluster" {\n  source = "../.."\n  name   = "x"\n}\n'
+    result = mod.transform_main_tf_for_registry(main_tf, "org/cluster/mongodbatlas", "1.2.3")
+    assert result == (
+        'module "cluster" {\n'
+        '  source  = "org/cluster/mongodbatlas"\n'
+        '  version = "1.2.3"\n'
+        '  name   = "x"\n'
+        "}\n"
+    )
+    assert mod.registry_source_pattern("org/cluster/mongodbatlas") is mod.registry_source_pattern(
+        "org/cluster/mongodbatlas"
+    )
+
+
+def test_process_examples_report_is_ordered_and_parallel_safe(tmp_path: Path) -> None:
+    examples_dir = tmp_path / "examples"
+    for name in ("01_basic", "02_dev", "03_skipped"):
+        (examples_dir / name).mkdir(parents=True)
+        (examples_dir / name / "main.tf").write_text('module "m" {\n  source = "../.."\n}\n')
+        (examples_dir / name / "versions.tf").write_text("")
+    folders = mod.find_example_folders(examples_dir)
+    examples_config = config_loader.ExamplesReadmeConfig(readme_template="t.md")
+    kwargs = {
+        "template": "# {{ .NAME }}\n{{ .CODE_SNIPPET }}",
+        "base_versions_tf": "terraform {}\n",
+        "config": {},
+        "registry_source": "org/cluster/mongodbatlas",
+        "examples_readme_config": examples_config,
+        "skip_list": ["03_skipped"],
+    }
+
+    check = mod.process_examples(folders, check=True, max_workers=4, **kwargs)
+    assert [r.name for r in check.results] == ["01_basic", "02_dev", "03_skipped"]
+    assert check.changed == ["01_basic", "02_dev"]
+    assert check.skipped_count == 1
+    assert not (examples_dir / "01_basic" / "README.md").exists()
+
+    written = mod.process_examples(folders, max_workers=4, **kwargs)
+    assert (written.readme_count, written.versions_count) == (2, 2)
+    assert mod.process_examples(folders, check=True, max_workers=1, **kwargs).changed == []
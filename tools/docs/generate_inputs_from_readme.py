@@ -1,10 +1,12 @@
 """Generate grouped inputs markdown from terraform-docs output in README.md."""
 
 import argparse
+import bisect
 import logging
 import re
 import sys
 import textwrap
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -90,102 +92,154 @@ def extract_inputs_block(readme_content: str) -> str:
     return block
 
 
-def parse_terraform_docs_inputs(inputs_block: str) -> list[Variable]:
-    section_pattern = re.compile(
-        r"^##\s+(Required|Optional)\s+Inputs", re.IGNORECASE | re.MULTILINE
-    )
-    var_header_pattern = re.compile(
-        r"^###\s+<a\s+name=\"input_(?P<var_name>[^\"]+)\"></a>\s+\[(?P<display>[^\]]+)\]\(#input[^\)]+\)",
-        re.MULTILINE,
-    )
-    fenced_block_pattern = re.compile(r"```(\w+)?\n(.*?)\n```", re.MULTILINE | re.DOTALL)
-    description_pattern = re.compile(
-        r"^(?P<description>.*?)(?=\nType:|\nDefault:|$)", re.MULTILINE | re.DOTALL
-    )
-    type_pattern = re.compile(
-        r"^Type:\s*(?P<type_inline>[^\n]+)(?=\n(?:Default:|###|##|<!--|$))|"
-        r"^Type:\s*\n(?P<type_fenced>```\w+\n.*?\n```)(?=\n(?:Default:|###|##|<!--|$))",
-        re.MULTILINE | re.DOTALL,
-    )
-    default_pattern = re.compile(
-        r"^Default:\s*(?P<default_inline>[^\n]+)(?=\n(?:###|##|<!--|$))|"
-        r"^Default:\s*\n(?P<default_fenced>```\w+\n.*?\n```)(?=\n(?:###|##|<!--|$))",
-        re.MULTILINE | re.DOTALL,
-    )
+SECTION_PATTERN = re.compile(r"^##\s+(Required|Optional)\s+Inputs", re.IGNORECASE)
+VAR_HEADER_PATTERN = re.compile(
+    r"^###\s+<a\s+name=\"input_(?P<var_name>[^\"]+)\"></a>\s+\[(?P<display>[^\]]+)\]\(#input[^\)]+\)"
+)
+FENCE_OPEN_PATTERN = re.compile(r"```\w+")
+# A value ends before an empty line or a line starting with one of these.
+TYPE_END_PREFIXES = ("Default:", "##", "<!--")
+DEFAULT_END_PREFIXES = ("##", "<!--")
+
+
+def _ends_value(lines: list[str], index: int, end_prefixes: tuple[str, ...]) -> bool:
+    return index < len(lines) and (lines[index] == "" or lines[index].startswith(end_prefixes))
+
+
+def _fenced_value(lines: list[str], start: int, fences: list[int], closes: list[int]) -> str | None:
+    """Fenced block opened at `start`, closed by the first bare ``` line that ends the value.
+
+    `fences` holds the indices of lines starting with ```, `closes` those of closing lines.
+    """
+    close_pos = bisect.bisect_left(closes, start + 2)
+    if close_pos == len(closes):
+        return None
+    # The value body stops at the first fence-like line, even before the closing one.
+    body_end = fences[bisect.bisect_left(fences, start + 2)]
+    return "\n".join([lines[start], *lines[start + 1 : body_end], "```"])
+
+
+def _labelled_value(
+    lines: list[str], candidates: list[int], label: str, end_prefixes: tuple[str, ...]
+) -> str:
+    """Value of the first candidate `label` line: inline, on the next non-blank line, or fenced."""
+    fences: list[int] | None = None
+    closes: list[int] = []
+    for index in candidates:
+        if rest := lines[index][len(label) :].strip():
+            if _ends_value(lines, index + 1, end_prefixes):
+                return rest
+            continue
+        value_index = next((i for i in range(index + 1, len(lines)) if lines[i].strip()), None)
+        if value_index is None:
+            continue
+        if _ends_value(lines, value_index + 1, end_prefixes):
+            return lines[value_index].strip()
+        if FENCE_OPEN_PATTERN.fullmatch(lines[value_index]):
+            if fences is None:
+                fences = [i for i, line in enumerate(lines) if line.startswith("```")]
+                closes = [
+                    i
+                    for i in fences
+                    if lines[i] == "```" and _ends_value(lines, i + 1, end_prefixes)
+                ]
+            fenced = _fenced_value(lines, value_index, fences, closes)
+            if fenced is not None:
+                return fenced
+    return ""
 
-    def _extract_fenced_value(fenced_content: str) -> str:
-        match = fenced_block_pattern.search(fenced_content)
-        if match:
-            lang = match.group(1) or "hcl"
-            content = match.group(2)
-            return f"```{lang}\n{content}\n```"
-        return ""
-
-    def _extract_inline_or_fenced(
-        var_block: str, pattern: re.Pattern[str], inline_group: str, fenced_group: str
-    ) -> str:
-        match = pattern.search(var_block)
-        if not match:
-            return ""
-        if match.group(inline_group):
-            return match.group(inline_group).strip()
-        if match.group(fenced_group):
-            return _extract_fenced_value(match.group(fenced_group))
-        return ""
-
-    def _parse_description(var_block: str) -> str:
-        desc_match = description_pattern.search(var_block)
-        if desc_match and desc_match.group("description"):
-            return _extract_description(desc_match.group("description"))
-        desc_end_match = re.search(r"\n(?:Type:|Default:)", var_block)
-        desc_end = desc_end_match.start() if desc_end_match else len(var_block)
-        return _extract_description(var_block[:desc_end])
-
-    section_matches = list(section_pattern.finditer(inputs_block))
-    if not section_matches:
-        section_contents = [(inputs_block, False)]
-    else:
-        section_contents = []
-        for section_idx, section_match in enumerate(section_matches):
-            section_start = section_match.end()
-            section_end = (
-                section_matches[section_idx + 1].start()
-                if section_idx + 1 < len(section_matches)
-                else len(inputs_block)
-            )
-            section_content = inputs_block[section_start:section_end]
-            is_required = section_match.group(1).lower() == "required"
-            section_contents.append((section_content, is_required))
-
-    variables: list[Variable] = []
-    for section_content, is_required in section_contents:
-        var_matches = list(var_header_pattern.finditer(section_content))
-        for var_idx, var_match in enumerate(var_matches):
-            var_name = var_match.group("var_name").replace("\\_", "_")
-            var_start = var_match.end()
-            var_end = (
-                var_matches[var_idx + 1].start()
-                if var_idx + 1 < len(var_matches)
-                else len(section_content)
-            )
-            var_block = section_content[var_start:var_end]
-            description = _parse_description(var_block)
-            type_value = _extract_inline_or_fenced(
-                var_block, type_pattern, "type_inline", "type_fenced"
-            )
-            default_value = _extract_inline_or_fenced(
-                var_block, default_pattern, "default_inline", "default_fenced"
-            )
-            variables.append(
-                Variable(
-                    name=var_name,
-                    description=description,
-                    type=type_value,
-                    default=default_value,
-                    required=is_required,
-                )
+
+@dataclass
+class _PendingVariable:
+    """A variable whose block is still being read; indices are relative to its `###` line."""
+
+    name: str
+    start: int
+    header_rest: str
+    type_lines: list[int]
+    default_lines: list[int]
+
+    def add_label(self, line: str, index: int) -> None:
+        if line.startswith("Type:"):
+            self.type_lines.append(index)
+        elif line.startswith("Default:"):
+            self.default_lines.append(index)
+
+    def finish(self, block_lines: list[str], end: int, required: bool) -> Variable:
+        # A block cut short by the next heading ends with the newline before that heading.
+        lines = block_lines[self.start : end]
+        lines[0] = self.header_rest
+        if end < len(block_lines):
+            lines.append("")
+        if self.header_rest:
+            description = _extract_description(self.header_rest)
+        else:
+            desc_end = min(
+                (i for i in self.type_lines[:1] + self.default_lines[:1] if i > 0),
+                default=len(lines),
             )
+            description = _extract_description("\n".join(lines[:desc_end]))
+        return Variable(
+            name=self.name.replace("\\_", "_"),
+            description=description,
+            type=_labelled_value(lines, self.type_lines, "Type:", TYPE_END_PREFIXES),
+            default=_labelled_value(lines, self.default_lines, "Default:", DEFAULT_END_PREFIXES),
+            required=required,
+        )
 
+
+def iter_terraform_docs_inputs(inputs_block: str) -> Iterator[Variable]:
+    """Walk the terraform-docs inputs section once, yielding each variable.
+
+    Only headings and `Type:`/`Default:` lines drive the state machine; the lines between
+    them are sliced out when a variable's block ends. Variables before the first
+    `## Required/Optional Inputs` heading are only kept (as optional) when the block has no
+    such heading.
+    """
+    lines = inputs_block.split("\n")
+    marks = [i for i, line in enumerate(lines) if line.startswith(("##", "Type:", "Default:"))]
+    required = False
+    seen_section = False
+    unsectioned: list[Variable] = []
+    current: _PendingVariable | None = None
+
+    for index in marks:
+        line = lines[index]
+        if line[0] != "#":
+            if current is not None:
+                current.add_label(line, index - current.start)
+            continue
+        section = SECTION_PATTERN.match(line)
+        header = None if section else VAR_HEADER_PATTERN.match(line)
+        if section is None and header is None:
+            continue
+        if current is not None:
+            variable = current.finish(lines, index, required)
+            if seen_section:
+                yield variable
+            else:
+                unsectioned.append(variable)
+            current = None
+        if section is not None:
+            seen_section = True
+            required = section.group(1).lower() == "required"
+        else:
+            rest = line[header.end() :]
+            current = _PendingVariable(header.group("var_name"), index, rest, [], [])
+            current.add_label(rest, 0)
+
+    if current is not None:
+        variable = current.finish(lines, len(lines), required)
+        if seen_section:
+            yield variable
+        else:
+            unsectioned.append(variable)
+    if not seen_section:
+        yield from unsectioned
+
+
+def parse_terraform_docs_inputs(inputs_block: str) -> list[Variable]:
+    variables = list(iter_terraform_docs_inputs(inputs_block))
     if not variables:
         logger.warning("No variables were parsed from the terraform-docs inputs section.")
     return variables
@@ -308,6 +362,17 @@ def render_grouped_markdown(variables: list[Variable], sections: list[dict[str,
     return "\n".join(lines).rstrip() + "\n"
 
 
+def group_inputs(readme_content: str, config_path: Path) -> str:
+    """Replace the raw terraform-docs inputs block with the grouped rendering."""
+    inputs_block = extract_inputs_block(readme_content)
+    variables = parse_terraform_docs_inputs(inputs_block)
+    if not variables:
+        return readme_content
+    output_markdown = render_grouped_markdown(variables, load_group_config(config_path))
+    replacement = f"{BEGIN_MARKER}\n{output_markdown}\n{END_MARKER}"
+    return readme_content.replace(inputs_block, replacement)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate grouped inputs markdown from terraform-docs output in README.md."
@@ -322,14 +387,9 @@ def main() -> None:
     args = parser.parse_args()
 
     readme_content = load_readme(args.readme)
-    inputs_block = extract_inputs_block(readme_content)
-    variables = parse_terraform_docs_inputs(inputs_block)
-    if not variables:
+    new_content = group_inputs(readme_content, args.config)
+    if new_content == readme_content:
         return
-    sections = load_group_config(args.config)
-    output_markdown = render_grouped_markdown(variables, sections)
-    replacement = f"{BEGIN_MARKER}\n{output_markdown}\n{END_MARKER}"
-    new_content = readme_content.replace(inputs_block, replacement)
     try:
         args.readme.write_text(new_content, encoding="utf-8")
     except OSError as exc:
@@ -5,6 +5,7 @@ import textwrap
 import pytest
 
 from docs import generate_inputs_from_readme as mod
+from docs import inputs_parser_bench
 
 
 def _dedent(s: str) -> str:
@@ -165,3 +166,37 @@ list(object({
 def test_removing_indent():
     assert mod.avoid_extra_type_indent(_indented_hcl_content) == _wanted_hcl_content
     assert mod.avoid_extra_type_indent("string") == "string"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_parse_terraform_docs_inputs_matches_regex_parser(seed: int) -> None:
+    inputs_block = inputs_parser_bench.synthetic_inputs_block(variables=60, seed=seed)
+    expected = inputs_parser_bench.regex_parse_terraform_docs_inputs(inputs_block)
+    assert len(expected) == 60
+    assert mod.parse_terraform_docs_inputs(inputs_block) == expected
+
+
+@pytest.mark.parametrize(
+    "inputs_block",
+    [
+        '### <a name="input_a"></a> [a](#input\\_a)\n\nDescription: no sections\n\nType: `string`',
+        '### <a name="input_a"></a> [a](#input_a)\n## Optional Inputs\n'
+        '### <a name="input_b"></a> [b](#input_b)\nDescription: x\nType: `bool`\n',
+        '## Optional Inputs\n### <a name="input_a"></a> [a](#input_a) inline text\nType: `x`\n',
+        '## Optional Inputs\n### <a name="input_a"></a> [a](#input_a)\n\nType: `x`\nmore\n'
+        "Type:\n\n```hcl\nobject({\n  a = string\n})\n```\n\nDefault:\n\n```json\n{}\n```\n",
+        '## Required Inputs\n### <a name="input_a"></a> [a](#input_a)\nType:\n\n```hcl\n'
+        "string\n```hcl\n```\n\n### Auto Scaling\n#### nested\nDefault: `1`",
+        '## Optional Inputs\n### <a name="input_a"></a> [a](#input_a)\nType:\n```hcl\nstring',
+    ],
+)
+def test_parse_terraform_docs_inputs_edge_cases_match_regex_parser(inputs_block: str) -> None:
+    expected = inputs_parser_bench.regex_parse_terraform_docs_inputs(inputs_block)
+    assert mod.parse_terraform_docs_inputs(inputs_block) == expected
+
+
+def test_parse_terraform_docs_inputs_unclosed_fences_match_regex_parser() -> None:
+    inputs_block = inputs_parser_bench.synthetic_inputs_block(variables=10, unclosed_fences=200)
+    expected = inputs_parser_bench.regex_parse_terraform_docs_inputs(inputs_block)
+    assert expected[-1].name == "unclosed"
+    assert mod.parse_terraform_docs_inputs(inputs_block) == expected
@@ -0,0 +1,239 @@
+"""Benchmark the terraform-docs inputs parser on a synthetic README section.
+
+`regex_parse_terraform_docs_inputs` is the previous regex-per-field parser, kept as the
+reference the line-oriented `generate_inputs_from_readme.parse_terraform_docs_inputs` must
+match (see the parity tests).
+
+Usage:
+    uv run --directory tools python -m docs.inputs_parser_bench --variables 5000
+    uv run --directory tools python -m docs.inputs_parser_bench --unclosed-fences 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import time
+from collections.abc import Callable
+
+from docs.generate_inputs_from_readme import (
+    BEGIN_MARKER,
+    END_MARKER,
+    Variable,
+    _extract_description,
+    parse_terraform_docs_inputs,
+)
+
+DEFAULT_VARIABLES = 2000
+
+_SECTION_PATTERN = re.compile(r"^##\s+(Required|Optional)\s+Inputs", re.IGNORECASE | re.MULTILINE)
+_VAR_HEADER_PATTERN = re.compile(
+    r"^###\s+<a\s+name=\"input_(?P<var_name>[^\"]+)\"></a>\s+\[(?P<display>[^\]]+)\]\(#input[^\)]+\)",
+    re.MULTILINE,
+)
+_FENCED_BLOCK_PATTERN = re.compile(r"```(\w+)?\n(.*?)\n```", re.MULTILINE | re.DOTALL)
+_DESCRIPTION_PATTERN = re.compile(
+    r"^(?P<description>.*?)(?=\nType:|\nDefault:|$)", re.MULTILINE | re.DOTALL
+)
+_TYPE_PATTERN = re.compile(
+    r"^Type:\s*(?P<type_inline>[^\n]+)(?=\n(?:Default:|###|##|<!--|$))|"
+    r"^Type:\s*\n(?P<type_fenced>```\w+\n.*?\n```)(?=\n(?:Default:|###|##|<!--|$))",
+    re.MULTILINE | re.DOTALL,
+)
+_DEFAULT_PATTERN = re.compile(
+    r"^Default:\s*(?P<default_inline>[^\n]+)(?=\n(?:###|##|<!--|$))|"
+    r"^Default:\s*\n(?P<default_fenced>```\w+\n.*?\n```)(?=\n(?:###|##|<!--|$))",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def _regex_value(var_block: str, pattern: re.Pattern[str], inline: str, fenced: str) -> str:
+    match = pattern.search(var_block)
+    if not match:
+        return ""
+    if match.group(inline):
+        return match.group(inline).strip()
+    if match.group(fenced) and (block := _FENCED_BLOCK_PATTERN.search(match.group(fenced))):
+        return f"```{block.group(1) or 'hcl'}\n{block.group(2)}\n```"
+    return ""
+
+
+def _regex_description(var_block: str) -> str:
+    desc_match = _DESCRIPTION_PATTERN.search(var_block)
+    if desc_match and desc_match.group("description"):
+        return _extract_description(desc_match.group("description"))
+    desc_end_match = re.search(r"\n(?:Type:|Default:)", var_block)
+    desc_end = desc_end_match.start() if desc_end_match else len(var_block)
+    return _extract_description(var_block[:desc_end])
+
+
+def regex_parse_terraform_docs_inputs(inputs_block: str) -> list[Variable]:
+    section_matches = list(_SECTION_PATTERN.finditer(inputs_block))
+    if not section_matches:
+        section_contents = [(inputs_block, False)]
+    else:
+        section_contents = []
+        for section_idx, section_match in enumerate(section_matches):
+            section_end = (
+                section_matches[section_idx + 1].start()
+                if section_idx + 1 < len(section_matches)
+                else len(inputs_block)
+            )
+            section_contents.append(
+                (
+                    inputs_block[section_match.end() : section_end],
+                    section_match.group(1).lower() == "required",
+                )
+            )
+
+    variables: list[Variable] = []
+    for section_content, is_required in section_contents:
+        var_matches = list(_VAR_HEADER_PATTERN.finditer(section_content))
+        for var_idx, var_match in enumerate(var_matches):
+            var_end = (
+                var_matches[var_idx + 1].start()
+                if var_idx + 1 < len(var_matches)
+                else len(section_content)
+            )
+            var_block = section_content[var_match.end() : var_end]
+            variables.append(
+                Variable(
+                    name=var_match.group("var_name").replace("\\_", "_"),
+                    description=_regex_description(var_block),
+                    type=_regex_value(var_block, _TYPE_PATTERN, "type_inline", "type_fenced"),
+                    default=_regex_value(
+                        var_block, _DEFAULT_PATTERN, "default_inline", "default_fenced"
+                    ),
+                    required=is_required,
+                )
+            )
+    return variables
+
+
+SCALAR_TYPES = ["`string`", "`number`", "`bool`", "`list(string)`", "`map(string)`"]
+INLINE_DEFAULTS = ["`null`", "`true`", "`false`", '`"M10"`', "`[]`", "`{}`", "`3`"]
+DESCRIPTION_LINES = [
+    "Human-readable label that identifies this cluster, for example `my\\_cluster`.",
+    "- Set `name`, for example `US_EAST_1`.",
+    "**NOTE**: Groups and projects are synonymous terms.",
+    "  - Nested bullet with a [link](https://www.mongodb.com/docs/atlas/).",
+    "Valid values are `REPLICASET` / `SHARDED` / `GEOSHARDED`.",
+    "Type: not a field, only text that starts like one.",
+]
+
+
+def _fenced(rng: random.Random, lang: str) -> list[str]:
+    fields = [f"field_{i}" for i in range(rng.randint(1, 8))]
+    if lang == "json":
+        body = ["{", *(f'  "{f}": {rng.randint(0, 9)},' for f in fields), "}"]
+    else:
+        width = max(map(len, fields))
+        body = [
+            "object({",
+            *(f"  {f.ljust(width)} = optional(string)" for f in fields),
+            "})",
+        ]
+    return [f"```{lang}", *body, "```"]
+
+
+def _variable_lines(rng: random.Random, index: int, required: bool) -> list[str]:
+    name = f"var_{index}_{rng.choice(['name', 'size', 'tags', 'enabled'])}"
+    display = name.replace("_", "\\_")
+    lines = [f'### <a name="input_{name}"></a> [{display}](#input\\_{name})', ""]
+    description = rng.sample(DESCRIPTION_LINES, k=rng.randint(0, 3))
+    if description:
+        lines += [f"Description: {description[0]}", *description[1:], ""]
+    lines += (
+        ["Type:", "", *_fenced(rng, "hcl")]
+        if rng.random() < 0.3
+        else [f"Type: {rng.choice(SCALAR_TYPES)}"]
+    )
+    lines.append("")
+    if not required:
+        if rng.random() < 0.2:
+            lines += ["Default:", "", *_fenced(rng, "json")]
+        else:
+            lines.append(f"Default: {rng.choice(INLINE_DEFAULTS)}")
+        lines.append("")
+    return lines
+
+
+def synthetic_inputs_block(
+    variables: int = DEFAULT_VARIABLES, seed: int = 0, unclosed_fences: int = 0
+) -> str:
+    """A terraform-docs inputs section with `variables` inputs, a fifth of them required.
+
+    `unclosed_fences` adds a last variable repeating that many `Type:` lines opening a fence
+    that never closes, which makes the regex parser rescan the rest of the block each time.
+    """
+    rng = random.Random(seed)
+    required = variables // 5
+    lines = [
+        BEGIN_MARKER,
+        "## Required Inputs",
+        "",
+        "The following input variables are required:",
+        "",
+    ]
+    for index in range(variables):
+        if index == required:
+            lines += [
+                "## Optional Inputs",
+                "",
+                "The following input variables are optional (have default values):",
+                "",
+            ]
+        lines += _variable_lines(rng, index, index < required)
+    if unclosed_fences:
+        lines += ['### <a name="input_unclosed"></a> [unclosed](#input\\_unclosed)', ""]
+        lines += ["Type:", "", "```hcl", "string"] * unclosed_fences + [""]
+    lines.append(END_MARKER)
+    return "\n".join(lines)
+
+
+def benchmark(
+    inputs_block: str, iterations: int, parsers: dict[str, Callable[[str], list[Variable]]]
+) -> dict[str, list[float]]:
+    runs: dict[str, list[float]] = {name: [] for name in parsers}
+    for _ in range(iterations):
+        for name, parse in parsers.items():
+            start = time.perf_counter()
+            parse(inputs_block)
+            runs[name].append(time.perf_counter() - start)
+    return runs
+
+
+def print_benchmark(runs: dict[str, list[float]]) -> None:
+    print(f"{'parser':10} {'min ms':>10} {'median ms':>10} {'max ms':>10}")
+    for name, seconds in runs.items():
+        print(
+            f"{name:10} {min(seconds) * 1000:10.2f} {statistics.median(seconds) * 1000:10.2f}"
+            f" {max(seconds) * 1000:10.2f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variables", type=int, default=DEFAULT_VARIABLES)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--unclosed-fences", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    inputs_block = synthetic_inputs_block(args.variables, args.seed, args.unclosed_fences)
+    if parse_terraform_docs_inputs(inputs_block) != regex_parse_terraform_docs_inputs(inputs_block):
+        raise SystemExit("Parsers disagree on the synthetic inputs section")
+    print(f"{args.variables} variables, {len(inputs_block.splitlines())} lines")
+    print_benchmark(
+        benchmark(
+            inputs_block,
+            args.iterations,
+            {"lines": parse_terraform_docs_inputs, "regex": regex_parse_terraform_docs_inputs},
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Check relative links and `#anchor` fragments in git-tracked markdown files.
+
+Builds an index of every tracked path and every markdown heading anchor once, then validates
+all links against it without touching the filesystem again (no network access).
+
+Usage:
+    uv run --directory tools python -m docs.link_check [--json] [PATHS...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import posixpath
+import re
+import subprocess
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from urllib.parse import unquote
+
+INLINE_LINK_PATTERN = re.compile(r"\]\((?P<target><[^>]*>|[^)\s]*)(?:\s+\"[^\"]*\")?\)")
+REFERENCE_LINK_PATTERN = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*(?P<target>\S+)")
+HEADING_PATTERN = re.compile(r"^\s{0,3}#{1,6}\s+(?P<text>.*?)\s*#*\s*$")
+HTML_ANCHOR_PATTERN = re.compile(r"<a\s+(?:name|id)=\"(?P<anchor>[^\"]+)\"", re.IGNORECASE)
+FENCE_PATTERN = re.compile(r"^\s{0,3}(```|~~~)")
+INLINE_CODE_PATTERN = re.compile(r"`[^`\n]*`")
+MARKDOWN_LINK_TEXT_PATTERN = re.compile(r"!?\[(?P<text>[^\]]*)\]\([^)]*\)")
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+SLUG_DROP_PATTERN = re.compile(r"[^\w\- ]")
+EXTERNAL_PREFIXES = ("http://", "https://", "mailto:", "ftp://", "//")
+BACKSLASH_ESCAPE_PATTERN = re.compile(r"\\([!-/:-@\[-`{-~])")
+# Templates whose relative links only resolve once rendered into another directory.
+DEFAULT_SKIP_FILES = ["docs/example_readme.md"]
+
+
+@dataclass(frozen=True)
+class Link:
+    file: str
+    line: int
+    target: str
+
+
+@dataclass(frozen=True)
+class BrokenLink:
+    file: str
+    line: int
+    target: str
+    reason: str
+
+
+@dataclass
+class MarkdownFile:
+    anchors: set[str] = field(default_factory=set)
+    links: list[Link] = field(default_factory=list)
+
+
+@dataclass
+class RepoIndex:
+    """Tracked files, their parent directories and the anchors of each markdown file."""
+
+    files: frozenset[str]
+    dirs: frozenset[str]
+    markdown: dict[str, MarkdownFile]
+
+    def exists(self, path: str) -> bool:
+        return path in self.files or path in self.dirs
+
+
+@dataclass
+class LinkReport:
+    checked_files: int = 0
+    checked_links: int = 0
+    broken: list[BrokenLink] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "checked_files": self.checked_files,
+                "checked_links": self.checked_links,
+                "broken": [asdict(link) for link in self.broken],
+            },
+            indent=2,
+        )
+
+
+def tracked_files(root: Path) -> list[str]:
+    result = subprocess.run(
+        ["git", "ls-files", "-z"], cwd=root, capture_output=True, text=True, check=True
+    )
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def github_slug(heading: str) -> str:
+    """Anchor GitHub generates for a heading's text."""
+    text = MARKDOWN_LINK_TEXT_PATTERN.sub(lambda m: m.group("text"), heading)
+    text = HTML_TAG_PATTERN.sub("", text)
+    return SLUG_DROP_PATTERN.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def _prose_lines(content: str) -> Iterator[tuple[int, str]]:
+    """(line number, line) outside fenced code blocks."""
+    fence: str | None = None
+    for number, line in enumerate(content.splitlines(), start=1):
+        if match := FENCE_PATTERN.match(line):
+            if fence is None:
+                fence = match.group(1)
+            elif match.group(1) == fence:
+                fence = None
+            continue
+        if fence is None:
+            yield number, line
+
+
+def scan_markdown(path: str, content: str) -> MarkdownFile:
+    """Anchors defined in and links used by one markdown file, read in a single pass."""
+    scanned = MarkdownFile()
+    slug_counts: dict[str, int] = {}
+    for number, line in _prose_lines(content):
+        scanned.anchors.update(m.group("anchor") for m in HTML_ANCHOR_PATTERN.finditer(line))
+        if heading := HEADING_PATTERN.match(line):
+            slug = github_slug(heading.group("text"))
+            # GitHub suffixes repeated headings with -1, -2, ...
+            count = slug_counts.get(slug, 0)
+            slug_counts[slug] = count + 1
+            scanned.anchors.add(f"{slug}-{count}" if count else slug)
+        prose = INLINE_CODE_PATTERN.sub("", line)
+        targets = [m.group("target") for m in INLINE_LINK_PATTERN.finditer(prose)]
+        if reference := REFERENCE_LINK_PATTERN.match(prose):
+            targets.append(reference.group("target"))
+        scanned.links.extend(
+            Link(path, number, BACKSLASH_ESCAPE_PATTERN.sub(r"\1", target.strip("<>")))
+            for target in targets
+        )
+    return scanned
+
+
+def build_index(root: Path, files: Iterable[str] | None = None) -> RepoIndex:
+    files = frozenset(tracked_files(root) if files is None else files)
+    dirs = {""}
+    for path in files:
+        parent = posixpath.dirname(path)
+        while parent not in dirs:
+            dirs.add(parent)
+            parent = posixpath.dirname(parent)
+    markdown = {
+        path: scan_markdown(path, (root / path).read_text(encoding="utf-8"))
+        for path in sorted(files)
+        if path.endswith(".md") and (root / path).is_file()
+    }
+    return RepoIndex(files=files, dirs=frozenset(dirs), markdown=markdown)
+
+
+def check_link(link: Link, index: RepoIndex) -> str | None:
+    """Why `link` is broken, or None when it resolves.
+
+    External URLs and paths leaving the repository (e.g. `../../../issues`, which GitHub
+    resolves to the repository's pages) cannot be checked offline and are accepted.
+    """
+    target = link.target
+    if not target or target.startswith(EXTERNAL_PREFIXES) or ":" in target.split("/")[0]:
+        return None
+    path_part, _, anchor = target.partition("#")
+    path_part = unquote(path_part.split("?")[0])
+    if path_part:
+        base = "" if path_part.startswith("/") else posixpath.dirname(link.file)
+        resolved = posixpath.normpath(posixpath.join(base, path_part.lstrip("/")))
+        if resolved == ".":
+            resolved = ""
+        if resolved == ".." or resolved.startswith("../"):
+            return None
+        if not index.exists(resolved):
+            return f"missing file: {resolved or '.'}"
+    else:
+        resolved = link.file
+    if not anchor:
+        return None
+    if resolved in index.markdown and unquote(anchor) not in index.markdown[resolved].anchors:
+        return f"missing anchor: #{anchor}"
+    return None
+
+
+def check_links(
+    index: RepoIndex, only: Iterable[str] | None = None, skip_files: Iterable[str] = ()
+) -> LinkReport:
+    selected = set(index.markdown) if only is None else set(only) & set(index.markdown)
+    selected -= set(skip_files)
+    report = LinkReport()
+    for path in sorted(selected):
+        report.checked_files += 1
+        for link in index.markdown[path].links:
+            report.checked_links += 1
+            if reason := check_link(link, index):
+                report.broken.append(BrokenLink(link.file, link.line, link.target, reason))
+    return report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "paths", nargs="*", type=Path, help="Markdown files to check (default: all tracked)"
+    )
+    parser.add_argument("--root", type=Path, default=Path.cwd(), help="Repository root")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--no-skip", action="store_true", help="Check template files too")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    root = args.root.resolve()
+    try:
+        index = build_index(root)
+    except subprocess.CalledProcessError as e:
+        print(f"Error listing tracked files: {e.stderr or e}", file=sys.stderr)
+        sys.exit(2)
+    only = [p.resolve().relative_to(root).as_posix() for p in args.paths] or None
+    report = check_links(index, only, [] if args.no_skip else DEFAULT_SKIP_FILES)
+
+    if args.json:
+        print(report.to_json())
+    else:
+        for link in report.broken:
+            print(f"{link.file}:{link.line}: {link.target} ({link.reason})")
+        print(
+            f"Checked {report.checked_links} links in {report.checked_files} files, "
+            f"{len(report.broken)} broken"
+        )
+    if report.broken:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from docs import link_check as mod
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def write_tree(root: Path, files: dict[str, str]) -> list[str]:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return list(files)
+
+
+@pytest.mark.parametrize(
+    ("heading", "slug"),
+    [
+        ("Getting Started", "getting-started"),
+        (
+            "Cluster Topology Option 1 - `regions` Variables",
+            "cluster-topology-option-1---regions-variables",
+        ),
+        ("Why two options? (FAQ)", "why-two-options-faq"),
+        ("[Link](https://example.com) heading", "link-heading"),
+        ("shard_count", "shard_count"),
+    ],
+)
+def test_github_slug(heading: str, slug: str) -> None:
+    assert mod.github_slug(heading) == slug
+
+
+def test_check_links_reports_missing_files_and_anchors(tmp_path: Path) -> None:
+    files = write_tree(
+        tmp_path,
+        {
+            "README.md": (
+                "# Title\n\n## Usage\n\n## Usage\n\n"
+                '<a name="input_project_id"></a>\n\n'
+                "[ok](#usage-1) [ok](docs/guide.md#setup) [ok](examples/basic) [ok](main.tf#L3)\n"
+                "[ok](#input\\_project\\_id) [ok](../../../issues) [ok](https://example.com)\n"
+                "[bad](#missing) [bad](docs/guide.md#nope) [bad](docs/missing.md)\n"
+                "`[code](ignored.md)`\n\n```md\n[fenced](ignored.md)\n# Not a heading\n```\n"
+            ),
+            "docs/guide.md": "## Setup\n\n[up](../README.md#title)\n\n[ref]: ./other.md\n",
+            "examples/basic/main.tf": "",
+            "main.tf": "",
+        },
+    )
+    index = mod.build_index(tmp_path, files)
+
+    report = mod.check_links(index)
+
+    assert report.checked_files == 2
+    assert report.checked_links == 12
+    assert [(b.file, b.line, b.target) for b in report.broken] == [
+        ("README.md", 11, "#missing"),
+        ("README.md", 11, "docs/guide.md#nope"),
+        ("README.md", 11, "docs/missing.md"),
+        ("docs/guide.md", 5, "./other.md"),
+    ]
+    assert json.loads(report.to_json())["broken"][2]["reason"] == "missing file: docs/missing.md"
+
+
+def test_check_links_limits_to_selected_files(tmp_path: Path) -> None:
+    files = write_tree(tmp_path, {"a.md": "[x](nope.md)\n", "b.md": "[x](a.md)\n"})
+    index = mod.build_index(tmp_path, files)
+
+    assert mod.check_links(index, only=["b.md"]).broken == []
+    assert mod.check_links(index, skip_files=["a.md"]).checked_files == 1
+
+
+def test_repository_relative_links_point_to_tracked_files() -> None:
+    report = mod.check_links(mod.build_index(REPO_ROOT), skip_files=mod.DEFAULT_SKIP_FILES)
+
+    assert report.checked_files > 0
+    assert [b for b in report.broken if b.reason.startswith("missing file")] == []
@@ -1,30 +1,25 @@
 """Convert relative links in markdown files to absolute GitHub URLs."""
 
 import argparse
+import functools
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from docs import doc_utils
+from shared import repo_metadata
+
 DEFAULT_SKIP_FILES = [
     "CONTRIBUTING.md",
     "docs/example_readme.md",
 ]
+LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
 
 def get_git_remote_url() -> str:
-    result = subprocess.run(
-        ["git", "remote", "get-url", "origin"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    remote_url = result.stdout.strip()
-    if remote_url.startswith("git@github.com:"):
-        remote_url = remote_url.replace("git@github.com:", "https://github.com/")
-    if remote_url.endswith(".git"):
-        remote_url = remote_url[:-4]
-    return remote_url
+    return repo_metadata.load_repo_metadata().github_url
 
 
 def validate_tag_version(tag: str) -> bool:
@@ -52,8 +47,8 @@ def find_markdown_files(root_dir: Path, skip_files: list[str]) -> list[Path]:
         return [f for f in all_files if str(f.relative_to(root_dir)) not in skip_files]
 
 
-def resolve_relative_path(md_file: Path, relative_link: str, root_dir: Path) -> str:
-    md_dir = md_file.parent
+@functools.cache
+def _resolve_from_dir(md_dir: Path, relative_link: str, root_dir: Path) -> str:
     target_path = (md_dir / relative_link).resolve()
     try:
         rel_from_root = target_path.relative_to(root_dir)
@@ -62,6 +57,11 @@ def resolve_relative_path(md_file: Path, relative_link: str, root_dir: Path) ->
         return relative_link
 
 
+def resolve_relative_path(md_file: Path, relative_link: str, root_dir: Path) -> str:
+    """Memoized per (directory, link): sibling files share resolutions."""
+    return _resolve_from_dir(md_file.parent, relative_link, root_dir)
+
+
 def is_relative_link(link: str) -> bool:
     if not link:
         return False
@@ -70,21 +70,30 @@ def is_relative_link(link: str) -> bool:
     return True
 
 
-def convert_links_in_content(
+def convert_links_counted(
     content: str, md_file: Path, base_url: str, tag_version: str, root_dir: Path
-) -> str:
-    link_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
+) -> tuple[str, int]:
+    """Converted content and the number of links rewritten."""
+    converted = 0
 
     def replace_link(match: re.Match) -> str:
+        nonlocal converted
         link_text = match.group(1)
         link_url = match.group(2)
         if not is_relative_link(link_url):
             return match.group(0)
+        converted += 1
         absolute_path = resolve_relative_path(md_file, link_url, root_dir)
         github_url = f"{base_url}/blob/{tag_version}/{absolute_path}"
         return f"[{link_text}]({github_url})"
 
-    return re.sub(link_pattern, replace_link, content)
+    return LINK_PATTERN.sub(replace_link, content), converted
+
+
+def convert_links_in_content(
+    content: str, md_file: Path, base_url: str, tag_version: str, root_dir: Path
+) -> str:
+    return convert_links_counted(content, md_file, base_url, tag_version, root_dir)[0]
 
 
 def process_markdown_file(
@@ -95,16 +104,36 @@ def process_markdown_file(
     dry_run: bool = False,
 ) -> tuple[bool, int]:
     content = md_file.read_text(encoding="utf-8")
-    original_content = content
-    new_content = convert_links_in_content(content, md_file, base_url, tag_version, root_dir)
-    if new_content != original_content:
-        if not dry_run:
-            md_file.write_text(new_content, encoding="utf-8")
-        num_changes = len(re.findall(r"\]\(" + re.escape(base_url), new_content)) - len(
-            re.findall(r"\]\(" + re.escape(base_url), original_content)
-        )
-        return True, num_changes
-    return False, 0
+    new_content, num_changes = convert_links_counted(
+        content, md_file, base_url, tag_version, root_dir
+    )
+    if new_content == content:
+        return False, 0
+    if not dry_run:
+        doc_utils.write_if_changed(md_file, new_content)
+    return True, num_changes
+
+
+def process_markdown_files(
+    md_files: list[Path],
+    base_url: str,
+    tag_version: str,
+    root_dir: Path,
+    dry_run: bool = False,
+    max_workers: int | None = None,
+) -> list[tuple[Path, int]]:
+    """(file, links converted) for each modified file, in `md_files` order."""
+
+    def process(md_file: Path) -> tuple[bool, int]:
+        return process_markdown_file(md_file, base_url, tag_version, root_dir, dry_run=dry_run)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(process, md_files))
+    return [
+        (md_file, num_links)
+        for md_file, (was_modified, num_links) in zip(md_files, results, strict=True)
+        if was_modified
+    ]
 
 
 def main() -> None:
@@ -114,6 +143,7 @@ def main() -> None:
     parser.add_argument("tag_version", help="Git tag version in format vX.Y.Z (e.g., v1.0.0)")
     parser.add_argument("--dry-run", action="store_true", help="Preview without modifying")
     parser.add_argument("--no-skip", action="store_true", help="Process all files")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Files processed at once")
     args = parser.parse_args()
 
     tag_version = args.tag_version
@@ -128,7 +158,7 @@ def main() -> None:
 
     try:
         github_url = get_git_remote_url()
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, ValueError) as e:
         print(f"Error getting git remote URL: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -144,23 +174,17 @@ def main() -> None:
     print(f"Found {len(md_files)} markdown files to process")
     print()
 
-    total_modified = 0
-    total_links_converted = 0
-
-    for md_file in md_files:
-        was_modified, num_links = process_markdown_file(
-            md_file, github_url, tag_version, root_dir, dry_run=dry_run
-        )
-        if was_modified:
-            total_modified += 1
-            total_links_converted += num_links
-            rel_path = md_file.relative_to(root_dir)
-            prefix = "->" if dry_run else "ok"
-            print(f"{prefix} {rel_path} ({num_links} converted)")
+    modified = process_markdown_files(
+        md_files, github_url, tag_version, root_dir, dry_run=dry_run, max_workers=args.jobs
+    )
+    prefix = "->" if dry_run else "ok"
+    for md_file, num_links in modified:
+        print(f"{prefix} {md_file.relative_to(root_dir)} ({num_links} converted)")
 
     print()
     action = "would be modified" if dry_run else "modified"
-    print(f"Summary: {total_modified} files {action}, {total_links_converted} links converted")
+    total_links_converted = sum(num_links for _, num_links in modified)
+    print(f"Summary: {len(modified)} files {action}, {total_links_converted} links converted")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from docs import md_link_absolute as mod
+
+BASE_URL = "https://github.com/org/terraform-mongodbatlas-cluster"
+TAG = "v1.2.3"
+
+
+def test_convert_links_counted(tmp_path: Path) -> None:
+    md_file = tmp_path / "examples" / "basic" / "README.md"
+    content = (
+        "[root](../../README.md) [anchor](#usage) [web](https://example.com)\n"
+        f"[done]({BASE_URL}/blob/{TAG}/main.tf) [var](../../variables.tf#L3)\n"
+    )
+
+    converted, count = mod.convert_links_counted(content, md_file, BASE_URL, TAG, tmp_path)
+
+    assert count == 2
+    assert f"[root]({BASE_URL}/blob/{TAG}/README.md)" in converted
+    assert f"[var]({BASE_URL}/blob/{TAG}/variables.tf#L3)" in converted
+    assert "[anchor](#usage) [web](https://example.com)" in converted
+
+
+def test_process_markdown_files_rewrites_only_changed_files(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    changed = docs / "guide.md"
+    changed.write_text("See [main](../main.tf) and [guide](guide.md#top).\n")
+    unchanged = tmp_path / "README.md"
+    unchanged.write_text("Only [external](https://example.com) links.\n")
+
+    modified = mod.process_markdown_files([unchanged, changed], BASE_URL, TAG, tmp_path)
+
+    assert modified == [(changed, 2)]
+    assert changed.read_text() == (
+        f"See [main]({BASE_URL}/blob/{TAG}/main.tf) and "
+        f"[guide]({BASE_URL}/blob/{TAG}/docs/guide.md#top).\n"
+    )
+    assert sorted(p.name for p in tmp_path.rglob("*")) == ["README.md", "docs", "guide.md"]
+
+
+def test_process_markdown_files_dry_run_writes_nothing(tmp_path: Path) -> None:
+    md_file = tmp_path / "README.md"
+    md_file.write_text("[main](main.tf)\n")
+
+    modified = mod.process_markdown_files([md_file], BASE_URL, TAG, tmp_path, dry_run=True)
+
+    assert modified == [(md_file, 1)]
+    assert md_file.read_text() == "[main](main.tf)\n"
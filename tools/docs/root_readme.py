@@ -1,9 +1,12 @@
 """Generate and update root README.md sections (TOC, TABLES, GETTING_STARTED)."""
 
 import argparse
+import functools
 import re
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Self
 
 from docs import config_loader, doc_utils
 
@@ -25,31 +28,68 @@ def extract_getting_started(template_text: str) -> str:
     return downgrade_headers(match.group(1).strip()) + "\n"
 
 
+def _numeric_prefix(folder_id: str | int) -> str | None:
+    if isinstance(folder_id, int) or (isinstance(folder_id, str) and folder_id.isdigit()):
+        return f"{int(folder_id):02d}_"
+    return None
+
+
+@dataclass
+class ExampleIndex:
+    """Example folders listed once, by numeric prefix and by name, with cached file reads."""
+
+    examples_dir: Path
+    by_prefix: dict[str, str] = field(default_factory=dict)
+    names: set[str] = field(default_factory=set)
+    _contents: dict[Path, str | None] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, examples_dir: Path) -> Self:
+        index = cls(examples_dir)
+        for name in sorted(f.name for f in examples_dir.iterdir() if f.is_dir()):
+            index.names.add(name)
+            if "_" in name:
+                index.by_prefix.setdefault(name[: name.index("_") + 1], name)
+        return index
+
+    def find(self, folder_id: str | int) -> str | None:
+        """Folder name by numeric prefix (e.g., 01 -> 01_example_name) or exact name."""
+        if (prefix := _numeric_prefix(folder_id)) is not None:
+            return self.by_prefix.get(prefix)
+        return folder_id if folder_id in self.names else None
+
+    def read(self, path: Path) -> str | None:
+        if path not in self._contents:
+            self._contents[path] = path.read_text(encoding="utf-8") if path.exists() else None
+        return self._contents[path]
+
+
 def find_example_folder(folder_id: str | int, examples_dir: Path) -> str | None:
     """Find example folder by numeric prefix (e.g., 01) or exact name match."""
-    for folder in examples_dir.iterdir():
-        if not folder.is_dir():
-            continue
-        # Try numeric prefix match (e.g., "01" -> "01_example_name")
-        if isinstance(folder_id, int) or (isinstance(folder_id, str) and folder_id.isdigit()):
-            prefix = int(folder_id)
-            if folder.name.startswith(f"{prefix:02d}_"):
-                return folder.name
-        # Try exact name match (e.g., "cloud_provider_access")
-        elif folder.name == folder_id:
-            return folder.name
-    return None
+    return ExampleIndex.build(examples_dir).find(folder_id)
 
 
-def _resolve_auto_column(auto_config: config_loader.AutoColumnConfig, example_folder: Path) -> str:
-    target = example_folder / auto_config.file
-    if not target.exists():
-        return ""
-    content = target.read_text(encoding="utf-8")
+@functools.cache
+def _compile_auto_pattern(pattern: str) -> re.Pattern[str]:
     try:
-        match = re.search(auto_config.pattern, content)
+        return re.compile(pattern)
     except re.error as e:
-        raise ValueError(f"invalid auto_column pattern {auto_config.pattern!r}: {e}") from e
+        raise ValueError(f"invalid auto_column pattern {pattern!r}: {e}") from e
+
+
+def _resolve_auto_column(
+    auto_config: config_loader.AutoColumnConfig,
+    example_folder: Path,
+    index: ExampleIndex | None = None,
+) -> str:
+    target = example_folder / auto_config.file
+    if index is not None:
+        content = index.read(target)
+    else:
+        content = target.read_text(encoding="utf-8") if target.exists() else None
+    if content is None:
+        return ""
+    match = _compile_auto_pattern(auto_config.pattern).search(content)
     if not match:
         return ""
     if "value" not in match.groupdict():
@@ -70,7 +110,7 @@ def _resolve_column(
     row: config_loader.ExampleRow,
     table_config: config_loader.TableConfig,
     folder_name: str,
-    examples_dir: Path,
+    index: ExampleIndex,
 ) -> str:
     if col == table_config.link_column:
         return f"[{_display_name(row)}](./examples/{folder_name})"
@@ -80,7 +120,9 @@ def _resolve_column(
     if col in data and data[col] is not None:
         return str(data[col])
     if col in table_config.auto_columns:
-        return _resolve_auto_column(table_config.auto_columns[col], examples_dir / folder_name)
+        return _resolve_auto_column(
+            table_config.auto_columns[col], index.examples_dir / folder_name, index
+        )
     extra = row.model_extra or {}
     if col in extra:
         return str(extra[col])
@@ -105,6 +147,7 @@ def generate_toc_from_headings(content: str) -> str:
 
 
 def generate_tables(tables: list[config_loader.TableConfig], examples_dir: Path) -> str:
+    index = ExampleIndex.build(examples_dir)
     tables_output = []
     for table_config in tables:
         tables_output.append(f"## {table_config.name}\n")
@@ -118,11 +161,11 @@ def generate_tables(tables: list[config_loader.TableConfig], examples_dir: Path)
             folder_id = row.folder if row.folder is not None else row.folder_name
             if not folder_id:
                 continue
-            folder_name = find_example_folder(folder_id, examples_dir)
+            folder_name = index.find(folder_id)
             if not folder_name:
                 continue
             row_data = [
-                _resolve_column(col, row, table_config, folder_name, examples_dir)
+                _resolve_column(col, row, table_config, folder_name, index)
                 for col in table_config.columns
             ]
             tables_output.append(" | ".join(row_data))
@@ -149,6 +192,75 @@ def update_section(
     return new_text
 
 
+def _section_comment() -> str:
+    return doc_utils.generate_header_comment_for_section(
+        description="This section",
+        regenerate_command="just gen-readme",
+    )
+
+
+def update_readme_sections(
+    readme_content: str,
+    root_dir: Path,
+    config_dict: dict,
+    *,
+    skip_toc: bool = False,
+    skip_tables: bool = False,
+    skip_getting_started: bool = False,
+) -> tuple[str, list[str]]:
+    """Return the README with its generated sections refreshed and the sections generated."""
+    generated = []
+    if not skip_toc:
+        readme_content = update_section(
+            readme_content,
+            "TOC",
+            generate_toc_from_headings(readme_content),
+            "<!-- BEGIN_TOC -->",
+            "<!-- END_TOC -->",
+            _section_comment(),
+        )
+        generated.append("TOC")
+
+    if not skip_tables:
+        tables = config_loader.parse_tables_config(config_dict)
+        readme_content = update_section(
+            readme_content,
+            "TABLES",
+            generate_tables(tables, root_dir / "examples"),
+            "<!-- BEGIN_TABLES -->",
+            "<!-- END_TABLES -->",
+            _section_comment(),
+        )
+        generated.append("TABLES")
+
+    if not skip_getting_started:
+        examples_cfg = config_loader.parse_examples_readme_config(config_dict)
+        template_path = root_dir / (examples_cfg.readme_template or "docs/example_readme.md")
+        if not template_path.exists():
+            print(f"Warning: template not found at {template_path}; skipping GETTING_STARTED")
+            return readme_content, generated
+        getting_started = extract_getting_started(template_path.read_text(encoding="utf-8"))
+        if not getting_started:
+            print("Warning: No GETTING_STARTED markers found in template")
+            return readme_content, generated
+        getting_started = doc_utils.apply_template_vars(
+            getting_started,
+            examples_cfg.template_vars.vars,
+            context_name="root",
+            skip_rules=examples_cfg.template_vars.skip_rules,
+        )
+        readme_content = update_section(
+            readme_content,
+            "GETTING_STARTED",
+            getting_started,
+            "<!-- BEGIN_GETTING_STARTED -->",
+            "<!-- END_GETTING_STARTED -->",
+            _section_comment(),
+        )
+        generated.append("GETTING_STARTED")
+    return readme_content, generated
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate and update root README.md TOC and TABLES sections"
@@ -166,16 +278,12 @@ def main() -> None:
 
     root_dir = Path.cwd()
     readme_path = root_dir / "README.md"
-    examples_dir = root_dir / "examples"
 
     if not readme_path.exists():
         print(f"Error: README.md not found at {readme_path}")
         return
 
     original_readme_content = readme_path.read_text(encoding="utf-8")
-    readme_content = original_readme_content
-    config_dict = config_loader.load_examples_config()
-    tables = config_loader.parse_tables_config(config_dict)
 
     print("Root README.md Generator")
     if args.dry_run:
@@ -184,72 +292,17 @@ def main() -> None:
         print("Mode: CHECK (verifying documentation is up-to-date)")
     print()
 
-    modified = False
-
-    if not args.skip_toc:
-        print("Generating TOC from headings...")
-        toc_content = generate_toc_from_headings(readme_content)
-        readme_content = update_section(
-            readme_content,
-            "TOC",
-            toc_content,
-            "<!-- BEGIN_TOC -->",
-            "<!-- END_TOC -->",
-            doc_utils.generate_header_comment_for_section(
-                description="This section",
-                regenerate_command="just gen-readme",
-            ),
-        )
-        print("ok TOC generated")
-        modified = True
-
-    if not args.skip_tables:
-        print("Generating TABLES from config...")
-        tables_content = generate_tables(tables, examples_dir)
-        readme_content = update_section(
-            readme_content,
-            "TABLES",
-            tables_content,
-            "<!-- BEGIN_TABLES -->",
-            "<!-- END_TABLES -->",
-            doc_utils.generate_header_comment_for_section(
-                description="This section",
-                regenerate_command="just gen-readme",
-            ),
-        )
-        print("ok TABLES generated")
-        modified = True
-
-    if not args.skip_getting_started:
-        print("Generating GETTING_STARTED from example template...")
-        examples_cfg = config_loader.parse_examples_readme_config(config_dict)
-        template_path = root_dir / (examples_cfg.readme_template or "docs/example_readme.md")
-        if not template_path.exists():
-            print(f"Warning: template not found at {template_path}; skipping GETTING_STARTED")
-        else:
-            getting_started = extract_getting_started(template_path.read_text(encoding="utf-8"))
-            if getting_started:
-                getting_started = doc_utils.apply_template_vars(
-                    getting_started,
-                    examples_cfg.template_vars.vars,
-                    context_name="root",
-                    skip_rules=examples_cfg.template_vars.skip_rules,
-                )
-                readme_content = update_section(
-                    readme_content,
-                    "GETTING_STARTED",
-                    getting_started,
-                    "<!-- BEGIN_GETTING_STARTED -->",
-                    "<!-- END_GETTING_STARTED -->",
-                    doc_utils.generate_header_comment_for_section(
-                        description="This section",
-                        regenerate_command="just gen-readme",
-                    ),
-                )
-                print("ok GETTING_STARTED generated")
-                modified = True
-            else:
-                print("Warning: No GETTING_STARTED markers found in template")
+    readme_content, generated = update_readme_sections(
+        original_readme_content,
+        root_dir,
+        config_loader.load_examples_config(),
+        skip_toc=args.skip_toc,
+        skip_tables=args.skip_tables,
+        skip_getting_started=args.skip_getting_started,
+    )
+    for section in generated:
+        print(f"ok {section} generated")
+    modified = bool(generated)
 
     if args.check:
         if readme_content != original_readme_content:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from docs import config_loader
 from docs import root_readme as mod
 
@@ -153,3 +155,54 @@ Regular text stays the same
     assert "##### H4 becomes H5" in result
     assert "Regular text stays the same" in result
     assert "###No space also works" in result
+
+
+def test_example_index_finds_by_prefix_and_name(tmp_path: Path) -> None:
+    for name in ("01_basic", "10_sharded", "cloud_provider_access"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "02_not_a_dir").write_text("")
+    index = mod.ExampleIndex.build(tmp_path)
+
+    assert index.find(1) == index.find("01") == "01_basic"
+    assert index.find("10") == "10_sharded"
+    assert index.find(2) is None
+    assert index.find("cloud_provider_access") == "cloud_provider_access"
+    assert index.find("basic") is None
+
+
+def test_generate_tables_reads_each_file_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    example_dir = tmp_path / "01_basic"
+    example_dir.mkdir()
+    (example_dir / "main.tf").write_text('cluster_type = "SHARDED"\ninstance_size = "M30"')
+    auto_columns = {
+        "cluster_type": config_loader.AutoColumnConfig(
+            file="main.tf", pattern=r'cluster_type\s*=\s*"(?P<value>[^"]+)"'
+        ),
+        "size": config_loader.AutoColumnConfig(
+            file="main.tf", pattern=r'instance_size\s*=\s*"(?P<value>[^"]+)"'
+        ),
+    }
+    tables = [
+        config_loader.TableConfig(
+            name=f"Table {i}",
+            columns=["name", "cluster_type", "size"],
+            link_column="name",
+            example_rows=[config_loader.ExampleRow(name="Basic", folder=1)],
+            auto_columns=auto_columns,
+        )
+        for i in range(2)
+    ]
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", read_text)
+    result = mod.generate_tables(tables, tmp_path)
+
+    assert result.count("[Basic](./examples/01_basic) | SHARDED | M30") == 2
+    assert reads == [example_dir / "main.tf"]
@@ -0,0 +1,158 @@
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from dev import extract_regions, region_fixtures
+from shared.region_index import RegionIndex
+
+TTL = timedelta(hours=1)
+ATLAS_RESPONSE = {
+    "results": [
+        {
+            "provider": "AWS",
+            "instanceSizes": [
+                {"name": "M10", "availableRegions": [{"name": "US_EAST_1"}, {"name": "EU_WEST_1"}]},
+                {"name": "M30", "availableRegions": [{"name": "US_EAST_1"}, {}]},
+            ],
+        },
+        {"provider": "GCP", "instanceSizes": [{"availableRegions": [{"name": "CENTRAL_US"}]}]},
+        {"instanceSizes": [{"availableRegions": [{"name": "IGNORED"}]}]},
+    ]
+}
+
+
+def _fetcher(data, calls: list[str]):
+    def fetch():
+        calls.append("fetch")
+        return data
+
+    return fetch
+
+
+def test_cached_entry_is_reused_until_expired(tmp_path: Path):
+    cache_file = tmp_path / "aws_regions.json"
+    calls: list[str] = []
+
+    first = extract_regions.load_or_fetch_cached(cache_file, "AWS", _fetcher(["a"], calls), TTL)
+    second = extract_regions.load_or_fetch_cached(cache_file, "AWS", _fetcher(["b"], calls), TTL)
+
+    assert first == second == ["a"]
+    assert calls == ["fetch"]
+    entry = json.loads(cache_file.read_text())
+    assert datetime.fromisoformat(entry["expires_at"]) > datetime.now(UTC)
+
+    entry["expires_at"] = (datetime.now(UTC) - TTL).isoformat()
+    cache_file.write_text(json.dumps(entry))
+    assert extract_regions.load_or_fetch_cached(cache_file, "AWS", _fetcher(["c"], calls), TTL) == [
+        "c"
+    ]
+
+
+def test_refresh_and_legacy_files_refetch(tmp_path: Path):
+    cache_file = tmp_path / "aws_regions.json"
+    cache_file.write_text(json.dumps(["legacy"]))
+    calls: list[str] = []
+
+    assert extract_regions.load_or_fetch_cached(cache_file, "AWS", _fetcher(["a"], calls), TTL) == [
+        "a"
+    ]
+    assert extract_regions.load_or_fetch_cached(
+        cache_file, "AWS", _fetcher(["b"], calls), TTL, refresh=True
+    ) == ["b"]
+    assert calls == ["fetch", "fetch"]
+
+
+def test_failed_fetch_falls_back_to_stale_cache(tmp_path: Path):
+    cache_file = tmp_path / "regions.json"
+    cache_file.write_text(json.dumps({"results": []}))
+    calls: list[str] = []
+
+    data = extract_regions.load_or_fetch_cached(cache_file, "ATLAS", _fetcher({}, calls), TTL)
+
+    assert data == {"results": []}
+    assert calls == ["fetch"]
+
+
+def test_provider_regions_fetched_for_selected_providers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    for provider in ("aws", "azure", "gcp"):
+        monkeypatch.setitem(extract_regions.PROVIDER_FETCHERS, provider, lambda p=provider: [p])
+
+    regions = extract_regions.load_or_fetch_provider_regions(tmp_path, ttl=TTL)
+
+    assert regions == {"aws": ["aws"], "azure": ["azure"], "gcp": ["gcp"]}
+    assert extract_regions.load_or_fetch_provider_regions(tmp_path, "gcp", ttl=TTL) == {
+        "gcp": ["gcp"]
+    }
+
+
+def test_extract_atlas_regions_single_pass():
+    assert extract_regions.index_atlas_regions(ATLAS_RESPONSE) == {
+        "AWS": {"US_EAST_1", "EU_WEST_1"},
+        "GCP": {"CENTRAL_US"},
+    }
+    assert extract_regions.extract_atlas_regions(ATLAS_RESPONSE, "gcp") == {"GCP": {"CENTRAL_US"}}
+
+
+def test_align_assignments_matches_terraform_fmt_layout():
+    text = (
+        'variable "atlas_to_aws_region" {\n'
+        "  type = map(string)\n"
+        "  default = {\n"
+        '    US_EAST_1 = "us-east-1"\n'
+        '    AP_SOUTHEAST_2 = "ap-southeast-2"\n'
+        "  }\n"
+        "  description = <<-EOT\n"
+        "    Keys = Atlas format.\n"
+        "  EOT\n"
+        "}\n"
+    )
+    assert extract_regions.align_assignments(text) == (
+        'variable "atlas_to_aws_region" {\n'
+        "  type    = map(string)\n"
+        "  default = {\n"
+        '    US_EAST_1      = "us-east-1"\n'
+        '    AP_SOUTHEAST_2 = "ap-southeast-2"\n'
+        "  }\n"
+        "  description = <<-EOT\n"
+        "    Keys = Atlas format.\n"
+        "  EOT\n"
+        "}\n"
+    )
+
+
+def test_fixture_pipeline_end_to_end(tmp_path: Path):
+    atlas_data, provider_regions = region_fixtures.synthetic_responses(instance_sizes=5, regions=20)
+    region_fixtures.write_fixtures(tmp_path / "fixtures", atlas_data, provider_regions)
+
+    loaded = extract_regions.load_fixture_regions(tmp_path / "fixtures")
+    assert loaded == (atlas_data, provider_regions)
+
+    timings = region_fixtures.run_pipeline(*loaded, tmp_path)
+    assert set(timings) == {"extract", "validate", "render"}
+    aws_tf = (tmp_path / "regions_aws.tf").read_text()
+    assert 'SYNTH_0_REGION_1 = "synth-0-region-1"' in aws_tf
+    assert (tmp_path / "regions_azure.tf").exists()
+    assert (tmp_path / "regions_gcp.tf").exists()
+
+    mappings = extract_regions.create_validated_mappings(
+        extract_regions.extract_atlas_regions(atlas_data), provider_regions
+    )
+    assert all(len(regions) == 20 for regions in mappings.values())
+    assert not all(info["valid"] for info in mappings["AWS"].values())
+
+
+def test_write_region_index_from_atlas_response(tmp_path: Path):
+    mappings = extract_regions.create_validated_mappings(
+        extract_regions.extract_atlas_regions(ATLAS_RESPONSE),
+        {"aws": ["us-east-1", "eu-west-1"], "gcp": ["us-central1"]},
+    )
+    extract_regions.write_region_index(tmp_path / "index.json", ATLAS_RESPONSE, mappings)
+
+    index = RegionIndex.load(tmp_path / "index.json")
+    assert index.to_atlas("gcp", "us-central1") == "CENTRAL_US"
+    assert index.is_available("aws", "M10", "eu-west-1")
+    assert not index.is_available("aws", "M30", "eu-west-1")
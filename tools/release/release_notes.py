@@ -4,21 +4,12 @@ import subprocess
 import sys
 
 from release import tf_registry_source
+from shared import git_queries
 
 
 def get_previous_tag(current_version: str) -> str | None:
     try:
-        result = subprocess.run(
-            ["git", "tag", "-l", "v*.*.*"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        tags = [
-            tag.strip()
-            for tag in result.stdout.strip().split("\n")
-            if tag.strip() and tag.strip() != current_version
-        ]
+        tags = [tag for tag in git_queries.load_git_repo().version_tags() if tag != current_version]
         if not tags:
             return None
         sorted_tags = sorted(tags, key=lambda t: [int(x) for x in t.lstrip("v").split(".")])
@@ -28,16 +19,7 @@ def get_previous_tag(current_version: str) -> str | None:
 
 
 def get_merge_base(ref: str, base: str = "main") -> str | None:
-    try:
-        result = subprocess.run(
-            ["git", "merge-base", ref, base],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+    return git_queries.load_git_repo().merge_base(ref, base)
 
 
 def generate_notes_from_git_log(from_ref: str, to_ref: str) -> str:
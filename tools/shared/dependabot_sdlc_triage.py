@@ -1,24 +1,47 @@
 from __future__ import annotations
 
 import base64
+import http.client
 import json
 import logging
 import os
+import queue
 import re
+import threading
+import time
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-from urllib.error import HTTPError
-from urllib.parse import quote, urlencode
-from urllib.request import Request, urlopen
+from typing import Any, TypeVar
+from urllib.parse import parse_qs, quote, urlencode, urlsplit
 
 COMMENT_MARKER = "<!-- dependabot-sdlc-triage -->"
 DEPENDABOT_LOGIN = "dependabot[bot]"
 SDLC_MARKER = "path-sync copy -n sdlc"
 GITHUB_ACTIONS_ECOSYSTEM = "github_actions"
 API_REQUEST_TIMEOUT_SECONDS = 15
+# GitHub asks integrations to keep concurrent requests low to avoid secondary rate limits.
+DEFAULT_MAX_CONCURRENCY = 8
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT_SECONDS = 120
+# Without a Retry-After header GitHub asks clients to wait at least a minute.
+DEFAULT_RATE_LIMIT_WAIT_SECONDS = 60
+COMMIT_SHA_PATTERN = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+CACHE_DIR_ENV = "DEPENDABOT_TRIAGE_CACHE_DIR"
+CACHE_FILE_NAME = "github-responses.json"
+PER_PAGE = 100
+LINK_PATTERN = re.compile(r'<(?P<url>[^>]+)>\s*;\s*rel="(?P<rel>[^"]+)"')
+BACKEND_ENV = "DEPENDABOT_TRIAGE_BACKEND"
+GRAPHQL_BACKEND = "graphql"
+GRAPHQL_PULLS_PAGE_SIZE = 25
+# Aliased fields per blob query or mutation document.
+GRAPHQL_BATCH_SIZE = 50
+# A pooled keep-alive connection the server already closed fails with one of these.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+T = TypeVar("T")
+R = TypeVar("R")
 SECTION_MARKER_PATTERN = re.compile(
     r"^\s*#\s*===\s*(DO_NOT_EDIT|OK_EDIT):\s*path-sync\s+\S+\s*===\s*$"
 )
@@ -68,6 +91,22 @@ class ActionClassification:
     unclassified_paths: tuple[str, ...] = ()
 
 
+@dataclass
+class PullSnapshot:
+    """An open pull request as fetched by the GraphQL backend.
+
+    `pull_request` has the REST shape used by the rest of this module. Fields that GraphQL
+    could not return completely (long lists, renamed files without their old path) are None
+    and are fetched through REST instead.
+    """
+
+    node_id: str
+    pull_request: dict[str, Any]
+    files: list[dict[str, Any]] | None
+    label_names: set[str] | None
+    has_triage_comment: bool | None
+
+
 @dataclass(frozen=True)
 class _UsesReference:
     line_number: int
@@ -81,12 +120,201 @@ class GitHubApiError(RuntimeError):
         super().__init__(f"GitHub API returned {status}: {message}")
 
 
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, at most `size` in use at a time."""
+
+    def __init__(self, base_url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"invalid API URL: {base_url!r}")
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.timeout = timeout
+        self.created = 0
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        self.created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def request(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str]
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """(status, headers, body); a stale reused connection is retried once on a new one."""
+        with self._slots:
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self._connect(), False
+            while True:
+                try:
+                    connection.request(method, path, body=body, headers=headers)
+                    response = connection.getresponse()
+                    data = response.read()
+                except STALE_CONNECTION_ERRORS:
+                    connection.close()
+                    if not reused:
+                        raise
+                    connection, reused = self._connect(), False
+                    continue
+                except BaseException:
+                    connection.close()
+                    raise
+                break
+            if response.will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+            return response.status, response.headers, data
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def rate_limit_delay(status: int, headers: http.client.HTTPMessage) -> float | None:
+    """Seconds to wait before retrying a rate-limited response, or None when not rate limited."""
+    if status not in (403, 429):
+        return None
+    if retry_after := headers.get("retry-after"):
+        return float(retry_after)
+    if headers.get("x-ratelimit-remaining") == "0" and (reset := headers.get("x-ratelimit-reset")):
+        return max(float(reset) - time.time(), 0) + 1
+    return DEFAULT_RATE_LIMIT_WAIT_SECONDS if status == 429 else None
+
+
+def concurrent_map(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> list[R]:
+    """`[fn(item) for item in items]` run on up to `max_workers` threads, in input order."""
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def parse_link_header(value: str | None) -> dict[str, str]:
+    """rel -> URL for an RFC 8288 Link header such as GitHub's pagination links."""
+    return {m.group("rel"): m.group("url") for m in LINK_PATTERN.finditer(value or "")}
+
+
+def _link_page(url: str | None) -> int | None:
+    pages = parse_qs(urlsplit(url).query).get("page") if url else None
+    return int(pages[0]) if pages and pages[0].isdigit() else None
+
+
+@dataclass
+class CacheStats:
+    content_hits: int = 0
+    content_misses: int = 0
+    not_modified: int = 0
+    fetched: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"GitHub response cache: file contents {self.content_hits} hits, "
+            f"{self.content_misses} misses; listings {self.not_modified} not modified, "
+            f"{self.fetched} fetched"
+        )
+
+
+class ResponseCache:
+    """Two-tier cache for GitHub GET responses.
+
+    File contents read at a commit SHA never change and are reused without a request. Other
+    GETs are revalidated with their ETag (`If-None-Match`); GitHub answers 304 without counting
+    it against the rate limit. With a `path`, the entries used in a run are loaded from and
+    saved back to a JSON file, so scheduled runs can share them.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._contents: dict[str, str | None] = {}
+        self._etags: dict[str, tuple[str, Any, str | None]] = {}
+        self._used: set[str] = set()
+        if path is not None and path.exists():
+            try:
+                stored = json.loads(path.read_text())
+                self._contents = dict(stored["contents"])
+                self._etags = {
+                    url: (etag, body, link) for url, (etag, body, link) in stored["etags"].items()
+                }
+            except ValueError, KeyError, TypeError:
+                logging.warning("Ignoring unreadable GitHub response cache %s", path)
+
+    def content(self, path: str, sha: str) -> tuple[bool, str | None]:
+        """(found, content) for `path` at commit `sha`."""
+        key = f"{sha}:{path}"
+        with self._lock:
+            found = key in self._contents
+            if found:
+                self.stats.content_hits += 1
+                self._used.add(key)
+            else:
+                self.stats.content_misses += 1
+            return found, self._contents.get(key)
+
+    def store_content(self, path: str, sha: str, content: str | None) -> None:
+        key = f"{sha}:{path}"
+        with self._lock:
+            self._contents[key] = content
+            self._used.add(key)
+
+    def etag(self, url: str) -> str | None:
+        with self._lock:
+            cached = self._etags.get(url)
+            return cached[0] if cached else None
+
+    def not_modified(self, url: str) -> tuple[Any, str | None]:
+        """(body, Link header) stored for `url`, after a 304 response."""
+        with self._lock:
+            self.stats.not_modified += 1
+            self._used.add(url)
+            _, body, link = self._etags[url]
+            return body, link
+
+    def store_response(self, url: str, etag: str | None, body: Any, link: str | None) -> None:
+        with self._lock:
+            self.stats.fetched += 1
+            if etag:
+                self._etags[url] = (etag, body, link)
+                self._used.add(url)
+
+    def save(self) -> None:
+        """Write the entries used in this run; unused ones are dropped."""
+        if self.path is None:
+            return
+        with self._lock:
+            stored = {
+                "contents": {k: v for k, v in self._contents.items() if k in self._used},
+                "etags": {k: list(v) for k, v in self._etags.items() if k in self._used},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(stored))
+
+
 class GitHubClient:
+    """Thread-safe REST client sharing a keep-alive connection pool.
+
+    At most `max_concurrency` requests are in flight. A secondary rate limit response (403/429
+    with Retry-After or an exhausted quota) pauses every thread until GitHub allows requests
+    again, then the request is retried.
+    """
+
     def __init__(
         self,
         token: str | None,
         repository: str,
         api_url: str = "https://api.github.com",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: ResponseCache | None = None,
     ) -> None:
         owner, separator, repo = repository.partition("/")
         if not separator or not owner or not repo:
@@ -95,6 +323,28 @@ class GitHubClient:
         self.owner = owner
         self.repo = repo
         self.api_url = api_url.rstrip("/")
+        self.api_path = urlsplit(self.api_url).path
+        # https://api.github.com/graphql, or https://<host>/api/graphql for GitHub Enterprise.
+        self.graphql_path = self.api_path.removesuffix("/v3") + "/graphql"
+        self.max_concurrency = max_concurrency
+        self.pool = ConnectionPool(self.api_url, max_concurrency, API_REQUEST_TIMEOUT_SECONDS)
+        self.cache = cache or ResponseCache()
+        self._resume_lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def close(self) -> None:
+        self.pool.close()
+        self.cache.save()
+
+    def _wait_for_rate_limit(self) -> None:
+        with self._resume_lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause(self, delay: float) -> None:
+        with self._resume_lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
 
     def _request(
         self,
@@ -103,11 +353,25 @@ class GitHubClient:
         *,
         payload: dict[str, Any] | None = None,
         query: dict[str, Any] | None = None,
+        revalidate: bool = True,
     ) -> Any:
-        repository_path = f"/repos/{quote(self.owner)}/{quote(self.repo)}"
-        url = f"{self.api_url}{repository_path}{path}"
+        url = f"{self.api_path}/repos/{quote(self.owner)}/{quote(self.repo)}{path}"
         if query:
             url = f"{url}?{urlencode(query)}"
+        return self._send(method, url, payload, revalidate=revalidate)[0]
+
+    def graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        result, _ = self._send(
+            "POST", self.graphql_path, {"query": query, "variables": variables}, revalidate=False
+        )
+        if errors := result.get("errors"):
+            raise GitHubApiError(200, "; ".join(error.get("message", "") for error in errors))
+        return result["data"]
+
+    def _send(
+        self, method: str, url: str, payload: dict[str, Any] | None, *, revalidate: bool
+    ) -> tuple[Any, str | None]:
+        """(decoded JSON body, Link header)."""
         data = json.dumps(payload).encode() if payload is not None else None
         headers = {
             "Accept": "application/vnd.github+json",
@@ -118,16 +382,74 @@ class GitHubClient:
             headers["Content-Type"] = "application/json"
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
-        request = Request(url, data=data, method=method, headers=headers)
+        revalidate = revalidate and method == "GET"
+        if revalidate and (etag := self.cache.etag(url)):
+            headers["If-None-Match"] = etag
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._wait_for_rate_limit()
+            status, response_headers, body = self.pool.request(method, url, data, headers)
+            delay = rate_limit_delay(status, response_headers)
+            if (
+                delay is None
+                or delay > MAX_RATE_LIMIT_WAIT_SECONDS
+                or attempt == RATE_LIMIT_RETRIES
+            ):
+                break
+            logging.warning("GitHub rate limit on %s %s, retrying in %.0fs", method, url, delay)
+            self._pause(delay)
+        if status == 304 and "If-None-Match" in headers:
+            return self.cache.not_modified(url)
+        # http.client does not follow redirects; GitHub only sends them for moved repositories.
+        if status >= 300:
+            raise GitHubApiError(status, body.decode(errors="replace"))
+        result = json.loads(body) if body else None
+        link = response_headers.get("link")
+        if revalidate:
+            self.cache.store_response(url, response_headers.get("etag"), result, link)
+        return result, link
+
+    def _page(
+        self, path: str, query: dict[str, Any] | None, page: int
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        """(items, Link relations) for one page of a list endpoint."""
+        url = f"{self.api_path}/repos/{quote(self.owner)}/{quote(self.repo)}{path}"
+        url = f"{url}?{urlencode({**(query or {}), 'per_page': PER_PAGE, 'page': page})}"
+        batch, link = self._send("GET", url, None, revalidate=True)
+        if not isinstance(batch, list):
+            raise TypeError(f"expected a list from {path}")
+        return batch, parse_link_header(link)
+
+    def iter_paginated(
+        self,
+        path: str,
+        *,
+        query: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Items of every page, in order, yielded as soon as their page arrives.
+
+        The first page's Link header tells how many pages follow. When it has a `last`
+        relation the remaining pages are prefetched concurrently; otherwise `next` links are
+        followed one at a time.
+        """
+        batch, links = self._page(path, query, 1)
+        yield from batch
+        last_page = _link_page(links.get("last"))
+        if last_page is None:
+            page = 1
+            while "next" in links:
+                page = _link_page(links["next"]) or page + 1
+                batch, links = self._page(path, query, page)
+                yield from batch
+            return
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, last_page - 1)))
         try:
-            with urlopen(request, timeout=API_REQUEST_TIMEOUT_SECONDS) as response:
-                body = response.read()
-        except HTTPError as error:
-            message = error.read().decode(errors="replace")
-            raise GitHubApiError(error.code, message) from error
-        if not body:
-            return None
-        return json.loads(body)
+            futures = [
+                executor.submit(self._page, path, query, page) for page in range(2, last_page + 1)
+            ]
+            for future in futures:
+                yield from future.result()[0]
+        finally:
+            executor.shutdown(cancel_futures=True)
 
     def _paginate(
         self,
@@ -135,22 +457,7 @@ class GitHubClient:
         *,
         query: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
-        items: list[dict[str, Any]] = []
-        page = 1
-        while True:
-            page_query = dict(query or {})
-            page_query.update({"per_page": 100, "page": page})
-            batch = self._request(
-                "GET",
-                path,
-                query=page_query,
-            )
-            if not isinstance(batch, list):
-                raise TypeError(f"expected a list from {path}")
-            items.extend(batch)
-            if len(batch) < 100:
-                return items
-            page += 1
+        return list(self.iter_paginated(path, query=query))
 
     def list_pull_files(self, pull_number: int) -> list[dict[str, Any]]:
         return self._paginate(f"/pulls/{pull_number}/files")
@@ -158,12 +465,27 @@ class GitHubClient:
     def list_open_pulls(self) -> list[dict[str, Any]]:
         return self._paginate("/pulls", query={"state": "open"})
 
+    def iter_open_pulls(self) -> Iterator[dict[str, Any]]:
+        return self.iter_paginated("/pulls", query={"state": "open"})
+
     def read_file(self, path: str, ref: str) -> str | None:
+        immutable = COMMIT_SHA_PATTERN.fullmatch(ref) is not None
+        if immutable:
+            found, content = self.cache.content(path, ref)
+            if found:
+                return content
+        content = self._fetch_file(path, ref, revalidate=not immutable)
+        if immutable:
+            self.cache.store_content(path, ref, content)
+        return content
+
+    def _fetch_file(self, path: str, ref: str, *, revalidate: bool) -> str | None:
         try:
             data = self._request(
                 "GET",
                 f"/contents/{quote(path, safe='/')}",
                 query={"ref": ref},
+                revalidate=revalidate,
             )
         except GitHubApiError as error:
             if error.status == 404:
@@ -288,6 +610,11 @@ def _uses_references(content: str) -> dict[tuple[str, int], _UsesReference]:
     return references
 
 
+def _base_path(file: dict[str, Any]) -> str | None:
+    filename = file["filename"]
+    return file.get("previous_filename") if file.get("status") == "renamed" else filename
+
+
 def classify_action_references(
     files: list[dict[str, Any]],
     read_file: Callable[[str, str], str | None],
@@ -301,7 +628,7 @@ def classify_action_references(
 
     for file in files:
         filename = file["filename"]
-        base_path = file.get("previous_filename") if file.get("status") == "renamed" else filename
+        base_path = _base_path(file)
         if not base_path:
             unclassified_paths.append(filename)
             continue
@@ -385,12 +712,31 @@ def render_comment() -> str:
 def classify_pull_request(
     pull_request: dict[str, Any],
     client: GitHubClient,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
 ) -> ActionClassification:
     pull_number = int(pull_request["number"])
     base_ref = pull_request["base"]["sha"]
     head_ref = pull_request["head"]["sha"]
     files = client.list_pull_files(pull_number)
-    return classify_action_references(files, client.read_file, base_ref, head_ref)
+    # Fetch every base and head version up front so the reads run concurrently.
+    wanted = list(
+        dict.fromkeys(
+            pair
+            for file in files
+            if (base_path := _base_path(file))
+            for pair in ((base_path, base_ref), (file["filename"], head_ref))
+        )
+    )
+    contents = dict(
+        zip(
+            wanted,
+            concurrent_map(lambda pair: client.read_file(*pair), wanted, max_workers),
+            strict=True,
+        )
+    )
+    return classify_action_references(
+        files, lambda path, ref: contents[(path, ref)], base_ref, head_ref
+    )
 
 
 def desired_labels(classification: ActionClassification) -> tuple[Label, ...]:
@@ -434,6 +780,23 @@ def create_comment_once(pull_number: int, client: GitHubClient) -> None:
         client.create_comment(pull_number, render_comment())
 
 
+def classify_event(
+    pull_request: dict[str, Any],
+    client: GitHubClient,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+) -> ActionClassification:
+    if dependabot_ecosystem(pull_request) == GITHUB_ACTIONS_ECOSYSTEM:
+        return classify_pull_request(pull_request, client, max_workers)
+    return ActionClassification((), (), unclassified_paths=("unsupported ecosystem",))
+
+
+def apply_triage(
+    pull_request: dict[str, Any], classification: ActionClassification, client: GitHubClient
+) -> None:
+    create_comment_once(int(pull_request["number"]), client)
+    reconcile_labels(pull_request, desired_labels(classification), client)
+
+
 def triage_event(
     event: dict[str, Any],
     client: GitHubClient,
@@ -442,27 +805,314 @@ def triage_event(
         return None
 
     pull_request = event["pull_request"]
-    ecosystem = dependabot_ecosystem(pull_request)
-    classification = (
-        classify_pull_request(pull_request, client)
-        if ecosystem == GITHUB_ACTIONS_ECOSYSTEM
-        else ActionClassification((), (), unclassified_paths=("unsupported ecosystem",))
-    )
-    create_comment_once(int(pull_request["number"]), client)
-    reconcile_labels(pull_request, desired_labels(classification), client)
+    classification = classify_event(pull_request, client)
+    apply_triage(pull_request, classification, client)
     return classification
 
 
-def triage_open_dependabot_pulls(client: GitHubClient) -> tuple[int, ...]:
-    refreshed: list[int] = []
-    for pull_request in open_dependabot_pulls(client):
-        triage_event({"pull_request": pull_request}, client)
-        refreshed.append(int(pull_request["number"]))
-    return tuple(refreshed)
+def triage_open_dependabot_pulls(
+    client: GitHubClient, max_workers: int = DEFAULT_MAX_CONCURRENCY
+) -> tuple[int, ...]:
+    """Classify open Dependabot pulls concurrently, then comment and label them in order.
 
+    Classification starts as soon as each page of open pulls arrives. Writes stay serial
+    because GitHub counts concurrent mutations against the secondary rate limit much faster
+    than reads.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pending = [
+            (pull, executor.submit(classify_event, pull, client, max_workers))
+            for pull in open_dependabot_pulls(client)
+        ]
+        for pull_request, future in pending:
+            apply_triage(pull_request, future.result(), client)
+    return tuple(int(pull_request["number"]) for pull_request, _ in pending)
+
+
+def open_dependabot_pulls(client: GitHubClient) -> Iterator[dict[str, Any]]:
+    return (pull for pull in client.iter_open_pulls() if is_dependabot_pull_request(pull))
+
+
+OPEN_PULLS_QUERY = """
+query OpenPulls($owner: String!, $name: String!, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: $first, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id
+        number
+        title
+        url
+        headRefName
+        baseRefOid
+        headRefOid
+        author { __typename login }
+        files(first: 100) { pageInfo { hasNextPage } nodes { path changeType } }
+        labels(first: 100) { pageInfo { hasNextPage } nodes { name } }
+        comments(first: 100) { pageInfo { hasNextPage } nodes { author { __typename } body } }
+      }
+    }
+  }
+}
+"""
+LABELS_QUERY = """
+query Labels($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    labels(first: 100, query: "dependabot-") { nodes { id name } }
+  }
+}
+"""
+# GraphQL reports changeType; REST reports status. Renames need REST for the old path.
+GRAPHQL_CHANGE_STATUS = {
+    "ADDED": "added",
+    "MODIFIED": "modified",
+    "DELETED": "removed",
+    "CHANGED": "changed",
+    "COPIED": "copied",
+}
+
+
+def _graphql_user(author: dict[str, Any] | None) -> dict[str, Any]:
+    if not author:
+        return {}
+    # GraphQL drops the "[bot]" suffix REST logins carry.
+    login = author["login"] + "[bot]" if author["__typename"] == "Bot" else author["login"]
+    return {"login": login, "type": author["__typename"]}
+
+
+def pull_snapshot(node: dict[str, Any]) -> PullSnapshot:
+    pull_request = {
+        "number": node["number"],
+        "user": _graphql_user(node.get("author")),
+        "base": {"sha": node["baseRefOid"]},
+        "head": {"ref": node["headRefName"], "sha": node["headRefOid"]},
+        "title": node["title"],
+        "html_url": node["url"],
+    }
+    files_page, labels_page, comments_page = node["files"], node["labels"], node["comments"]
+    files = [
+        {"filename": file["path"], "status": GRAPHQL_CHANGE_STATUS.get(file["changeType"])}
+        for file in files_page["nodes"]
+    ]
+    has_triage_comment = any(
+        (comment.get("author") or {}).get("__typename") == "Bot"
+        and COMMENT_MARKER in comment.get("body", "")
+        for comment in comments_page["nodes"]
+    )
+    return PullSnapshot(
+        node_id=node["id"],
+        pull_request=pull_request,
+        files=(
+            None
+            if files_page["pageInfo"]["hasNextPage"] or any(f["status"] is None for f in files)
+            else files
+        ),
+        label_names=(
+            None
+            if labels_page["pageInfo"]["hasNextPage"]
+            else {label["name"] for label in labels_page["nodes"]}
+        ),
+        has_triage_comment=(
+            None
+            if not has_triage_comment and comments_page["pageInfo"]["hasNextPage"]
+            else has_triage_comment
+        ),
+    )
 
-def open_dependabot_pulls(client: GitHubClient) -> list[dict[str, Any]]:
-    return [pull for pull in client.list_open_pulls() if is_dependabot_pull_request(pull)]
+
+def fetch_open_pull_snapshots(client: GitHubClient) -> list[PullSnapshot]:
+    snapshots: list[PullSnapshot] = []
+    cursor = None
+    while True:
+        data = client.graphql(
+            OPEN_PULLS_QUERY,
+            {
+                "owner": client.owner,
+                "name": client.repo,
+                "first": GRAPHQL_PULLS_PAGE_SIZE,
+                "cursor": cursor,
+            },
+        )
+        pulls = data["repository"]["pullRequests"]
+        snapshots.extend(pull_snapshot(node) for node in pulls["nodes"])
+        if not pulls["pageInfo"]["hasNextPage"]:
+            return snapshots
+        cursor = pulls["pageInfo"]["endCursor"]
+
+
+def _batches(items: list[T], size: int) -> Iterator[list[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def fetch_blobs(
+    client: GitHubClient, wanted: Iterable[tuple[str, str]]
+) -> dict[tuple[str, str], str | None]:
+    """(path, commit SHA) -> file text, GRAPHQL_BATCH_SIZE aliased `object` lookups per query.
+
+    Results go through the client's content cache; truncated blobs fall back to REST.
+    """
+    contents: dict[tuple[str, str], str | None] = {}
+    missing: list[tuple[str, str]] = []
+    for path, sha in dict.fromkeys(wanted):
+        found, content = client.cache.content(path, sha)
+        if found:
+            contents[(path, sha)] = content
+        else:
+            missing.append((path, sha))
+    for batch in _batches(missing, GRAPHQL_BATCH_SIZE):
+        fields = "\n".join(
+            f"f{i}: object(expression: $e{i}) {{ ... on Blob {{ text isTruncated }} }}"
+            for i in range(len(batch))
+        )
+        declarations = "".join(f", $e{i}: String!" for i in range(len(batch)))
+        query = (
+            f"query Blobs($owner: String!, $name: String!{declarations}) {{\n"
+            f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}"
+        )
+        variables = {f"e{i}": f"{sha}:{path}" for i, (path, sha) in enumerate(batch)}
+        data = client.graphql(query, {"owner": client.owner, "name": client.repo, **variables})
+        for i, (path, sha) in enumerate(batch):
+            blob = data["repository"][f"f{i}"]
+            if blob and blob.get("isTruncated"):
+                content = client.read_file(path, sha)
+            else:
+                content = blob.get("text") if blob else None
+                client.cache.store_content(path, sha, content)
+            contents[(path, sha)] = content
+    return contents
+
+
+def fetch_label_ids(client: GitHubClient) -> dict[str, str]:
+    data = client.graphql(LABELS_QUERY, {"owner": client.owner, "name": client.repo})
+    return {label["name"]: label["id"] for label in data["repository"]["labels"]["nodes"]}
+
+
+def run_mutations(client: GitHubClient, mutations: list[tuple[str, str, dict[str, Any]]]) -> int:
+    """Run (mutation, input type, input) triples as aliased batches, in order.
+
+    GitHub executes the fields of one mutation document serially, top to bottom.
+    Returns the number of requests made.
+    """
+    requests = 0
+    for batch in _batches(mutations, GRAPHQL_BATCH_SIZE):
+        declarations = ", ".join(
+            f"$m{i}: {input_type}!" for i, (_, input_type, _) in enumerate(batch)
+        )
+        fields = "\n".join(
+            f"  m{i}: {name}(input: $m{i}) {{ clientMutationId }}"
+            for i, (name, _, _) in enumerate(batch)
+        )
+        client.graphql(
+            f"mutation Triage({declarations}) {{\n{fields}\n}}",
+            {f"m{i}": mutation_input for i, (_, _, mutation_input) in enumerate(batch)},
+        )
+        requests += 1
+    return requests
+
+
+def triage_open_dependabot_pulls_graphql(client: GitHubClient) -> tuple[int, ...]:
+    """GraphQL variant of `triage_open_dependabot_pulls` for runs over many pull requests.
+
+    Pull requests with their files, labels and comments come from one paginated query, both
+    versions of every changed file from batched blob queries, and all comments and label
+    changes from batched mutations. REST is only used for data GraphQL truncated and for
+    creating missing labels.
+    """
+    snapshots = [
+        snapshot
+        for snapshot in fetch_open_pull_snapshots(client)
+        if is_dependabot_pull_request(snapshot.pull_request)
+    ]
+    actions_pulls = [
+        snapshot
+        for snapshot in snapshots
+        if dependabot_ecosystem(snapshot.pull_request) == GITHUB_ACTIONS_ECOSYSTEM
+    ]
+    for snapshot in actions_pulls:
+        if snapshot.files is None:
+            snapshot.files = client.list_pull_files(int(snapshot.pull_request["number"]))
+    contents = fetch_blobs(
+        client,
+        (
+            pair
+            for snapshot in actions_pulls
+            for file in snapshot.files or []
+            if (base_path := _base_path(file))
+            for pair in (
+                (base_path, snapshot.pull_request["base"]["sha"]),
+                (file["filename"], snapshot.pull_request["head"]["sha"]),
+            )
+        ),
+    )
+
+    desired_by_pull: list[tuple[PullSnapshot, tuple[Label, ...]]] = []
+    for snapshot in snapshots:
+        if dependabot_ecosystem(snapshot.pull_request) == GITHUB_ACTIONS_ECOSYSTEM:
+            classification = classify_action_references(
+                snapshot.files or [],
+                lambda path, ref: contents[(path, ref)],
+                snapshot.pull_request["base"]["sha"],
+                snapshot.pull_request["head"]["sha"],
+            )
+        else:
+            classification = classify_event(snapshot.pull_request, client)
+        desired_by_pull.append((snapshot, desired_labels(classification)))
+
+    label_ids = fetch_label_ids(client)
+    needed = {label for _, desired in desired_by_pull for label in desired}
+    missing = [label for label in TRIAGE_LABELS if label in needed and label.name not in label_ids]
+    if missing:
+        for label in missing:
+            client.ensure_label(label)
+        label_ids = fetch_label_ids(client)
+
+    mutations: list[tuple[str, str, dict[str, Any]]] = []
+    for snapshot, desired in desired_by_pull:
+        pull_number = int(snapshot.pull_request["number"])
+        has_comment = snapshot.has_triage_comment
+        if has_comment is None:
+            has_comment = any(
+                comment.get("user", {}).get("type") == "Bot"
+                and COMMENT_MARKER in comment.get("body", "")
+                for comment in client.list_comments(pull_number)
+            )
+        if not has_comment:
+            mutations.append(
+                (
+                    "addComment",
+                    "AddCommentInput",
+                    {"subjectId": snapshot.node_id, "body": render_comment()},
+                )
+            )
+        current = snapshot.label_names
+        if current is None:
+            current = {label["name"] for label in client.list_issue_labels(pull_number)}
+        desired_names = {label.name for label in desired}
+        stale = [
+            label_ids[label.name]
+            for label in TRIAGE_LABELS
+            if label.name in current - desired_names and label.name in label_ids
+        ]
+        if stale:
+            mutations.append(
+                (
+                    "removeLabelsFromLabelable",
+                    "RemoveLabelsFromLabelableInput",
+                    {"labelableId": snapshot.node_id, "labelIds": stale},
+                )
+            )
+        added = [label_ids[label.name] for label in desired if label.name not in current]
+        if added:
+            mutations.append(
+                (
+                    "addLabelsToLabelable",
+                    "AddLabelsToLabelableInput",
+                    {"labelableId": snapshot.node_id, "labelIds": added},
+                )
+            )
+    run_mutations(client, mutations)
+    return tuple(int(snapshot.pull_request["number"]) for snapshot, _ in desired_by_pull)
 
 
 def _github_actions_error_annotation(error: Exception) -> str:
@@ -473,18 +1123,27 @@ def _github_actions_error_annotation(error: Exception) -> str:
 def main() -> None:
     event_path = Path(os.environ["GITHUB_EVENT_PATH"])
     event = json.loads(event_path.read_text())
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
     destination_client = GitHubClient(
         token=os.environ["GITHUB_TOKEN"],
         repository=os.environ["GITHUB_REPOSITORY"],
         api_url=os.environ.get("GITHUB_API_URL", "https://api.github.com"),
+        cache=ResponseCache(Path(cache_dir) / CACHE_FILE_NAME if cache_dir else None),
     )
     event_name = os.environ["GITHUB_EVENT_NAME"]
-    if event_name == "pull_request_target":
-        triage_event(event, destination_client)
-    elif event_name in {"schedule", "workflow_dispatch"}:
-        triage_open_dependabot_pulls(destination_client)
-    else:
-        raise ValueError(f"unsupported GitHub event: {event_name}")
+    try:
+        if event_name == "pull_request_target":
+            triage_event(event, destination_client)
+        elif event_name in {"schedule", "workflow_dispatch"}:
+            if os.environ.get(BACKEND_ENV) == GRAPHQL_BACKEND:
+                triage_open_dependabot_pulls_graphql(destination_client)
+            else:
+                triage_open_dependabot_pulls(destination_client)
+        else:
+            raise ValueError(f"unsupported GitHub event: {event_name}")
+    finally:
+        destination_client.close()
+        print(destination_client.cache.stats.summary())
 
 
 if __name__ == "__main__":
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
-from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
 
 import pytest
 
@@ -10,10 +18,13 @@ from shared.dependabot_sdlc_triage import (
     COMMENT_MARKER,
     DESTINATION_LABEL,
     MANAGED_LABEL,
+    TRIAGE_LABELS,
     UNSUPPORTED_LABEL,
     ActionClassification,
     ActionReferenceChange,
+    GitHubApiError,
     GitHubClient,
+    ResponseCache,
     classify_action_references,
     dependabot_ecosystem,
     is_dependabot_pull_request,
@@ -56,6 +67,10 @@ class FakeClient:
         self.list_open_pulls_count += 1
         return self.open_pulls
 
+    def iter_open_pulls(self) -> Iterator[dict[str, Any]]:
+        self.list_open_pulls_count += 1
+        return iter(self.open_pulls)
+
     def read_file(self, path: str, ref: str) -> str | None:
         self.reads.append((path, ref))
         return self.contents.get((path, ref))
@@ -85,6 +100,231 @@ class FakeClient:
         self.created_comments.append((pull_number, body))
 
 
+@dataclass
+class RecordedRequest:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+    client_port: int
+    status: int = 0
+
+
+@dataclass
+class FakeGitHubServer:
+    """A local stand-in for the GitHub REST and GraphQL APIs of example/repository."""
+
+    url: str = ""
+    pulls: list[dict[str, Any]] = field(default_factory=list)
+    files: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    contents: dict[tuple[str, str], str] = field(default_factory=dict)
+    labels: dict[int, list[str]] = field(default_factory=dict)
+    comments: dict[int, list[str]] = field(default_factory=dict)
+    # None: every label exists.
+    repo_labels: list[str] | None = None
+    link_last: bool = True
+    mutations: list[dict[str, Any]] = field(default_factory=list)
+    requests: list[RecordedRequest] = field(default_factory=list)
+    delay: float = 0.0
+    rate_limited: int = 0
+    drop_after_response: bool = False
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def respond(self, request: RecordedRequest) -> tuple[int, dict[str, str], Any]:
+        with self.lock:
+            if self.rate_limited:
+                self.rate_limited -= 1
+                return 403, {"Retry-After": "0"}, {"message": "secondary rate limit"}
+        parts = urlsplit(request.path)
+        if parts.path == "/api/graphql":
+            return 200, {}, {"data": self.graphql(json.loads(request.body))}
+        route = parts.path.removeprefix("/api/v3/repos/example/repository")
+        query = parse_qs(parts.query)
+        if request.method == "POST" and route == "/labels" and self.repo_labels is not None:
+            self.repo_labels.append(json.loads(request.body)["name"])
+        if request.method != "GET":
+            return 201, {}, {}
+        if route == "/pulls":
+            return self.page(parts.path, query, self.pulls)
+        if route.startswith("/pulls/"):
+            return 200, {}, self.files.get(int(route.split("/")[2]), [])
+        if route.startswith("/contents/"):
+            key = (unquote(route.removeprefix("/contents/")), query["ref"][0])
+            if key not in self.contents:
+                return 404, {}, {"message": "Not Found"}
+            content = base64.b64encode(self.contents[key].encode()).decode()
+            return 200, {}, {"type": "file", "encoding": "base64", "content": content}
+        if route.startswith("/labels/"):
+            if self.repo_labels is not None and unquote(route[8:]) not in self.repo_labels:
+                return 404, {}, {"message": "Not Found"}
+            return 200, {}, {}
+        if route.startswith("/issues/") and route.endswith("/labels"):
+            return (
+                200,
+                {},
+                [{"name": name} for name in self.labels.get(int(route.split("/")[2]), [])],
+            )
+        if route.startswith("/issues/") and route.endswith("/comments"):
+            bodies = self.comments.get(int(route.split("/")[2]), [])
+            return 200, {}, [{"user": {"type": "Bot"}, "body": body} for body in bodies]
+        return 200, {}, []
+
+    def page(
+        self, path: str, query: dict[str, list[str]], items: list[Any]
+    ) -> tuple[int, dict[str, str], Any]:
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        last = max(1, -(-len(items) // per_page))
+        relations = {"next": page + 1} if page < last else {}
+        if self.link_last and page < last:
+            relations["last"] = last
+        base = {name: values[0] for name, values in query.items() if name != "page"}
+        link = ", ".join(
+            f"<{self.url}{path.removeprefix('/api/v3')}?{urlencode({**base, 'page': number})}>; "
+            f'rel="{rel}"'
+            for rel, number in relations.items()
+        )
+        return 200, {"Link": link} if link else {}, items[(page - 1) * per_page : page * per_page]
+
+    def graphql(self, payload: dict[str, Any]) -> dict[str, Any]:
+        operation = payload["query"].split("(")[0].split()[-1]
+        variables = payload["variables"]
+        if operation == "OpenPulls":
+            start = int(variables["cursor"] or 0)
+            end = start + variables["first"]
+            return {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {"hasNextPage": end < len(self.pulls), "endCursor": str(end)},
+                        "nodes": [self.graphql_pull(pull) for pull in self.pulls[start:end]],
+                    }
+                }
+            }
+        if operation == "Blobs":
+            blobs = {}
+            for name, expression in variables.items():
+                if name.startswith("e"):
+                    sha, path = expression.split(":", 1)
+                    text = self.contents.get((path, sha))
+                    blobs[f"f{name[1:]}"] = text and {"text": text, "isTruncated": False}
+            return {"repository": blobs}
+        if operation == "Labels":
+            names = (
+                [label.name for label in TRIAGE_LABELS]
+                if self.repo_labels is None
+                else self.repo_labels
+            )
+            return {
+                "repository": {"labels": {"nodes": [{"id": f"L_{n}", "name": n} for n in names]}}
+            }
+        assert operation == "Triage"
+        self.mutations.extend(variables[f"m{i}"] for i in range(len(variables)))
+        return {name: {"clientMutationId": None} for name in variables}
+
+    def graphql_pull(self, pull: dict[str, Any]) -> dict[str, Any]:
+        number = pull["number"]
+        login = pull["user"]["login"]
+        change_types = {"added": "ADDED", "modified": "MODIFIED", "removed": "DELETED"}
+        return {
+            "id": f"PR_{number}",
+            "number": number,
+            "title": pull["title"],
+            "url": pull["html_url"],
+            "headRefName": pull["head"]["ref"],
+            "baseRefOid": pull["base"]["sha"],
+            "headRefOid": pull["head"]["sha"],
+            "author": (
+                {"__typename": "Bot", "login": login.removesuffix("[bot]")}
+                if login.endswith("[bot]")
+                else {"__typename": "User", "login": login}
+            ),
+            "files": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [
+                    {"path": f["filename"], "changeType": change_types.get(f["status"], "RENAMED")}
+                    for f in self.files.get(number, [])
+                ],
+            },
+            "labels": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [{"name": name} for name in self.labels.get(number, [])],
+            },
+            "comments": {
+                "pageInfo": {"hasNextPage": False},
+                "nodes": [
+                    {"author": {"__typename": "Bot"}, "body": body}
+                    for body in self.comments.get(number, [])
+                ],
+            },
+        }
+
+    def graphql_operations(self) -> list[str]:
+        return [
+            json.loads(r.body)["query"].split("(")[0].split()[-1]
+            for r in self.requests
+            if r.path == "/api/graphql"
+        ]
+
+
+def _handler(server: FakeGitHubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = RecordedRequest(
+                self.command,
+                self.path,
+                dict(self.headers),
+                self.rfile.read(length),
+                self.client_address[1],
+            )
+            with server.lock:
+                server.requests.append(request)
+                server.in_flight += 1
+                server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+            time.sleep(server.delay)
+            with server.lock:
+                server.in_flight -= 1
+            request.status, headers, payload = server.respond(request)
+            body = json.dumps(payload).encode()
+            if request.method == "GET" and request.status == 200:
+                headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == headers["ETag"]:
+                    request.status, body = 304, b""
+            self.send_response(request.status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if request.status != 304:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            # Close without "Connection: close", like a server dropping an idle keep-alive.
+            self.close_connection = server.drop_after_response
+
+        do_GET = do_POST = do_DELETE = _handle
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def github_server() -> Iterator[FakeGitHubServer]:
+    server = FakeGitHubServer()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _handler(server))
+    httpd.daemon_threads = True
+    server.url = f"http://127.0.0.1:{httpd.server_address[1]}/api/v3"
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    httpd.shutdown()
+    httpd.server_close()
+
+
 def _pull(
     number: int = 42,
     *,
@@ -524,29 +764,329 @@ def test_github_client_rejects_invalid_repository():
     ],
 )
 def test_github_client_only_sends_authorization_when_token_is_set(
+    github_server,
     token,
     expected_authorization,
 ):
-    response = MagicMock()
-    response.__enter__.return_value.read.return_value = b"[]"
-    client = GitHubClient(token, "example/repository")
+    client = GitHubClient(token, "example/repository", api_url=github_server.url)
+
+    client._request("GET", "/pulls")
+
+    request = github_server.requests[0]
+    assert request.headers.get("Authorization") == expected_authorization
+    assert client.pool.timeout == 15
+
+
+def test_github_client_sends_json_content_type_for_payloads(github_server):
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    client._request("POST", "/issues/42/comments", payload={"body": "test"})
+
+    request = github_server.requests[0]
+    assert request.path == "/api/v3/repos/example/repository/issues/42/comments"
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["User-Agent"] == "dependabot-sdlc-triage"
+    assert json.loads(request.body) == {"body": "test"}
+
+
+def test_github_client_reuses_keep_alive_connections(github_server):
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    for _ in range(5):
+        client.list_open_pulls()
+
+    assert client.pool.created == 1
+    assert len({request.client_port for request in github_server.requests}) == 1
+
+
+def test_github_client_retries_on_a_new_connection_when_the_server_closed_it(github_server):
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+    github_server.drop_after_response = True
+
+    assert client.list_open_pulls() == []
+    assert client.list_open_pulls() == []
+
+    assert client.pool.created == 2
+
+
+def test_github_client_waits_out_secondary_rate_limits(github_server):
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+    github_server.rate_limited = 2
+
+    assert client.list_open_pulls() == []
+
+    assert [request.status for request in github_server.requests] == [403, 403, 200]
+
+
+def test_github_client_raises_when_rate_limit_retries_are_exhausted(github_server):
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+    github_server.rate_limited = dependabot_sdlc_triage.RATE_LIMIT_RETRIES + 1
+
+    with pytest.raises(GitHubApiError) as error:
+        client.list_open_pulls()
+
+    assert error.value.status == 403
+
+
+def test_scheduled_triage_reads_concurrently_over_a_bounded_pool(github_server):
+    path = ".github/workflows/ci.yml"
+    for number in (1, 2, 3):
+        github_server.pulls.append(
+            _pull(number, base_sha=f"base-{number}", head_sha=f"head-{number}")
+        )
+        github_server.files[number] = [{"filename": path, "status": "modified"}]
+        github_server.contents[(path, f"base-{number}")] = "steps:\n  - uses: a/b@old\n"
+        github_server.contents[(path, f"head-{number}")] = "steps:\n  - uses: a/b@new\n"
+    github_server.delay = 0.02
+    client = GitHubClient(
+        "token", "example/repository", api_url=github_server.url, max_concurrency=3
+    )
+
+    assert triage_open_dependabot_pulls(client) == (1, 2, 3)
+
+    assert 1 < github_server.peak_in_flight <= 3
+    assert client.pool.created <= 3
+    comments = [
+        r.path for r in github_server.requests if r.method == "POST" and "comments" in r.path
+    ]
+    assert comments == [f"/api/v3/repos/example/repository/issues/{n}/comments" for n in (1, 2, 3)]
+
+
+BASE_SHA = "a" * 40
+
+
+def test_read_file_caches_commit_addressed_contents(github_server):
+    github_server.contents[("ci.yml", BASE_SHA)] = "content"
+    github_server.contents[("ci.yml", "main")] = "branch content"
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    assert [client.read_file("ci.yml", BASE_SHA) for _ in range(3)] == ["content"] * 3
+    assert client.read_file("missing.yml", BASE_SHA) is None
+    assert client.read_file("missing.yml", BASE_SHA) is None
+    assert client.read_file("ci.yml", "main") == "branch content"
+    assert client.read_file("ci.yml", "main") == "branch content"
+
+    assert [r.status for r in github_server.requests] == [200, 404, 200, 304]
+    stats = client.cache.stats
+    assert (stats.content_hits, stats.content_misses) == (3, 2)
+    assert (stats.not_modified, stats.fetched) == (1, 1)
+
+
+def test_listings_are_revalidated_with_etags(github_server):
+    github_server.pulls.append(_pull(1))
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    first = client.list_open_pulls()
+    second = client.list_open_pulls()
+    github_server.pulls.append(_pull(2))
+    third = client.list_open_pulls()
+
+    assert first == second == [_pull(1)]
+    assert [pull["number"] for pull in third] == [1, 2]
+    assert [r.status for r in github_server.requests] == [200, 304, 200]
+    assert github_server.requests[1].headers["If-None-Match"]
+    assert client.cache.stats.summary() == (
+        "GitHub response cache: file contents 0 hits, 0 misses; listings 1 not modified, 2 fetched"
+    )
+
+
+def test_response_cache_persists_entries_used_in_a_run(github_server, tmp_path):
+    cache_path = tmp_path / "cache" / "github-responses.json"
+    github_server.contents[("ci.yml", BASE_SHA)] = "content"
+    github_server.contents[("old.yml", BASE_SHA)] = "old"
+    first = GitHubClient(
+        "token", "example/repository", api_url=github_server.url, cache=ResponseCache(cache_path)
+    )
+    first.read_file("ci.yml", BASE_SHA)
+    first.read_file("old.yml", BASE_SHA)
+    first.list_comments(42)
+    first.close()
+    second = GitHubClient(
+        "token", "example/repository", api_url=github_server.url, cache=ResponseCache(cache_path)
+    )
+    github_server.requests.clear()
+
+    assert second.read_file("ci.yml", BASE_SHA) == "content"
+    assert second.list_comments(42) == []
+    second.close()
+
+    assert [r.status for r in github_server.requests] == [304]
+    stored = json.loads(cache_path.read_text())
+    assert list(stored["contents"]) == [f"{BASE_SHA}:ci.yml"]
+    assert len(stored["etags"]) == 1
+
+
+def test_response_cache_ignores_unreadable_file(tmp_path):
+    cache_path = tmp_path / "github-responses.json"
+    cache_path.write_text("{not json")
+
+    cache = ResponseCache(cache_path)
+
+    assert cache.content("ci.yml", BASE_SHA) == (False, None)
+
+
+def _graphql_scenario(server: FakeGitHubServer) -> None:
+    managed = ".github/workflows/notify-docs-team.yml"
+    destination = ".github/workflows/destination-only.yml"
+    server.pulls = [
+        _pull(42, base_sha=BASE_SHA, head_sha="1" * 40),
+        _pull(43, base_sha=BASE_SHA, head_sha="2" * 40),
+        _pull(44, head_ref="dependabot/pip/requests-2", base_sha=BASE_SHA, head_sha="3" * 40),
+        _pull(45, login="user"),
+    ]
+    server.files = {
+        42: [{"filename": managed, "status": "modified"}],
+        43: [{"filename": destination, "status": "modified"}],
+    }
+    server.contents = {
+        (managed, BASE_SHA): "# path-sync copy -n sdlc\n  - uses: actions/checkout@old\n",
+        (managed, "1" * 40): "# path-sync copy -n sdlc\n  - uses: actions/checkout@new\n",
+        (destination, BASE_SHA): "steps:\n  - uses: example/action@old\n",
+        (destination, "2" * 40): "steps:\n  - uses: example/action@new\n",
+    }
+    server.labels = {42: [DESTINATION_LABEL.name]}
+    server.comments = {42: [COMMENT_MARKER]}
+    server.repo_labels = [DESTINATION_LABEL.name]
+
+
+def test_graphql_triage_batches_reads_and_mutations(github_server):
+    _graphql_scenario(github_server)
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    refreshed = dependabot_sdlc_triage.triage_open_dependabot_pulls_graphql(client)
+
+    assert refreshed == (42, 43, 44)
+    assert github_server.graphql_operations() == [
+        "OpenPulls",
+        "Blobs",
+        "Labels",
+        "Labels",
+        "Triage",
+    ]
+    rest = [
+        (r.method, r.path.split("/repository")[-1])
+        for r in github_server.requests
+        if "/v3/" in r.path
+    ]
+    assert rest == [
+        ("GET", "/labels/dependabot-cluster"),
+        ("POST", "/labels"),
+        ("GET", "/labels/dependabot-unsupported"),
+        ("POST", "/labels"),
+    ]
+    comment = {"subjectId": "PR_43", "body": render_comment()}
+    assert github_server.mutations == [
+        {"labelableId": "PR_42", "labelIds": ["L_dependabot-required"]},
+        {"labelableId": "PR_42", "labelIds": ["L_dependabot-cluster"]},
+        comment,
+        {"labelableId": "PR_43", "labelIds": ["L_dependabot-required"]},
+        {**comment, "subjectId": "PR_44"},
+        {"labelableId": "PR_44", "labelIds": ["L_dependabot-unsupported"]},
+    ]
+    mutation = json.loads(github_server.requests[-1].body)["query"]
+    assert "m0: removeLabelsFromLabelable(input: $m0)" in mutation
+    assert "m1: addLabelsToLabelable(input: $m1)" in mutation
+
+
+def test_graphql_triage_pages_and_falls_back_to_rest_for_renames(github_server, monkeypatch):
+    monkeypatch.setattr(dependabot_sdlc_triage, "GRAPHQL_PULLS_PAGE_SIZE", 1)
+    _graphql_scenario(github_server)
+    github_server.files[43] = [
+        {
+            "filename": ".github/workflows/destination-only.yml",
+            "status": "renamed",
+            "previous_filename": ".github/workflows/old-name.yml",
+        }
+    ]
+    github_server.contents[(".github/workflows/old-name.yml", BASE_SHA)] = (
+        "steps:\n  - uses: example/action@old\n"
+    )
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    assert dependabot_sdlc_triage.triage_open_dependabot_pulls_graphql(client) == (42, 43, 44)
+
+    assert github_server.graphql_operations().count("OpenPulls") == 4
+    assert any(
+        r.path.endswith("/pulls/43/files?per_page=100&page=1") for r in github_server.requests
+    )
+    assert {
+        "labelableId": "PR_43",
+        "labelIds": ["L_dependabot-required"],
+    } in github_server.mutations
+
+
+def test_fetch_blobs_uses_the_content_cache(github_server):
+    github_server.contents[("ci.yml", BASE_SHA)] = "content"
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+    client.read_file("ci.yml", BASE_SHA)
+
+    contents = dependabot_sdlc_triage.fetch_blobs(
+        client, [("ci.yml", BASE_SHA), ("missing.yml", BASE_SHA)]
+    )
+
+    assert contents == {("ci.yml", BASE_SHA): "content", ("missing.yml", BASE_SHA): None}
+    assert github_server.graphql_operations() == ["Blobs"]
+    assert (
+        json.loads(github_server.requests[-1].body)["variables"]["e0"] == f"{BASE_SHA}:missing.yml"
+    )
+
+
+def test_parse_link_header():
+    header = (
+        '<https://api.github.com/repositories/1/pulls?page=2>; rel="next", '
+        '<https://api.github.com/repositories/1/pulls?page=5>; rel="last"'
+    )
+
+    assert dependabot_sdlc_triage.parse_link_header(header) == {
+        "next": "https://api.github.com/repositories/1/pulls?page=2",
+        "last": "https://api.github.com/repositories/1/pulls?page=5",
+    }
+    assert dependabot_sdlc_triage.parse_link_header(None) == {}
+
+
+def _page_numbers(server: FakeGitHubServer) -> list[int]:
+    return [int(parse_qs(urlsplit(r.path).query)["page"][0]) for r in server.requests]
+
+
+def test_pagination_stops_at_the_last_page_without_an_empty_request(github_server):
+    github_server.pulls = [_pull(number) for number in range(200)]
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    pulls = client.list_open_pulls()
+
+    assert [pull["number"] for pull in pulls] == list(range(200))
+    assert _page_numbers(github_server) == [1, 2]
+
+
+def test_pagination_prefetches_remaining_pages_concurrently(github_server):
+    github_server.pulls = [_pull(number) for number in range(450)]
+    github_server.delay = 0.02
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
+
+    pulls = client.list_open_pulls()
+
+    assert [pull["number"] for pull in pulls] == list(range(450))
+    assert sorted(_page_numbers(github_server)) == [1, 2, 3, 4, 5]
+    assert github_server.peak_in_flight > 1
+
 
-    with patch.object(dependabot_sdlc_triage, "urlopen", return_value=response) as mock_urlopen:
-        client._request("GET", "/pulls")
+def test_pagination_follows_next_links_without_a_last_relation(github_server):
+    github_server.pulls = [_pull(number) for number in range(250)]
+    github_server.link_last = False
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
 
-    request = mock_urlopen.call_args.args[0]
-    assert request.get_header("Authorization") == expected_authorization
-    assert mock_urlopen.call_args.kwargs["timeout"] == 15
+    assert len(client.list_open_pulls()) == 250
+    assert _page_numbers(github_server) == [1, 2, 3]
 
 
-def test_github_client_sends_json_content_type_for_payloads():
-    response = MagicMock()
-    response.__enter__.return_value.read.return_value = b"{}"
-    client = GitHubClient("token", "example/repository")
+def test_iter_open_pulls_streams_pages_and_revalidates_them(github_server):
+    github_server.pulls = [_pull(number) for number in range(150)]
+    client = GitHubClient("token", "example/repository", api_url=github_server.url)
 
-    with patch.object(dependabot_sdlc_triage, "urlopen", return_value=response) as mock_urlopen:
-        client._request("POST", "/issues/42/comments", payload={"body": "test"})
+    pulls = client.iter_open_pulls()
+    assert next(pulls)["number"] == 0
+    assert _page_numbers(github_server) == [1]
+    assert len(list(pulls)) == 149
+    assert len(list(client.iter_open_pulls())) == 150
 
-    request = mock_urlopen.call_args.args[0]
-    assert request.get_header("Content-type") == "application/json"
-    assert request.get_header("User-agent") == "dependabot-sdlc-triage"
+    assert [r.status for r in github_server.requests] == [200, 200, 304, 304]
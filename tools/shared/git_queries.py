@@ -0,0 +1,175 @@
+"""Batched, cached git queries for the changelog and release tooling.
+
+Tags come from a single `git for-each-ref` call. Refs, commits, trees and blobs are resolved
+through one long-lived `git cat-file --batch` process, and each merge base is one
+`git merge-base` call keyed on the resolved commit SHAs. Every answer is cached on the
+`GitRepo` instance, so a run asks git about each object at most once. Point `GitRepo` at any
+checkout (e.g. a fixture repository built in a test) to replay the same queries against it.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import functools
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+VERSION_PART_PATTERN = re.compile(r"(\d+)")
+
+
+def version_key(tag: str) -> list[tuple[int, int | str]]:
+    """Sort key ordering digit runs numerically, like `git tag --sort=version:refname`."""
+    return [
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in VERSION_PART_PATTERN.split(tag)
+        if part
+    ]
+
+
+class GitRepo:
+    """Read-only queries against the repository containing `root`."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+        self._objects: dict[str, tuple[str, str, bytes] | None] = {}
+        self._merge_bases: dict[tuple[str, str], str | None] = {}
+
+    def __enter__(self) -> GitRepo:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._process is not None:
+            self._process.stdin.close()  # type: ignore[union-attr]
+            self._process.wait()
+            self._process = None
+
+    @functools.cached_property
+    def tags(self) -> dict[str, str]:
+        """Tag name -> commit SHA (annotated tags peeled), from one for-each-ref call."""
+        result = subprocess.run(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(refname:strip=2) %(objectname) %(*objectname)",
+                "refs/tags",
+            ],
+            cwd=self.root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        tags = {}
+        for line in result.stdout.splitlines():
+            name, sha, *peeled = line.split(" ")
+            tags[name] = peeled[0] if peeled and peeled[0] else sha
+        return tags
+
+    def version_tags(self, pattern: str = "v*.*.*") -> list[str]:
+        """Tags matching `pattern`, newest version first."""
+        matching = [tag for tag in self.tags if fnmatch.fnmatchcase(tag, pattern)]
+        return sorted(matching, key=version_key, reverse=True)
+
+    def _object(self, name: str) -> tuple[str, str, bytes] | None:
+        """(sha, type, contents) for an object name such as `v1.0.0^{commit}` or `sha:path`."""
+        if name in self._objects:
+            return self._objects[name]
+        with self._lock:
+            if self._process is None:
+                self._process = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=self.root,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+            stdin, stdout = self._process.stdin, self._process.stdout
+            assert stdin is not None and stdout is not None
+            try:
+                stdin.write(name.encode() + b"\n")
+                stdin.flush()
+            except BrokenPipeError:
+                # cat-file exited, e.g. outside a repository.
+                header = []
+            else:
+                header = stdout.readline().decode().split()
+            # "<sha> <type> <size>", or "<name> missing" / "<name> ambiguous".
+            if len(header) != 3 or not header[2].isdigit():
+                self._objects[name] = None
+                return None
+            sha, object_type, size = header
+            contents = stdout.read(int(size))
+            stdout.read(1)
+            self._objects[name] = (sha, object_type, contents)
+            return self._objects[name]
+
+    def commit_sha(self, ref: str) -> str | None:
+        """SHA of the commit `ref` points to, or None when it does not resolve."""
+        if "\n" in ref:
+            return None
+        found = self._object(f"{ref}^{{commit}}")
+        return found[0] if found else None
+
+    def path_exists(self, commit: str, path: str) -> bool:
+        """Whether `path` (file or directory) exists in the tree of `commit`."""
+        return self._object(f"{commit}:{path}") is not None
+
+    def tree_entries(self, treeish: str, path: str) -> dict[str, str]:
+        """Name -> object SHA for the tree at `treeish:path`; empty when it does not exist."""
+        found = self._object(f"{treeish}:{path}")
+        if found is None or found[1] != "tree":
+            return {}
+        entries, data, pos = {}, found[2], 0
+        # Binary tree format: "<mode> <name>\0" followed by a 20-byte SHA.
+        while pos < len(data):
+            nul = data.index(b"\0", pos)
+            _, name = data[pos:nul].split(b" ", 1)
+            entries[name.decode()] = data[nul + 1 : nul + 21].hex()
+            pos = nul + 21
+        return entries
+
+    def blob(self, sha: str) -> bytes:
+        found = self._object(sha)
+        if found is None or found[1] != "blob":
+            raise ValueError(f"not a blob: {sha}")
+        return found[2]
+
+    def merge_base(self, ref: str, other: str) -> str | None:
+        """Best common ancestor of two refs, from one `git merge-base` call per pair."""
+        one, two = self.commit_sha(ref), self.commit_sha(other)
+        if one is None or two is None:
+            return None
+        key = (one, two)
+        if key not in self._merge_bases:
+            result = subprocess.run(
+                ["git", "merge-base", one, two],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            # Exit status 1 means the histories share no commit.
+            self._merge_bases[key] = result.stdout.strip() if result.returncode == 0 else None
+        return self._merge_bases[key]
+
+
+def _git_dir_root(start: Path) -> Path:
+    for directory in (start, *start.parents):
+        if (directory / ".git").exists():
+            return directory
+    return start
+
+
+@functools.cache
+def _load(root: Path) -> GitRepo:
+    return GitRepo(root)
+
+
+def load_git_repo(repo_root: Path | None = None) -> GitRepo:
+    """Shared per-process `GitRepo` for the repository containing `repo_root` (default: cwd)."""
+    return _load(_git_dir_root((repo_root or Path.cwd()).resolve()))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import itertools
+import os
+import subprocess
+import types
+from pathlib import Path
+
+import pytest
+
+from changelog import build_changelog
+from release import release_notes
+from shared import git_queries
+from shared.git_queries import GitRepo
+
+
+class FixtureRepo:
+    """A scratch repository with deterministic commit dates."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._dates = itertools.count(1_700_000_000, 60)
+        self.git("init", "-q", "-b", "main")
+
+    def git(self, *args: str) -> str:
+        date = f"{next(self._dates)} +0000"
+        env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "dev",
+            "GIT_AUTHOR_EMAIL": "dev@example.com",
+            "GIT_COMMITTER_NAME": "dev",
+            "GIT_COMMITTER_EMAIL": "dev@example.com",
+            "GIT_AUTHOR_DATE": date,
+            "GIT_COMMITTER_DATE": date,
+        }
+        result = subprocess.run(
+            ["git", *args], cwd=self.root, env=env, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+
+    def commit(self, name: str, path: str = "file.txt") -> str:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(name)
+        self.git("add", path)
+        self.git("commit", "-q", "-m", name)
+        return self.git("rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> FixtureRepo:
+    """main: a - b (v0.9.0) - c (adds .changelog; v1.0.0 annotated) - e - merge of feature.
+
+    feature: c - d. v1.10.0-notes-only tags a. x1 and x2 form a criss-cross off e.
+    """
+    fixture = FixtureRepo(tmp_path)
+    fixture.commit("a")
+    fixture.commit("b")
+    fixture.git("tag", "v0.9.0")
+    fixture.commit("c", ".changelog/1.txt")
+    fixture.git("tag", "-a", "v1.0.0", "-m", "release")
+    fixture.git("tag", build_changelog.CHANGELOG_DIR_CREATED_TAG)
+    fixture.git("tag", "v1.10.0-notes-only", "HEAD~2")
+    fixture.git("checkout", "-q", "-b", "feature")
+    fixture.commit("d")
+    fixture.git("checkout", "-q", "main")
+    fixture.commit("e", "other.txt")
+    fixture.git("merge", "-q", "--no-ff", "-m", "merge", "feature")
+    fixture.git("checkout", "-q", "-b", "x1", "HEAD~1")
+    fixture.commit("x1", "x1.txt")
+    fixture.git("checkout", "-q", "-b", "x2", "main~1")
+    fixture.commit("x2", "x2.txt")
+    fixture.git("merge", "-q", "-m", "x2 merges x1", "x1")
+    fixture.git("checkout", "-q", "x1")
+    fixture.git("merge", "-q", "-m", "x1 merges x2", "x2~1")
+    fixture.git("checkout", "-q", "main")
+    return fixture
+
+
+@pytest.fixture
+def spawned(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Processes started by git_queries (fixture setup is not counted)."""
+    calls: list[list[str]] = []
+
+    def run(args, *a, **kw):
+        calls.append(args)
+        return subprocess.run(args, *a, **kw)
+
+    def popen(args, *a, **kw):
+        calls.append(args)
+        return subprocess.Popen(args, *a, **kw)
+
+    spy = types.SimpleNamespace(**{**vars(subprocess), "run": run, "Popen": popen})
+    monkeypatch.setattr(git_queries, "subprocess", spy)
+    return calls
+
+
+@pytest.fixture
+def cwd_repo(repo: FixtureRepo, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(repo.root)
+    git_queries._load.cache_clear()
+    yield repo
+    git_queries.load_git_repo().close()
+    git_queries._load.cache_clear()
+
+
+def test_queries_match_git_cli(repo: FixtureRepo) -> None:
+    with GitRepo(repo.root) as git:
+        assert git.version_tags() == ["v1.10.0-notes-only", "v1.0.0", "v0.9.0"]
+        assert git.commit_sha("v1.0.0") == repo.git("rev-list", "-n", "1", "v1.0.0")
+        assert git.commit_sha("main~1") == repo.git("rev-parse", "main~1")
+        assert git.commit_sha("missing-ref") is None
+        assert git.path_exists("v1.0.0", ".changelog")
+        assert not git.path_exists("v0.9.0", ".changelog")
+        for one, two in [
+            ("feature", "main"),
+            ("v0.9.0", "main"),
+            ("main", "main"),
+            ("x1", "main"),
+            ("x1", "x2"),
+        ]:
+            assert git.merge_base(one, two) in repo.git("merge-base", "--all", one, two).split()
+        assert git.merge_base("feature", "missing-ref") is None
+
+
+def test_queries_are_batched_and_cached(repo: FixtureRepo, spawned: list[list[str]]) -> None:
+    with GitRepo(repo.root) as git:
+        for _ in range(2):
+            git.version_tags()
+            sha = git.commit_sha("v1.0.0")
+            git.path_exists(sha, ".changelog")
+            git.merge_base("feature", "main")
+            git.merge_base("x1", "x2")
+
+    assert [call[:2] for call in spawned] == [
+        ["git", "for-each-ref"],
+        ["git", "cat-file"],
+        ["git", "merge-base"],
+        ["git", "merge-base"],
+    ]
+
+
+def test_changelog_and_release_helpers_use_fixture_repo(
+    cwd_repo: FixtureRepo, spawned: list[list[str]]
+) -> None:
+    assert build_changelog.determine_last_release() == cwd_repo.git("rev-parse", "v1.0.0^{}")
+    assert release_notes.get_previous_tag("v1.10.0-notes-only") == "v1.0.0"
+    assert release_notes.get_merge_base("feature") == cwd_repo.git("merge-base", "feature", "main")
+    assert len(spawned) == 3
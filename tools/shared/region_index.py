@@ -0,0 +1,127 @@
+"""O(1) Atlas <-> cloud provider region lookups from the index written by dev.extract_regions.
+
+Index layout (JSON), per provider (AWS, AZURE, GCP):
+    regions:            every Atlas region name, sorted; position i is bit i of a bitset
+    atlas_to_provider:  Atlas region -> provider region, valid mappings only
+    provider_to_atlas:  reverse of atlas_to_provider
+    instance_sizes:     instance size -> hex bitset of the regions it is available in
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+INDEX_SCHEMA = 1
+
+
+@dataclass(frozen=True)
+class ProviderRegions:
+    regions: tuple[str, ...]
+    atlas_to_provider: Mapping[str, str]
+    provider_to_atlas: Mapping[str, str]
+    instance_sizes: Mapping[str, int]
+    positions: Mapping[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        positions = {region: i for i, region in enumerate(self.regions)}
+        object.__setattr__(self, "positions", positions)
+
+    def to_atlas(self, region: str) -> str | None:
+        """Normalize either format to the Atlas region, None when unknown."""
+        if region in self.atlas_to_provider:
+            return region
+        return self.provider_to_atlas.get(region)
+
+    def is_available(self, instance_size: str, region: str) -> bool:
+        atlas_region = self.to_atlas(region) or region
+        position = self.positions.get(atlas_region)
+        bits = self.instance_sizes.get(instance_size)
+        if position is None or bits is None:
+            return False
+        return bool(bits >> position & 1)
+
+    def available_regions(self, instance_size: str) -> list[str]:
+        bits = self.instance_sizes.get(instance_size, 0)
+        return [region for i, region in enumerate(self.regions) if bits >> i & 1]
+
+
+@dataclass(frozen=True)
+class RegionIndex:
+    providers: Mapping[str, ProviderRegions]
+
+    def provider(self, provider: str) -> ProviderRegions:
+        try:
+            return self.providers[provider.upper()]
+        except KeyError:
+            raise KeyError(f"provider {provider!r} not in region index") from None
+
+    def to_atlas(self, provider: str, region: str) -> str | None:
+        return self.provider(provider).to_atlas(region)
+
+    def to_provider(self, provider: str, region: str) -> str | None:
+        regions = self.provider(provider)
+        atlas_region = regions.to_atlas(region)
+        return regions.atlas_to_provider.get(atlas_region) if atlas_region else None
+
+    def is_available(self, provider: str, instance_size: str, region: str) -> bool:
+        return self.provider(provider).is_available(instance_size, region)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RegionIndex:
+        if data.get("schema") != INDEX_SCHEMA:
+            raise ValueError(f"unsupported region index schema: {data.get('schema')}")
+        return cls(
+            providers={
+                provider: ProviderRegions(
+                    regions=tuple(entry["regions"]),
+                    atlas_to_provider=entry["atlas_to_provider"],
+                    provider_to_atlas=entry["provider_to_atlas"],
+                    instance_sizes={
+                        size: int(bits, 16) for size, bits in entry["instance_sizes"].items()
+                    },
+                )
+                for provider, entry in data["providers"].items()
+            }
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> RegionIndex:
+        return cls.from_dict(json.loads(path.read_text()))
+
+
+def build_region_index(
+    instance_size_regions: dict[str, dict[str, set[str]]],
+    mappings: dict[str, dict[str, dict]],
+) -> dict:
+    """Index data from per-provider instance size regions and validated mappings.
+
+    Args:
+        instance_size_regions: provider -> instance size -> Atlas regions it is available in
+        mappings: provider -> Atlas region -> {provider_region, valid}
+    """
+    providers = {}
+    for provider, provider_mappings in sorted(mappings.items()):
+        sizes = instance_size_regions.get(provider, {})
+        regions = sorted(set(provider_mappings).union(*sizes.values()))
+        positions = {region: i for i, region in enumerate(regions)}
+        atlas_to_provider = {
+            region: info["provider_region"]
+            for region, info in sorted(provider_mappings.items())
+            if info["valid"]
+        }
+        bitsets = {}
+        for size, size_regions in sorted(sizes.items()):
+            bits = 0
+            for region in size_regions:
+                bits |= 1 << positions[region]
+            bitsets[size] = hex(bits)
+        providers[provider] = {
+            "regions": regions,
+            "atlas_to_provider": atlas_to_provider,
+            "provider_to_atlas": {v: k for k, v in atlas_to_provider.items()},
+            "instance_sizes": bitsets,
+        }
+    return {"schema": INDEX_SCHEMA, "providers": providers}
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from shared.region_index import RegionIndex, build_region_index
+
+MAPPINGS = {
+    "AWS": {
+        "EU_WEST_1": {"provider_region": "eu-west-1", "valid": True},
+        "US_EAST_1": {"provider_region": "us-east-1", "valid": True},
+        "US_GOV_1": {"provider_region": "us-gov-1", "valid": False},
+    }
+}
+SIZES = {"AWS": {"M10": {"US_EAST_1", "EU_WEST_1"}, "M200": {"US_EAST_1", "US_GOV_1"}}}
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> RegionIndex:
+    path = tmp_path / "region_index.json"
+    path.write_text(json.dumps(build_region_index(SIZES, MAPPINGS)))
+    return RegionIndex.load(path)
+
+
+def test_forward_and_reverse_lookups(index: RegionIndex):
+    assert index.to_provider("aws", "US_EAST_1") == "us-east-1"
+    assert index.to_provider("aws", "us-east-1") == "us-east-1"
+    assert index.to_atlas("AWS", "eu-west-1") == "EU_WEST_1"
+    assert index.to_atlas("aws", "US_GOV_1") is None
+    assert index.to_provider("aws", "moon-1") is None
+
+
+def test_instance_size_availability(index: RegionIndex):
+    assert index.is_available("aws", "M10", "eu-west-1")
+    assert not index.is_available("aws", "M200", "EU_WEST_1")
+    assert index.is_available("aws", "M200", "US_GOV_1")
+    assert not index.is_available("aws", "M999", "US_EAST_1")
+    assert index.provider("aws").available_regions("M200") == ["US_EAST_1", "US_GOV_1"]
+
+
+def test_unknown_provider_and_schema(index: RegionIndex):
+    with pytest.raises(KeyError, match="gcp"):
+        index.to_atlas("gcp", "us-central1")
+    with pytest.raises(ValueError, match="schema"):
+        RegionIndex.from_dict({"schema": 99, "providers": {}})
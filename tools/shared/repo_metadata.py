@@ -0,0 +1,140 @@
+"""Repository metadata (remote URL, registry source, module name) resolved once per process.
+
+The remote URL comes from a single `git config` call that lists every remote, memoized per
+repository root. Set `REPO_METADATA_CACHE` to a file path to also persist it across processes;
+the entry is reused while `.git/config` keeps the same mtime.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+CACHE_ENV_VAR = "REPO_METADATA_CACHE"
+# Checked in order; the first configured remote wins.
+REMOTES = ("origin", "upstream")
+REMOTE_URL_PATTERN = re.compile(r"^remote\.(?P<name>\S+)\.url (?P<url>.+)$", re.MULTILINE)
+REPO_NAME_PATTERN = re.compile(r"^terraform-(?P<provider>[^-]+)-(?P<module>.+)$")
+
+
+def parse_github_repo(remote_url: str) -> tuple[str, str]:
+    remote_url = remote_url.removesuffix(".git")
+    if remote_url.startswith("git@github.com:"):
+        path = remote_url.replace("git@github.com:", "")
+    elif "github.com/" in remote_url:
+        path = remote_url.split("github.com/")[1]
+    else:
+        raise ValueError(f"Not a GitHub URL: {remote_url}")
+    parts = path.split("/")
+    if len(parts) != 2:
+        raise ValueError(f"Invalid GitHub repository path: {path}")
+    return parts[0], parts[1]
+
+
+def parse_repo_name(repo_name: str) -> tuple[str, str]:
+    if not (match := REPO_NAME_PATTERN.match(repo_name)):
+        msg = f"Repository '{repo_name}' doesn't match pattern: terraform-{{provider}}-{{module}}"
+        raise ValueError(msg)
+    return match.group("provider"), match.group("module")
+
+
+def compute_registry_source(owner: str, repo_name: str) -> str:
+    provider, module_name = parse_repo_name(repo_name)
+    return f"{owner}/{module_name}/{provider}"
+
+
+@dataclass(frozen=True)
+class RepoMetadata:
+    remote_url: str
+
+    @property
+    def owner(self) -> str:
+        return parse_github_repo(self.remote_url)[0]
+
+    @property
+    def repo_name(self) -> str:
+        return parse_github_repo(self.remote_url)[1]
+
+    @property
+    def github_url(self) -> str:
+        return f"https://github.com/{self.owner}/{self.repo_name}"
+
+    @property
+    def registry_source(self) -> str:
+        return compute_registry_source(self.owner, self.repo_name)
+
+    @property
+    def module_name(self) -> str:
+        """HCL-safe module name (hyphens replaced with underscores)."""
+        _, module = parse_repo_name(self.repo_name)
+        return module.replace("-", "_")
+
+
+def git_config_path(repo_root: Path) -> Path | None:
+    for directory in (repo_root, *repo_root.parents):
+        config = directory / ".git" / "config"
+        if config.is_file():
+            return config
+    return None
+
+
+def read_remote_url(repo_root: Path) -> str:
+    result = subprocess.run(
+        ["git", "config", "--get-regexp", r"^remote\..*\.url$"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+    remotes = {m.group("name"): m.group("url") for m in REMOTE_URL_PATTERN.finditer(result.stdout)}
+    for remote in REMOTES:
+        if remote in remotes:
+            return remotes[remote].strip()
+    raise subprocess.CalledProcessError(
+        1, "git remote get-url", "No upstream or origin remote found"
+    )
+
+
+def _cached_remote_url(cache_file: Path, config: Path) -> str | None:
+    try:
+        entry = json.loads(cache_file.read_text())
+    except OSError, ValueError:
+        return None
+    if entry.get("git_config") != str(config) or entry.get("mtime_ns") != config.stat().st_mtime_ns:
+        return None
+    return entry.get("remote_url")
+
+
+@functools.cache
+def _load(repo_root: Path, cache_file: Path | None) -> RepoMetadata:
+    config = git_config_path(repo_root)
+    if cache_file is not None and config is not None:
+        if remote_url := _cached_remote_url(cache_file, config):
+            return RepoMetadata(remote_url)
+    metadata = RepoMetadata(read_remote_url(repo_root))
+    if cache_file is not None and config is not None:
+        entry = {
+            "git_config": str(config),
+            "mtime_ns": config.stat().st_mtime_ns,
+            "remote_url": metadata.remote_url,
+        }
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(entry, indent=2) + "\n")
+    return metadata
+
+
+def load_repo_metadata(
+    repo_root: Path | None = None, cache_file: Path | None = None
+) -> RepoMetadata:
+    """Metadata for the repository containing `repo_root` (default: the working directory).
+
+    Raises subprocess.CalledProcessError when neither `origin` nor `upstream` is configured.
+    """
+    repo_root = (repo_root or Path.cwd()).resolve()
+    if cache_file is None and (env_path := os.environ.get(CACHE_ENV_VAR)):
+        cache_file = Path(env_path)
+    return _load(repo_root, cache_file)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from shared import repo_metadata
+from shared.repo_metadata import RepoMetadata, load_repo_metadata
+
+
+@pytest.fixture(autouse=True)
+def clear_memo(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(repo_metadata.CACHE_ENV_VAR, raising=False)
+    repo_metadata._load.cache_clear()
+    yield
+    repo_metadata._load.cache_clear()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    add_remote(repo, "upstream", "https://github.com/upstream-org/terraform-mongodbatlas-other")
+    add_remote(repo, "origin", "git@github.com:org/terraform-mongodbatlas-cluster-x.git")
+    return repo
+
+
+def add_remote(repo: Path, name: str, url: str) -> None:
+    subprocess.run(["git", "-C", str(repo), "remote", "add", name, url], check=True)
+
+
+@pytest.fixture
+def git_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+    real_run = subprocess.run
+
+    def run(args, *a, **kw):
+        if args[:2] == ["git", "config"]:
+            calls.append(args)
+        return real_run(args, *a, **kw)
+
+    monkeypatch.setattr(repo_metadata.subprocess, "run", run)
+    return calls
+
+
+def test_metadata_derived_from_origin():
+    metadata = RepoMetadata("git@github.com:org/terraform-mongodbatlas-cluster-x.git")
+    assert metadata.github_url == "https://github.com/org/terraform-mongodbatlas-cluster-x"
+    assert metadata.registry_source == "org/cluster-x/mongodbatlas"
+    assert metadata.module_name == "cluster_x"
+
+
+def test_one_git_call_per_process(git_repo: Path, git_calls: list[list[str]]):
+    metadata = load_repo_metadata(git_repo / "sub" / "..")
+    assert load_repo_metadata(git_repo) is metadata
+    assert metadata.registry_source == "org/cluster-x/mongodbatlas"
+    assert len(git_calls) == 1
+
+
+def test_upstream_used_without_origin(git_repo: Path):
+    subprocess.run(["git", "-C", str(git_repo), "remote", "remove", "origin"], check=True)
+    assert load_repo_metadata(git_repo).repo_name == "terraform-mongodbatlas-other"
+
+
+def test_missing_remotes_raise(tmp_path: Path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    with pytest.raises(subprocess.CalledProcessError):
+        load_repo_metadata(tmp_path)
+
+
+def test_disk_cache_keyed_on_git_config_mtime(
+    git_repo: Path, git_calls: list[list[str]], tmp_path: Path
+):
+    cache_file = tmp_path / "cache" / "repo_metadata.json"
+    load_repo_metadata(git_repo, cache_file)
+    repo_metadata._load.cache_clear()
+
+    assert load_repo_metadata(git_repo, cache_file).module_name == "cluster_x"
+    assert len(git_calls) == 1
+
+    add_remote(git_repo, "fork", "https://github.com/me/terraform-mongodbatlas-cluster-x")
+    config = git_repo / ".git" / "config"
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    repo_metadata._load.cache_clear()
+
+    load_repo_metadata(git_repo, cache_file)
+    assert len(git_calls) == 2
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import posixpath
+import re
+from pathlib import Path
+
+# `source = "./x"`, `source = "../.."`; registry and git sources are not local directories.
+LOCAL_MODULE_SOURCE_PATTERN = re.compile(r'^\s*source\s*=\s*"(\.\.?(?:/[^"]*)?)"', re.MULTILINE)
+MODULE_BLOCK_PATTERN = re.compile(r'^\s*module\s+"([^"]+)"\s*\{', re.MULTILINE)
+SOURCE_PATTERN = re.compile(r'^\s*source\s*=\s*"([^"]*)"', re.MULTILINE)
+REQUIRED_PROVIDERS_PATTERN = re.compile(r"^\s*required_providers\s*\{", re.MULTILINE)
+PROVIDER_ENTRY_PATTERN = re.compile(r"([\w-]+)\s*=\s*\{([^{}]*)\}")
+VERSION_PATTERN = re.compile(r'^\s*version\s*=\s*"([^"]*)"', re.MULTILINE)
+# Terraform's module manifest, read by `validate` to locate installed module calls.
+MODULES_MANIFEST = Path(".terraform/modules/modules.json")
+
+
+def local_module_dirs(root: Path) -> list[Path]:
+    """Return root and every local module directory it references, transitively, sorted."""
+    visited: set[Path] = set()
+    pending = [root.resolve()]
+    while pending:
+        module_dir = pending.pop()
+        if module_dir in visited or not module_dir.is_dir():
+            continue
+        visited.add(module_dir)
+        for tf_file in module_dir.glob("*.tf"):
+            for source in LOCAL_MODULE_SOURCE_PATTERN.findall(tf_file.read_text()):
+                pending.append((module_dir / source).resolve())
+    return sorted(visited)
+
+
+def _block_body(text: str, open_brace: int) -> str:
+    depth = 0
+    for i in range(open_brace, len(text)):
+        if text[i] == "{":
+            depth += 1
+        elif text[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return text[open_brace + 1 : i]
+    return text[open_brace + 1 :]
+
+
+def module_calls(module_dir: Path) -> list[tuple[str, str]]:
+    """(name, source) of every `module` block in module_dir, sorted by name."""
+    calls = []
+    for tf_file in module_dir.glob("*.tf"):
+        text = tf_file.read_text()
+        for match in MODULE_BLOCK_PATTERN.finditer(text):
+            source = SOURCE_PATTERN.search(_block_body(text, match.end() - 1))
+            calls.append((match.group(1), source.group(1) if source else ""))
+    return sorted(calls)
+
+
+def _is_local_source(source: str) -> bool:
+    return source in (".", "..") or source.startswith(("./", "../"))
+
+
+def module_manifest(root: Path) -> dict | None:
+    """Build the `.terraform/modules/modules.json` that `terraform init` writes for root.
+
+    Returns None when any module call (transitively) is not a local directory, since those
+    need `terraform init` to download them.
+    """
+    entries = [{"Key": "", "Source": "", "Dir": "."}]
+    pending = [("", ".")]
+    while pending:
+        key_prefix, rel_dir = pending.pop()
+        for name, source in module_calls(root / rel_dir):
+            if not _is_local_source(source):
+                return None
+            key = f"{key_prefix}.{name}" if key_prefix else name
+            module_dir = posixpath.normpath(posixpath.join(rel_dir, source))
+            entries.append({"Key": key, "Source": source, "Dir": module_dir})
+            pending.append((key, module_dir))
+    return {"Modules": sorted(entries, key=lambda e: e["Key"])}
+
+
+def write_module_manifest(work_dir: Path, manifest: dict) -> None:
+    path = work_dir / MODULES_MANIFEST
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest))
+
+
+def provider_requirements(module_dirs: list[Path]) -> dict[str, tuple[str, list[str]]]:
+    """Merge `required_providers` entries: local name -> (source, distinct version constraints)."""
+    requirements: dict[str, tuple[str, list[str]]] = {}
+    for module_dir in module_dirs:
+        for tf_file in sorted(module_dir.glob("*.tf")):
+            text = tf_file.read_text()
+            for match in REQUIRED_PROVIDERS_PATTERN.finditer(text):
+                body = _block_body(text, match.end() - 1)
+                for name, entry in PROVIDER_ENTRY_PATTERN.findall(body):
+                    source_match = SOURCE_PATTERN.search(entry)
+                    source = source_match.group(1) if source_match else f"hashicorp/{name}"
+                    _, constraints = requirements.setdefault(name, (source, []))
+                    version = VERSION_PATTERN.search(entry)
+                    if version and version.group(1) not in constraints:
+                        constraints.append(version.group(1))
+    return requirements
+
+
+def render_required_providers(requirements: dict[str, tuple[str, list[str]]]) -> str:
+    """A `terraform` block requiring every provider with all constraints combined."""
+    lines = ["terraform {", "  required_providers {"]
+    for name, (source, constraints) in sorted(requirements.items()):
+        lines.append(f"    {name} = {{")
+        lines.append(f'      source  = "{source}"')
+        if constraints:
+            lines.append(f'      version = "{", ".join(constraints)}"')
+        lines.append("    }")
+    lines += ["  }", "}", ""]
+    return "\n".join(lines)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+
+from shared import tf_modules
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_module_manifest_nested_local_modules(tmp_path: Path):
+    _write(tmp_path / "main.tf", 'module "sub" {\n  source = "./modules/sub"\n  x = { a = 1 }\n}\n')
+    _write(tmp_path / "modules" / "sub" / "main.tf", 'module "leaf" {\n  source = "../leaf"\n}\n')
+    _write(tmp_path / "modules" / "leaf" / "main.tf", "# leaf\n")
+
+    assert tf_modules.module_manifest(tmp_path) == {
+        "Modules": [
+            {"Key": "", "Source": "", "Dir": "."},
+            {"Key": "sub", "Source": "./modules/sub", "Dir": "modules/sub"},
+            {"Key": "sub.leaf", "Source": "../leaf", "Dir": "modules/leaf"},
+        ]
+    }
+
+
+def test_module_manifest_registry_source_needs_init(tmp_path: Path):
+    _write(tmp_path / "main.tf", 'module "vpc" {\n  source = "terraform-aws-modules/vpc/aws"\n}\n')
+    assert tf_modules.module_manifest(tmp_path) is None
+
+
+def test_provider_requirements_merges_constraints(tmp_path: Path):
+    _write(
+        tmp_path / "a" / "versions.tf",
+        textwrap.dedent("""\
+            terraform {
+              required_providers {
+                mongodbatlas = {
+                  source  = "mongodb/mongodbatlas"
+                  version = "~> 2.12"
+                }
+                random = {
+                  source = "hashicorp/random"
+                }
+              }
+            }
+        """),
+    )
+    _write(
+        tmp_path / "b" / "versions.tf",
+        textwrap.dedent("""\
+            terraform {
+              required_providers {
+                mongodbatlas = {
+                  source  = "mongodb/mongodbatlas"
+                  version = ">= 2.0"
+                }
+              }
+              required_version = ">= 1.10"
+            }
+        """),
+    )
+
+    requirements = tf_modules.provider_requirements([tmp_path / "a", tmp_path / "b"])
+
+    assert requirements == {
+        "mongodbatlas": ("mongodb/mongodbatlas", ["~> 2.12", ">= 2.0"]),
+        "random": ("hashicorp/random", []),
+    }
+    rendered = tf_modules.render_required_providers(requirements)
+    assert 'version = "~> 2.12, >= 2.0"' in rendered
+    assert 'source  = "hashicorp/random"' in rendered
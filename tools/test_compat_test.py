@@ -1,45 +1,239 @@
+import json
+import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
+import pytest
+
+from dev import test_compat
 from dev.test_compat import TestJob as CompatJob
 from dev.test_compat import TestResult as CompatResult
-from dev.test_compat import run_validate
+from dev.test_compat import (
+    estimate_cost,
+    estimate_makespan,
+    format_histogram,
+    job_cache_key,
+    link_warm_providers,
+    prepare_work_dir,
+    schedule_jobs,
+    write_json_report,
+    write_junit_report,
+)
+
+
+def _fake_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "modules" / "sub").mkdir(parents=True)
+    (repo / "main.tf").write_text('resource "x" "y" {}\n' * 10)
+    (repo / "modules" / "sub" / "main.tf").write_text("# sub\n")
+    example = repo / "examples" / "01_basic"
+    (example / "modules" / "wrapper").mkdir(parents=True)
+    (example / "main.tf").write_text('module "m" {\n  source = "../.."\n}\n')
+    (example / "modules" / "wrapper" / "main.tf").write_text("# wrapper\n")
+    (example / ".terraform").mkdir()
+    (example / "terraform.tfstate").write_text("{}")
+    return repo
+
+
+def test_prepare_work_dir_root(tmp_path: Path):
+    repo = _fake_repo(tmp_path)
+    work_root = tmp_path / "work"
+    work_root.mkdir()
+
+    work_dir = prepare_work_dir(repo, work_root, repo_root=repo)
+
+    assert work_dir == work_root
+    assert (work_dir / "main.tf").read_text() == (repo / "main.tf").read_text()
+    assert (work_dir / "modules" / "sub" / "main.tf").exists()
+    assert not (work_dir / "examples").exists()
+
+
+def test_prepare_work_dir_example_keeps_relative_sources(tmp_path: Path):
+    repo = _fake_repo(tmp_path)
+    work_root = tmp_path / "work"
+    work_root.mkdir()
+
+    work_dir = prepare_work_dir(repo / "examples" / "01_basic", work_root, repo_root=repo)
+
+    assert work_dir == work_root / "examples" / "01_basic"
+    assert (work_dir / "../../main.tf").exists()
+    assert (work_dir / "modules" / "wrapper" / "main.tf").exists()
+    assert not (work_dir / ".terraform").exists()
+    assert not (work_dir / "terraform.tfstate").exists()
+
+
+def test_schedule_jobs_slowest_target_first(tmp_path: Path):
+    repo = _fake_repo(tmp_path)
+    example = repo / "examples" / "01_basic"
+    assert estimate_cost(repo) > estimate_cost(example)
+
+    jobs = schedule_jobs(["1.10", "1.11"], [example, repo])
+
+    assert jobs == [
+        CompatJob(version="1.10", target=repo),
+        CompatJob(version="1.11", target=repo),
+        CompatJob(version="1.10", target=example),
+        CompatJob(version="1.11", target=example),
+    ]
+
+
+def test_job_cache_key_tracks_referenced_modules(tmp_path: Path):
+    repo = _fake_repo(tmp_path)
+    warm_dir = tmp_path / "warm"
+    warm_dir.mkdir()
+    (warm_dir / ".terraform.lock.hcl").write_text('provider "x" { version = "1.0.0" }\n')
+    job = CompatJob(version="1.10", target=repo / "examples" / "01_basic")
+    baseline = job_cache_key(job, warm_dir, repo_root=repo)
+
+    (repo / "examples" / "01_basic" / "README.md").write_text("docs only\n")
+    (repo / "examples" / "01_basic" / ".terraform.lock.hcl").write_text("# untracked\n")
+    assert job_cache_key(job, warm_dir, repo_root=repo) == baseline
+    other_version = CompatJob(version="1.11", target=job.target)
+    assert job_cache_key(other_version, warm_dir, repo_root=repo) != baseline
+
+    (repo / "main.tf").write_text('resource "x" "z" {}\n')
+    assert job_cache_key(job, warm_dir, repo_root=repo) != baseline
+
+
+def test_job_cache_key_tracks_resolved_providers(tmp_path: Path):
+    repo = _fake_repo(tmp_path)
+    warm_dir = tmp_path / "warm"
+    warm_dir.mkdir()
+    job = CompatJob(version="1.10", target=repo)
+
+    assert job_cache_key(job, None, repo_root=repo) is None
+    assert job_cache_key(job, warm_dir, repo_root=repo) is None
+
+    (warm_dir / ".terraform.lock.hcl").write_text('provider "x" { version = "1.0.0" }\n')
+    baseline = job_cache_key(job, warm_dir, repo_root=repo)
+    (warm_dir / ".terraform.lock.hcl").write_text('provider "x" { version = "1.1.0" }\n')
+    assert job_cache_key(job, warm_dir, repo_root=repo) != baseline
 
-MODULE = run_validate.__module__
 
+def test_main_reports_cached_passes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    repo = _fake_repo(tmp_path)
+    versions_file = tmp_path / "versions.yaml"
+    versions_file.write_text('versions: ["1.10", "1.11"]\n')
+    monkeypatch.setattr(test_compat, "VERSIONS_FILE", versions_file)
+    monkeypatch.setattr(test_compat, "CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(test_compat, "discover_targets", lambda: [repo])
+    monkeypatch.setattr(test_compat, "preinstall_versions", lambda _: True)
+    monkeypatch.setattr(test_compat, "prewarm_versions", lambda *_: {})
+    monkeypatch.setattr(test_compat, "job_cache_key", lambda job, _: job.version)
+    ran: list[str] = []
 
-def test_run_validate_bypasses_lock_for_temp_dir():
-    target_lock = MagicMock()
-    job = CompatJob(
-        version="1.15",
-        target=Path("/repo/repo"),
-        use_temp_dir=True,
-        target_lock=target_lock,
+    def fake_run_validate(job: CompatJob, warm_dir: Path | None) -> CompatResult:
+        ran.append(job.version)
+        return CompatResult(version=job.version, target="root", passed=True, output="")
+
+    monkeypatch.setattr(test_compat, "run_validate", fake_run_validate)
+
+    assert test_compat.main([]) == 0
+    assert sorted(ran) == ["1.10", "1.11"]
+    assert test_compat.main([]) == 0
+    assert len(ran) == 2
+    assert test_compat.main(["--no-cache"]) == 0
+    assert len(ran) == 4
+
+
+RESULTS = [
+    CompatResult("1.10", "root", True, "", init_seconds=4.0, validate_seconds=1.0),
+    CompatResult("1.10", "01_basic", False, "Error: bad", init_seconds=1.0, validate_seconds=1.0),
+    CompatResult("1.11", "root", True, "", cached=True),
+]
+
+
+def test_estimate_makespan():
+    assert estimate_makespan([5.0, 3.0, 2.0], workers=1) == 10.0
+    assert estimate_makespan([5.0, 3.0, 2.0], workers=2) == 5.0
+    assert estimate_makespan([5.0, 3.0, 2.0], workers=8) == 5.0
+
+
+def test_format_histogram_skips_cached_and_sorts_slowest_first():
+    lines = format_histogram("Per-target latency", RESULTS, lambda r: r.target)
+    assert len(lines) == 3
+    assert lines[1].split()[0] == "root"
+    assert "5.0 /   5.0 /   5.0" in lines[1]
+    assert lines[2].split()[0] == "01_basic"
+
+
+def test_write_reports(tmp_path: Path):
+    write_json_report(tmp_path / "compat.json", RESULTS, wall_seconds=6.0)
+    report = json.loads((tmp_path / "compat.json").read_text())
+    assert report["wall_seconds"] == 6.0
+    assert report["results"][0]["duration"] == 5.0
+    assert report["results"][2]["cached"] is True
+
+    write_junit_report(tmp_path / "compat.xml", RESULTS)
+    suites = ET.parse(tmp_path / "compat.xml").getroot()
+    assert [s.get("name") for s in suites] == ["terraform-1.10", "terraform-1.11"]
+    assert suites[0].get("failures") == "1"
+    failure = suites[0].find("testcase[@name='01_basic']/failure")
+    assert failure is not None and failure.text == "Error: bad"
+
+
+def _warm_dir(tmp_path: Path) -> Path:
+    warm_dir = tmp_path / "warm"
+    (warm_dir / ".terraform" / "providers" / "registry.terraform.io").mkdir(parents=True)
+    (warm_dir / ".terraform.lock.hcl").write_text("# lock\n")
+    return warm_dir
+
+
+def test_link_warm_providers_writes_module_manifest(tmp_path: Path):
+    repo = _fake_repo(tmp_path)
+    work_root = tmp_path / "work"
+    work_root.mkdir()
+    work_dir = prepare_work_dir(repo / "examples" / "01_basic", work_root, repo_root=repo)
+
+    assert link_warm_providers(work_dir, _warm_dir(tmp_path))
+
+    assert (work_dir / ".terraform" / "providers" / "registry.terraform.io").is_dir()
+    assert (work_dir / ".terraform.lock.hcl").read_text() == "# lock\n"
+    manifest = json.loads((work_dir / ".terraform" / "modules" / "modules.json").read_text())
+    assert manifest["Modules"] == [
+        {"Key": "", "Source": "", "Dir": "."},
+        {"Key": "m", "Source": "../..", "Dir": "../.."},
+    ]
+
+
+def test_run_validate_fast_path_skips_init(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    repo = _fake_repo(tmp_path)
+    monkeypatch.setattr(
+        test_compat, "prepare_work_dir", lambda t, w: prepare_work_dir(t, w, repo_root=repo)
     )
-    expected = CompatResult(version="1.15", target="root", passed=True, output="")
+    commands: list[list[str]] = []
+
+    def fake_run(cmd: list[str], **_) -> subprocess.CompletedProcess:
+        commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    job = CompatJob(version="1.10", target=repo / "examples" / "01_basic")
 
-    with patch(f"{MODULE}._run_validate", return_value=expected) as mock_run:
-        result = run_validate(job)
+    result = test_compat.run_validate(job, _warm_dir(tmp_path))
 
-    assert result == expected
-    mock_run.assert_called_once_with(job)
-    target_lock.__enter__.assert_not_called()
+    assert result.passed
+    assert [cmd[-1] for cmd in commands] == ["validate"]
 
 
-def test_run_validate_locks_in_place_target():
-    target_lock = MagicMock()
-    job = CompatJob(
-        version="1.15",
-        target=Path("/repo/examples/example"),
-        use_temp_dir=False,
-        target_lock=target_lock,
+def test_run_validate_confirms_fast_path_failure_with_init(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    repo = _fake_repo(tmp_path)
+    monkeypatch.setattr(
+        test_compat, "prepare_work_dir", lambda t, w: prepare_work_dir(t, w, repo_root=repo)
     )
-    expected = CompatResult(version="1.15", target="example", passed=True, output="")
+    commands: list[list[str]] = []
+
+    def fake_run(cmd: list[str], **_) -> subprocess.CompletedProcess:
+        commands.append(cmd)
+        returncode = 1 if len(commands) == 1 else 0
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="missing provider")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    job = CompatJob(version="1.10", target=repo / "examples" / "01_basic")
 
-    with patch(f"{MODULE}._run_validate", return_value=expected) as mock_run:
-        result = run_validate(job)
+    result = test_compat.run_validate(job, _warm_dir(tmp_path))
 
-    assert result == expected
-    mock_run.assert_called_once_with(job)
-    target_lock.__enter__.assert_called_once_with()
-    target_lock.__exit__.assert_called_once()
+    assert result.passed
+    assert [cmd[5] for cmd in commands] == ["validate", "init", "validate"]
@@ -0,0 +1,187 @@
+"""Parse-once cache for python-hcl2 documents shared by the `tf_utils` validators.
+
+Parsed documents are keyed by a SHA-256 of the content, and files additionally by
+``(path, mtime_ns, size)`` so an unchanged file is neither re-read nor re-parsed. The cache can
+persist to a JSON file (``--cache-file`` / ``TF_UTILS_HCL_CACHE``) so repeated pre-commit runs
+skip parsing unchanged content entirely. Only documents used during a run are written back, so
+entries for content that no longer exists are dropped.
+
+Returned documents are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from hcl2.api import loads
+
+CACHE_ENV_VAR = "TF_UTILS_HCL_CACHE"
+# Each worker builds its own Lark parser (~0.2s), so small batches are parsed serially.
+MIN_PARALLEL_PARSES = 64
+
+
+def _parser_version() -> str:
+    try:
+        return version("python-hcl2")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+# Persisted entries are only valid for the parser that produced them.
+CACHE_SCHEMA = f"1-hcl2-{_parser_version()}"
+
+
+class HclParseError(Exception):
+    """python-hcl2 failed to parse a document; the message is the parser's."""
+
+
+class ParsedDocument(NamedTuple):
+    data: Any
+    error: str | None = None
+
+    def unwrap(self) -> Any:
+        if self.error is not None:
+            raise HclParseError(self.error)
+        return self.data
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _file_key(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def _parse(content: str) -> ParsedDocument:
+    try:
+        return ParsedDocument(loads(content))
+    except Exception as exc:
+        return ParsedDocument(None, str(exc))
+
+
+@dataclass
+class HclParseCache:
+    cache_file: Path | None = None
+    documents: dict[str, ParsedDocument] = field(default_factory=dict)
+    file_hashes: dict[tuple[str, int, int], str] = field(default_factory=dict)
+    parses: int = 0
+    dirty: bool = False
+    # Keys read from the cache file and keys hit or parsed during this run.
+    loaded: set[str] = field(default_factory=set)
+    used: set[str] = field(default_factory=set)
+
+    def parse_content(self, content: str) -> ParsedDocument:
+        key = content_hash(content)
+        self.used.add(key)
+        if (doc := self.documents.get(key)) is None:
+            doc = self.documents[key] = _parse(content)
+            self.parses += 1
+            self.dirty = True
+        return doc
+
+    def parse_file(self, path: Path) -> ParsedDocument:
+        """Parse `path`; raises OSError/UnicodeDecodeError when it cannot be read."""
+        file_key = _file_key(path)
+        if (key := self.file_hashes.get(file_key)) is not None and key in self.documents:
+            self.used.add(key)
+            return self.documents[key]
+        content = path.read_text(encoding="utf-8")
+        self.file_hashes[file_key] = content_hash(content)
+        return self.parse_content(content)
+
+    def prime_files(self, paths: Iterable[Path], max_workers: int | None = None) -> int:
+        """Parse every not-yet-cached file in a process pool; return how many were parsed.
+
+        Unreadable files are skipped here so `parse_file` reports them to the caller.
+        """
+        pending: dict[str, str] = {}
+        for path in paths:
+            try:
+                file_key = _file_key(path)
+                content = path.read_text(encoding="utf-8")
+            except OSError, UnicodeDecodeError:
+                continue
+            key = self.file_hashes[file_key] = content_hash(content)
+            self.used.add(key)
+            if key not in self.documents:
+                pending[key] = content
+        if len(pending) < MIN_PARALLEL_PARSES or max_workers == 1:
+            for content in pending.values():
+                self.parse_content(content)
+            return len(pending)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for key, doc in zip(pending, executor.map(_parse, pending.values()), strict=True):
+                self.documents[key] = doc
+        self.parses += len(pending)
+        self.dirty = True
+        return len(pending)
+
+    def load(self) -> None:
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            raw = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except ValueError:
+            return
+        if raw.get("schema") != CACHE_SCHEMA:
+            return
+        for key, entry in raw.get("documents", {}).items():
+            self.documents.setdefault(key, ParsedDocument(entry.get("data"), entry.get("error")))
+            self.loaded.add(key)
+
+    def save(self) -> None:
+        """Write the documents used in this run; loaded entries nothing used are evicted."""
+        if self.cache_file is None or (not self.dirty and self.loaded <= self.used):
+            return
+        payload = {
+            "schema": CACHE_SCHEMA,
+            "documents": {
+                key: {"data": doc.data, "error": doc.error}
+                for key, doc in self.documents.items()
+                if key in self.used
+            },
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_suffix(f"{self.cache_file.suffix}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.cache_file)
+        self.loaded = set(self.used)
+        self.dirty = False
+
+
+_default_cache = HclParseCache()
+
+
+def default_cache() -> HclParseCache:
+    return _default_cache
+
+
+def use_disk_cache(cache_file: Path | None = None) -> HclParseCache:
+    """Back the shared cache with `cache_file` (default: $TF_UTILS_HCL_CACHE) and load it."""
+    cache_file = cache_file or (Path(p) if (p := os.environ.get(CACHE_ENV_VAR)) else None)
+    if cache_file is not None:
+        _default_cache.cache_file = cache_file
+        _default_cache.load()
+    return _default_cache
+
+
+def parse_content(content: str) -> ParsedDocument:
+    return _default_cache.parse_content(content)
+
+
+def parse_file(path: Path) -> ParsedDocument:
+    return _default_cache.parse_file(path)
+
+
+def prime_files(paths: Iterable[Path], max_workers: int | None = None) -> int:
+    return _default_cache.prime_files(paths, max_workers)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tf_utils import hcl_cache, validate_versions_tf, versions_tf_common
+from tf_utils.hcl_cache import HclParseCache, HclParseError, content_hash
+
+VERSIONS_TF = """\
+terraform {
+  required_providers {
+    mongodbatlas = {
+      source  = "mongodb/mongodbatlas"
+      version = "~> 2.12"
+    }
+  }
+  provider_meta "mongodbatlas" {
+    module_name    = "cluster"
+    module_version = "local"
+  }
+}
+"""
+
+
+def test_content_parsed_once_across_helpers(monkeypatch: pytest.MonkeyPatch):
+    cache = HclParseCache()
+    monkeypatch.setattr(hcl_cache, "_default_cache", cache)
+    # `experiments` is not understood by the versions.tf scanner, forcing the HCL fallback.
+    content = VERSIONS_TF.replace("terraform {\n", "terraform {\n  experiments = []\n", 1)
+
+    assert versions_tf_common.has_mongodbatlas_provider(content)
+    assert versions_tf_common.has_provider_meta(content)
+    assert versions_tf_common.mongodbatlas_module_name_from_content(content) == "cluster"
+    assert cache.parses == 1
+
+
+def test_parse_file_reuses_unchanged_file_and_detects_edits(tmp_path: Path):
+    cache = HclParseCache()
+    tf = tmp_path / "main.tf"
+    tf.write_text('resource "x" "y" {}\n')
+
+    first = cache.parse_file(tf)
+    assert cache.parse_file(tf) is first
+    assert cache.parses == 1
+
+    tf.write_text('resource "x" "z" {}\n')
+    assert "z" in str(cache.parse_file(tf).data)
+    assert cache.parses == 2
+
+
+def test_parse_errors_are_cached(tmp_path: Path):
+    cache = HclParseCache()
+    doc = cache.parse_content("resource {")
+    assert doc.error
+    assert cache.parse_content("resource {") is doc
+    with pytest.raises(HclParseError):
+        doc.unwrap()
+
+
+def test_disk_cache_round_trip(tmp_path: Path):
+    cache_file = tmp_path / "hcl_cache.json"
+    cache = HclParseCache(cache_file=cache_file)
+    expected = cache.parse_content(VERSIONS_TF).data
+    cache.save()
+
+    reloaded = HclParseCache(cache_file=cache_file)
+    reloaded.load()
+    assert reloaded.parse_content(VERSIONS_TF).data == expected
+    assert reloaded.parses == 0
+    assert not reloaded.dirty
+
+
+def test_disk_cache_keeps_only_documents_used_in_the_run(tmp_path: Path):
+    cache_file = tmp_path / "hcl_cache.json"
+    tf_file = tmp_path / "main.tf"
+    tf_file.write_text(VERSIONS_TF)
+    first = HclParseCache(cache_file=cache_file)
+    first.parse_file(tf_file)
+    first.parse_content('variable "old" {}\n')
+    first.save()
+
+    second = HclParseCache(cache_file=cache_file)
+    second.load()
+    second.prime_files([tf_file])
+    second.save()
+
+    persisted = json.loads(cache_file.read_text())["documents"]
+    assert list(persisted) == [content_hash(VERSIONS_TF)]
+    mtime = cache_file.stat().st_mtime_ns
+    third = HclParseCache(cache_file=cache_file)
+    third.load()
+    third.parse_file(tf_file)
+    third.save()
+    assert cache_file.stat().st_mtime_ns == mtime
+
+
+def test_disk_cache_ignores_other_schema(tmp_path: Path):
+    cache_file = tmp_path / "hcl_cache.json"
+    cache_file.write_text('{"schema": "0", "documents": {"k": {"data": {}, "error": null}}}')
+    cache = HclParseCache(cache_file=cache_file)
+    cache.load()
+    assert cache.documents == {}
+
+
+def test_prime_files_in_process_pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(hcl_cache, "MIN_PARALLEL_PARSES", 0)
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"f{i}.tf"
+        path.write_text(f'resource "x" "r{i}" {{}}\n' if i else "broken {\n")
+        paths.append(path)
+    cache = HclParseCache()
+
+    assert cache.prime_files([*paths, tmp_path / "missing.tf"], max_workers=2) == 4
+    assert cache.parses == 4
+    assert cache.parse_file(paths[0]).error
+    assert "r3" in str(cache.parse_file(paths[3]).data)
+    assert cache.parses == 4
+    assert cache.prime_files(paths, max_workers=2) == 0
+
+
+def test_validate_repo_parallel_parse_keeps_error_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (tmp_path / "versions.tf").write_text(
+        VERSIONS_TF.replace("}\n}", '}\n  required_version = ">= 1.10"\n}', 1)
+    )
+    for name in ("b", "a", "c"):
+        example = tmp_path / "examples" / name
+        example.mkdir(parents=True)
+        (example / "versions.tf").write_text('terraform {\n  required_version = ">= 1.0"\n}\n')
+        (example / "main.tf").write_text('resource "mongodbatlas_project" "this" {}\n')
+
+    monkeypatch.setattr(hcl_cache, "_default_cache", HclParseCache())
+    monkeypatch.setattr(hcl_cache, "MIN_PARALLEL_PARSES", 0)
+    parallel = validate_versions_tf.validate_repo(tmp_path, max_workers=2)
+    monkeypatch.setattr(hcl_cache, "_default_cache", HclParseCache())
+    serial = validate_versions_tf.validate_repo(tmp_path, max_workers=1)
+
+    assert parallel == serial
+    assert [line.split("/examples/")[1][0] for line in parallel] == ["a", "a", "b", "b", "c", "c"]
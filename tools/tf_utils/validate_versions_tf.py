@@ -1,6 +1,7 @@
 """Validate examples and submodule versions.tf files against the repo root `versions.tf`.
 
-Uses [python-hcl2](https://pypi.org/project/python-hcl2/) via `hcl2.api.loads` for HCL2 parsing.
+Uses [python-hcl2](https://pypi.org/project/python-hcl2/) via `hcl2.api.loads` for HCL2 parsing;
+each file is parsed at most once per run through `tf_utils.hcl_cache`.
 """
 
 from __future__ import annotations
@@ -9,9 +10,9 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import typer
-from hcl2.api import loads
 
 from docs import config_loader
+from tf_utils import hcl_cache
 from tf_utils.versions_tf_common import (
     all_provider_entries,
     providers_referenced_in_module_dir,
@@ -33,7 +34,7 @@ def parse_root_versions_reference(repo_root: Path) -> RootVersionsRef:
     if not root_file.is_file():
         raise FileNotFoundError(f"{root_file}: root versions.tf not found")
 
-    data = loads(root_file.read_text(encoding="utf-8"))
+    data = hcl_cache.parse_file(root_file).unwrap()
     if not isinstance(data, dict):
         raise ValueError(f"{root_file}: unexpected parse result")
 
@@ -87,8 +88,8 @@ def _errors_for_file(
     )
     errs.extend(scan_errs)
     try:
-        data = loads(content)
-    except Exception as exc:
+        data = hcl_cache.parse_content(content).unwrap()
+    except hcl_cache.HclParseError as exc:
         return errs + [f"{path}: HCL parse error: {exc}"]
 
     if not isinstance(data, dict):
@@ -144,7 +145,22 @@ def collect_versions_tf_paths(repo_root: Path) -> list[Path]:
     return paths
 
 
-def validate_repo(repo_root: Path) -> list[str]:
+def collect_parse_candidates(repo_root: Path, versions_tf_paths: list[Path]) -> list[Path]:
+    """Root versions.tf plus every `*.tf` in the directories of the files being validated."""
+    candidates = {repo_root / "versions.tf"}
+    for vf in versions_tf_paths:
+        candidates.update(vf.parent.glob("*.tf"))
+    return sorted(candidates)
+
+
+def validate_repo(repo_root: Path, max_workers: int | None = None) -> list[str]:
+    """Validate every examples/modules versions.tf; errors are in file path order.
+
+    All candidate files are parsed up front in a process pool (see `hcl_cache.prime_files`);
+    the rules then run serially over the cached documents.
+    """
+    versions_tf_paths = collect_versions_tf_paths(repo_root)
+    hcl_cache.prime_files(collect_parse_candidates(repo_root, versions_tf_paths), max_workers)
     try:
         root = parse_root_versions_reference(repo_root)
     except (FileNotFoundError, ValueError) as exc:
@@ -155,7 +171,7 @@ def validate_repo(repo_root: Path) -> list[str]:
     provider_version_exceptions = _load_provider_version_exceptions(repo_root)
 
     all_errs: list[str] = []
-    for vf in collect_versions_tf_paths(repo_root):
+    for vf in versions_tf_paths:
         all_errs.extend(
             _errors_for_file(
                 vf,
@@ -178,8 +194,19 @@ def main(
         resolve_path=True,
         help="Terraform module repository root (contains versions.tf, examples/, modules/)",
     ),
+    jobs: int | None = typer.Option(
+        None, "--jobs", "-j", min=1, help="HCL parser processes (default: CPU count)"
+    ),
+    cache_file: Path | None = typer.Option(
+        None,
+        "--cache-file",
+        envvar=hcl_cache.CACHE_ENV_VAR,
+        help="Persist parsed HCL documents here so unchanged files are not re-parsed next run",
+    ),
 ) -> None:
-    errors = validate_repo(repo_root)
+    cache = hcl_cache.use_disk_cache(cache_file)
+    errors = validate_repo(repo_root, max_workers=jobs)
+    cache.save()
     if errors:
         for line in errors:
             typer.echo(line, err=True)
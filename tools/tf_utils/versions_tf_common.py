@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Iterable, NamedTuple
 
-from hcl2.api import loads
+from tf_utils import hcl_cache, versions_tf_scan
 
 MONGODBATLAS_SOURCE = "mongodb/mongodbatlas"
 
@@ -63,11 +63,8 @@ def all_provider_entries(data: dict[str, Any]) -> list[RequiredProviderEntry]:
 
 
 def parse_versions_tf_dict(content: str) -> dict[str, Any] | None:
-    """Parse HCL2; return None if parsing fails."""
-    try:
-        data = loads(content)
-    except Exception:
-        return None
+    """Parse HCL2 (once per content, see `hcl_cache`); return None if parsing fails."""
+    data = hcl_cache.parse_content(content).data
     return data if isinstance(data, dict) else None
 
 
@@ -97,33 +94,27 @@ def find_mongodbatlas_provider_meta(terraform_blocks: list[Any]) -> dict[str, An
 
 def mongodbatlas_module_name_from_content(content: str) -> str | None:
     """Return `module_name` from `provider_meta \"mongodbatlas\"` if present."""
-    data = parse_versions_tf_dict(content)
-    if data is None:
-        return None
-    meta = find_mongodbatlas_provider_meta(data.get("terraform") or [])
-    if meta is None:
+    summary = versions_tf_scan.versions_tf_summary(content)
+    if summary is None or summary.mongodbatlas_meta is None:
         return None
-    name = unwrap_hcl2_string(meta.get("module_name"))
-    return name if name else None
+    return summary.mongodbatlas_meta.get("module_name") or None
 
 
 def has_mongodbatlas_provider(content: str) -> bool:
     """True when `required_providers` declares mongodbatlas with the Atlas registry source."""
-    data = parse_versions_tf_dict(content)
-    if data is None:
+    summary = versions_tf_scan.versions_tf_summary(content)
+    if summary is None:
         return False
-    for entry in all_provider_entries(data):
-        if entry.name == "mongodbatlas" and entry.source == MONGODBATLAS_SOURCE:
-            return True
-    return False
+    return any(
+        entry.name == "mongodbatlas" and entry.source == MONGODBATLAS_SOURCE
+        for entry in summary.providers
+    )
 
 
 def has_provider_meta(content: str) -> bool:
     """True when a `provider_meta \"mongodbatlas\"` block exists."""
-    data = parse_versions_tf_dict(content)
-    if data is None:
-        return False
-    return find_mongodbatlas_provider_meta(data.get("terraform") or []) is not None
+    summary = versions_tf_scan.versions_tf_summary(content)
+    return summary is not None and summary.mongodbatlas_meta is not None
 
 
 def provider_from_resource_type(type_str: str, root_provider_names: Iterable[str]) -> str | None:
@@ -167,8 +158,7 @@ def providers_referenced_in_module_dir(
         if for_versions_tf is not None and tf_path.resolve() == for_versions_tf.resolve():
             continue
         try:
-            text = tf_path.read_text(encoding="utf-8")
-            data = loads(text)
+            data = hcl_cache.parse_file(tf_path).unwrap()
         except Exception as exc:
             errs.append(f"{tf_path}: HCL parse error: {exc}")
             continue
@@ -0,0 +1,233 @@
+"""Linear-time extraction of `terraform {}` pins without building a python-hcl2 AST.
+
+Only `required_providers`, `required_version` and `provider_meta` are read. The scanner
+recognises the plain layout used in `versions.tf` files; anything it cannot interpret with
+certainty (heredocs, interpolation, escapes, non-string values in the extracted structures,
+duplicate keys, unbalanced brackets) makes it return None so callers fall back to full HCL
+parsing.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from tf_utils import hcl_cache
+from tf_utils import versions_tf_common as common
+
+
+@dataclass(frozen=True)
+class VersionsTfSummary:
+    providers: tuple[common.RequiredProviderEntry, ...]
+    required_version: str | None
+    mongodbatlas_meta: Mapping[str, str] | None
+
+
+class Ambiguous(Exception):
+    """The content needs the full HCL parser."""
+
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<ws>[ \t\r\n]+)
+    | (?P<comment>\#[^\n]*|//[^\n]*|/\*.*?\*/)
+    | (?P<string>"(?:[^"\\\n])*")
+    | (?P<ident>[A-Za-z_][A-Za-z0-9_-]*)
+    | (?P<heredoc><<)
+    | (?P<punct>[{}\[\]()=,])
+    | (?P<other>[^\s"{}\[\]()=,\#/]+|/)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_CLOSING = {"{": "}", "[": "]", "(": ")"}
+
+
+class _Token(NamedTuple):
+    kind: str
+    value: str
+
+
+def _tokenize(content: str) -> list[_Token]:
+    tokens: list[_Token] = []
+    stack: list[str] = []
+    pos = 0
+    while pos < len(content):
+        match = _TOKEN_PATTERN.match(content, pos)
+        if match is None:
+            raise Ambiguous(f"unrecognised input at offset {pos}")
+        pos = match.end()
+        kind = match.lastgroup or ""
+        value = match.group()
+        if kind in ("ws", "comment"):
+            continue
+        if kind == "heredoc":
+            raise Ambiguous("heredoc")
+        if kind == "string" and ("${" in value or "%{" in value):
+            raise Ambiguous("template string")
+        if kind == "punct" and value in _CLOSING:
+            stack.append(_CLOSING[value])
+        elif kind == "punct" and value in _CLOSING.values():
+            if not stack or stack.pop() != value:
+                raise Ambiguous("unbalanced brackets")
+        tokens.append(_Token(kind, value))
+    if stack:
+        raise Ambiguous("unbalanced brackets")
+    return tokens
+
+
+class _Scanner:
+    def __init__(self, tokens: list[_Token]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.providers: list[common.RequiredProviderEntry] = []
+        self.required_version: str | None = None
+        self.meta: dict[str, str] | None = None
+        self.terraform_blocks = 0
+
+    def peek(self) -> _Token | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, kind: str, value: str | None = None) -> str:
+        token = self.peek()
+        if token is None or token.kind != kind or (value is not None and token.value != value):
+            raise Ambiguous(f"expected {value or kind}, got {token}")
+        self.pos += 1
+        return token.value
+
+    def at(self, kind: str, value: str | None = None) -> bool:
+        token = self.peek()
+        return token is not None and token.kind == kind and value in (None, token.value)
+
+    def string(self) -> str:
+        return self.take("string")[1:-1]
+
+    def block_header(self) -> tuple[str, list[str]]:
+        name = self.take("ident")
+        return name, self.block_labels()
+
+    def block_labels(self) -> list[str]:
+        """Labels up to and including the opening brace."""
+        labels = []
+        while not self.at("punct", "{"):
+            if self.at("string"):
+                labels.append(self.string())
+            else:
+                labels.append(self.take("ident"))
+        self.take("punct", "{")
+        return labels
+
+    def skip_block_body(self) -> None:
+        depth = 1
+        while depth:
+            token = self.tokens[self.pos]
+            self.pos += 1
+            if token.kind == "punct" and token.value == "{":
+                depth += 1
+            elif token.kind == "punct" and token.value == "}":
+                depth -= 1
+
+    def string_attributes(self, commas: bool) -> dict[str, str]:
+        """`{ key = "value" ... }` body (opening brace consumed); commas only in objects."""
+        attributes: dict[str, str] = {}
+        while not self.at("punct", "}"):
+            key = self.take("ident")
+            self.take("punct", "=")
+            if key in attributes:
+                raise Ambiguous(f"duplicate attribute {key}")
+            attributes[key] = self.string()
+            if commas and self.at("punct", ","):
+                self.take("punct", ",")
+        self.take("punct", "}")
+        return attributes
+
+    def required_providers(self) -> None:
+        seen: set[str] = set()
+        while not self.at("punct", "}"):
+            name = self.take("ident")
+            self.take("punct", "=")
+            if name in seen:
+                raise Ambiguous(f"duplicate provider {name}")
+            seen.add(name)
+            if self.at("string"):
+                # Legacy `name = "version"` form; the HCL path ignores it as well.
+                self.string()
+                continue
+            self.take("punct", "{")
+            body = self.string_attributes(commas=True)
+            self.providers.append(
+                common.RequiredProviderEntry(name, body.get("version", ""), body.get("source"))
+            )
+        self.take("punct", "}")
+
+    def terraform_body(self) -> None:
+        first_block = self.terraform_blocks == 0
+        self.terraform_blocks += 1
+        attributes: set[str] = set()
+        while not self.at("punct", "}"):
+            name = self.take("ident")
+            if self.at("punct", "="):
+                self.take("punct", "=")
+                if name != "required_version" or name in attributes:
+                    raise Ambiguous(f"unsupported terraform attribute {name}")
+                attributes.add(name)
+                version = self.string()
+                if first_block:
+                    self.required_version = version
+                continue
+            block, labels = name, self.block_labels()
+            if block == "required_providers" and not labels:
+                self.required_providers()
+            elif block == "provider_meta" and len(labels) == 1:
+                meta = self.string_attributes(commas=False)
+                if labels[0] == "mongodbatlas" and self.meta is None:
+                    self.meta = meta
+            else:
+                self.skip_block_body()
+        self.take("punct", "}")
+
+    def document(self) -> VersionsTfSummary:
+        while self.peek() is not None:
+            name, labels = self.block_header()
+            if name == "terraform" and not labels:
+                self.terraform_body()
+            else:
+                self.skip_block_body()
+        return VersionsTfSummary(
+            providers=tuple(self.providers),
+            required_version=self.required_version,
+            mongodbatlas_meta=self.meta,
+        )
+
+
+def scan_versions_tf(content: str) -> VersionsTfSummary | None:
+    """Fast path; None when the content is ambiguous and needs the full parser."""
+    try:
+        return _Scanner(_tokenize(content)).document()
+    except Ambiguous, IndexError:
+        return None
+
+
+def summary_from_hcl(data: dict[str, Any]) -> VersionsTfSummary:
+    terraform_blocks = data.get("terraform") or []
+    meta = common.find_mongodbatlas_provider_meta(terraform_blocks)
+    return VersionsTfSummary(
+        providers=tuple(common.all_provider_entries(data)),
+        required_version=common.terraform_required_version(terraform_blocks),
+        mongodbatlas_meta=None
+        if meta is None
+        else {
+            key: common.unwrap_hcl2_string(value)
+            for key, value in meta.items()
+            if not key.startswith("__")
+        },
+    )
+
+
+def versions_tf_summary(content: str) -> VersionsTfSummary | None:
+    """Scan first, fall back to python-hcl2; None when the content does not parse."""
+    if (summary := scan_versions_tf(content)) is not None:
+        return summary
+    data = hcl_cache.parse_content(content).data
+    return summary_from_hcl(data) if isinstance(data, dict) else None
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import random
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tf_utils import hcl_cache, versions_tf_common
+from tf_utils.versions_tf_scan import scan_versions_tf, summary_from_hcl, versions_tf_summary
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+FUZZ_SEED = 38
+FUZZ_CASES = 300
+
+
+def tracked_versions_tf() -> list[Path]:
+    out = subprocess.run(
+        ["git", "ls-files", "*versions.tf"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return [REPO_ROOT / line for line in out.splitlines()]
+
+
+def hcl_summary(content: str):
+    data = hcl_cache.parse_content(content).data
+    return summary_from_hcl(data) if isinstance(data, dict) else None
+
+
+@pytest.mark.parametrize("path", tracked_versions_tf(), ids=lambda p: str(p.relative_to(REPO_ROOT)))
+def test_scan_matches_hcl_on_repo_files(path: Path):
+    content = path.read_text()
+    summary = scan_versions_tf(content)
+    assert summary is not None, "repo versions.tf files should take the fast path"
+    assert summary == hcl_summary(content)
+
+
+PROVIDERS = [
+    ("mongodbatlas", "mongodb/mongodbatlas", "~> 2.12"),
+    ("aws", "hashicorp/aws", ">= 6.0"),
+    ("random", None, "3.6.0"),
+    ("tls", "hashicorp/tls", None),
+]
+COMMENTS = ["# note", "// note", "/* note */", "/* multi\n line */"]
+EXTRA_BLOCKS = [
+    'provider "aws" {\n  region = "us-east-1"\n}',
+    'variable "x" {\n  type    = map(string)\n  default = { a = "b" }\n}',
+    'locals {\n  tags = [for k, v in var.tags : "${k}=${v}"]\n}',
+    'resource "x" "y" {\n  dynamic "z" {\n    for_each = []\n    content {}\n  }\n}',
+]
+# Constructs the scanner must hand to python-hcl2; parsed results have to match either way.
+FALLBACK_SNIPPETS = [
+    'required_version = ">= ${var.min}"',
+    "experiments = []",
+    'cloud {\n    organization = "x"\n  }',
+]
+
+
+def _object(
+    attributes: list[tuple[str, str]], rng: random.Random, indent: str, block: bool = False
+) -> str:
+    """An object expression, or a block body when `block` (no commas, always multi-line)."""
+    if not block and rng.random() < 0.3:
+        sep = ", " if rng.random() < 0.5 else " "
+        return "{ " + sep.join(f'{k} = "{v}"' for k, v in attributes) + " }"
+    width = max(len(k) for k, _ in attributes)
+    lines = [f'{indent}  {k.ljust(width)} = "{v}"' for k, v in attributes]
+    if not block and rng.random() < 0.3:
+        lines = [line + "," for line in lines]
+    return "{\n" + "\n".join(lines) + f"\n{indent}}}"
+
+
+def _maybe_comment(rng: random.Random) -> list[str]:
+    return [rng.choice(COMMENTS)] if rng.random() < 0.3 else []
+
+
+def random_versions_tf(rng: random.Random) -> str:
+    indent = rng.choice(["  ", "    ", "\t"])
+    terraform_items: list[str] = []
+
+    providers = rng.sample(PROVIDERS, k=rng.randint(0, len(PROVIDERS)))
+    if providers or rng.random() < 0.5:
+        entries = []
+        for name, source, version in providers:
+            attributes = [(k, v) for k, v in (("source", source), ("version", version)) if v]
+            rng.shuffle(attributes)
+            entries.append(
+                f"{indent * 2}{name} = {_object(attributes, rng, indent * 2)}"
+                if attributes
+                else f"{indent * 2}{name} = {{}}"
+            )
+            entries += [indent * 2 + c for c in _maybe_comment(rng)]
+        terraform_items.append(
+            f"{indent}required_providers {{\n" + "\n".join(entries) + f"\n{indent}}}"
+        )
+    if rng.random() < 0.7:
+        terraform_items.append(f'{indent}required_version = "{rng.choice([">= 1.10", "~> 1.9"])}"')
+    if rng.random() < 0.7:
+        meta = [("module_name", rng.choice(["cluster", "project"])), ("module_version", "local")]
+        rng.shuffle(meta)
+        label = rng.choice(["mongodbatlas", "mongodbatlas", "aws"])
+        terraform_items.append(
+            f'{indent}provider_meta "{label}" {_object(meta, rng, indent, block=True)}'
+        )
+    if rng.random() < 0.2:
+        terraform_items.append(indent + rng.choice(FALLBACK_SNIPPETS))
+    rng.shuffle(terraform_items)
+
+    body = []
+    for item in terraform_items:
+        body += [indent + c for c in _maybe_comment(rng)]
+        body.append(item)
+        if rng.random() < 0.3:
+            body.append("")
+    blocks = ["terraform {\n" + "\n".join(body) + "\n}"]
+    blocks += rng.sample(EXTRA_BLOCKS, k=rng.randint(0, 2))
+    rng.shuffle(blocks)
+    return "\n\n".join(c for block in blocks for c in [*_maybe_comment(rng), block]) + "\n"
+
+
+@pytest.mark.parametrize("case", range(FUZZ_CASES))
+def test_scan_matches_hcl_on_generated_variants(case: int):
+    content = random_versions_tf(random.Random(FUZZ_SEED * 1000 + case))
+    expected = hcl_summary(content)
+    assert expected is not None, content
+    scanned = scan_versions_tf(content)
+    assert scanned is None or scanned == expected, content
+    assert versions_tf_summary(content) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        'terraform {\n  required_version = "a\\"b"\n}\n',
+        "terraform {\n  required_version = <<EOT\n>= 1.0\nEOT\n}\n",
+        'terraform {\n  required_version = ">= ${var.v}"\n}\n',
+        'terraform {\n  required_version = ">= 1"\n  required_version = ">= 2"\n}\n',
+        'terraform {\n  required_providers {\n    a = { source = "x" }\n',
+        "terraform {\n  required_providers {\n    a = { version = var.v }\n  }\n}\n",
+        'terraform {\n  provider_meta "mongodbatlas" {\n    module_name = "x",\n  }\n}\n',
+    ],
+)
+def test_scan_defers_ambiguous_content(content: str):
+    assert scan_versions_tf(content) is None
+
+
+def test_helpers_skip_hcl_parser_on_plain_files(monkeypatch: pytest.MonkeyPatch):
+    cache = hcl_cache.HclParseCache()
+    monkeypatch.setattr(hcl_cache, "_default_cache", cache)
+    content = (REPO_ROOT / "versions.tf").read_text()
+
+    assert versions_tf_common.has_mongodbatlas_provider(content)
+    assert versions_tf_common.has_provider_meta(content)
+    assert versions_tf_common.mongodbatlas_module_name_from_content(content) == "cluster"
+    assert cache.parses == 0
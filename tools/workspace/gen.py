@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 import typer
@@ -47,17 +48,25 @@ def parse_include_examples(value: str, config: models.WsConfig) -> list[models.E
     ]
 
 
+def examples_dir() -> Path:
+    return models.REPO_ROOT / EXAMPLES_DIR_NAME
+
+
 def generate_modules_tf(
-    config: models.WsConfig, examples: list[models.Example], ws_dir: Path
+    config: models.WsConfig,
+    examples: list[models.Example],
+    ws_dir: Path,
+    example_paths: Mapping[str, Path] | None = None,
 ) -> str | None:
     if not examples:
         return None
-    examples_dir = models.REPO_ROOT / EXAMPLES_DIR_NAME
+    if example_paths is None:
+        example_paths = models.resolve_example_paths(examples, examples_dir())
     rel_examples = f"../../{EXAMPLES_DIR_NAME}"
     lines = ["# Generated by workspace - do not edit manually", ""]
     for ex in examples:
-        example_path = ex.example_path(examples_dir)
-        title = ex.title_from_dir(examples_dir)
+        example_path = example_paths[ex.identifier]
+        title = ex.title_for_path(example_path)
         if ex.source and ex.name and ex.source != ex.name:
             lines.append(f"# Example {ex.identifier} (source {example_path.name}): {title}")
         else:
@@ -119,12 +128,24 @@ def generate_pytest_file(config: models.WsConfig) -> str:
     return "\n".join(lines)
 
 
-def process_workspace(ws_dir: Path, include_examples: str = "all") -> None:
+def load_context(ws_dir: Path, include_examples: str = "all") -> models.WsContext | None:
+    """Parse the workspace config once and resolve the included example directories."""
     ws_config = ws_dir / models.WORKSPACE_CONFIG_FILE
     if not ws_config.exists():
         typer.echo(f"Skipping {ws_dir.name}: no {models.WORKSPACE_CONFIG_FILE} found")
-        return
+        return None
     config = models.parse_ws_config(ws_config)
+    examples = parse_include_examples(include_examples, config)
+    return models.WsContext.create(ws_dir, config, examples, examples_dir())
+
+
+def process_workspace(ws_dir: Path, include_examples: str = "all") -> None:
+    if ctx := load_context(ws_dir, include_examples):
+        process_context(ctx)
+
+
+def process_context(ctx: models.WsContext) -> None:
+    ws_dir, config = ctx.ws_dir, ctx.config
     variables_tf = ws_dir / VARIABLES_GENERATED_TF
     if content := generate_variables_tf(config):
         variables_tf.write_text(content)
@@ -132,9 +153,9 @@ def process_workspace(ws_dir: Path, include_examples: str = "all") -> None:
     elif variables_tf.exists():
         variables_tf.unlink()
         typer.echo(f"  Removed {VARIABLES_GENERATED_TF} (no exposed vars)")
-    examples = parse_include_examples(include_examples, config)
+    examples = list(ctx.examples)
     modules_tf = ws_dir / MODULES_GENERATED_TF
-    if content := generate_modules_tf(config, examples, ws_dir):
+    if content := generate_modules_tf(config, examples, ws_dir, ctx.example_paths):
         modules_tf.write_text(content)
         typer.echo(f"  Generated {MODULES_GENERATED_TF} ({len(examples)} examples)")
     elif modules_tf.exists():
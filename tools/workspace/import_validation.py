@@ -13,7 +13,7 @@ from typing import Any
 
 import typer
 
-from workspace import gen, models, plan
+from workspace import gen, models, plan, replay
 
 logger = logging.getLogger(__name__)
 
@@ -87,13 +87,20 @@ def generate_import_blocks_tf(entries: list[tuple[str, str]]) -> str:
 
 @contextlib.contextmanager
 def backup_and_restore_state(ws_dir: Path) -> Generator[None]:
+    imports_tf = ws_dir / IMPORTS_GENERATED_TF
+    if replay.is_replaying():
+        # Replayed runs never touch terraform state; only clean up generated import blocks.
+        try:
+            yield
+        finally:
+            imports_tf.unlink(missing_ok=True)
+        return
     tfstate = ws_dir / TFSTATE_FILE
     if not tfstate.exists():
         raise ValueError(
             f"{TFSTATE_FILE} not found in {ws_dir.name}. Run --mode apply before --mode import"
         )
     backup = ws_dir / f"{TFSTATE_FILE}.import-backup"
-    imports_tf = ws_dir / IMPORTS_GENERATED_TF
     shutil.copy2(tfstate, backup)
     try:
         yield
@@ -297,13 +304,13 @@ def resolve_import_entries(
 def process_workspace(
     ws_dir: Path, include_examples: str = "all", var_files: list[Path] | None = None
 ) -> None:
-    ws_config_path = ws_dir / models.WORKSPACE_CONFIG_FILE
-    if not ws_config_path.exists():
-        logger.info(f"Skipping {ws_dir.name}: no {models.WORKSPACE_CONFIG_FILE} found")
-        return
-    config = models.parse_ws_config(ws_config_path)
-    examples = gen.parse_include_examples(include_examples, config)
-    enabled = [ex for ex in examples if ex.import_validation.enabled]
+    if ctx := gen.load_context(ws_dir, include_examples):
+        process_context(ctx, var_files)
+
+
+def process_context(ctx: models.WsContext, var_files: list[Path] | None = None) -> None:
+    ws_dir, config = ctx.ws_dir, ctx.config
+    enabled = [ex for ex in ctx.examples if ex.import_validation.enabled]
     if not enabled:
         logger.info(f"No examples with import_validation.enabled in {ws_dir.name}, skipping")
         return
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
@@ -149,7 +151,10 @@ class Example:
             f"Example {self.identifier} must set source when using number without a matching examples directory name"  # noqa: E501
         )
 
-    def example_path(self, examples_dir: Path) -> Path:
+    def example_path(
+        self, examples_dir: Path, numbered_dirs: Mapping[str, Path] | None = None
+    ) -> Path:
+        """Resolve the example directory; pass `numbered_dirs` to avoid rescanning examples_dir."""
         if self.number is not None:
             if self.source:
                 path = examples_dir / self.source
@@ -159,9 +164,10 @@ class Example:
                         f"(workspace id {self.identifier})"
                     )
                 return path
-            for p in examples_dir.iterdir():
-                if p.is_dir() and p.name.startswith(f"{self.number:02d}_"):
-                    return p
+            if numbered_dirs is None:
+                numbered_dirs = numbered_example_dirs(examples_dir)
+            if path := numbered_dirs.get(f"{self.number:02d}"):
+                return path
             raise ValueError(f"Example {self.number:02d}_* not found in {examples_dir}")
         path = examples_dir / self.example_dir_name
         if not path.exists():
@@ -172,7 +178,10 @@ class Example:
         return path
 
     def title_from_dir(self, examples_dir: Path) -> str:
-        dir_name = self.example_path(examples_dir).name
+        return self.title_for_path(self.example_path(examples_dir))
+
+    def title_for_path(self, example_path: Path) -> str:
+        dir_name = example_path.name
         if self.number is not None and not self.source:
             return dir_name.split("_", 1)[1].replace("_", " ").title()
         return dir_name.replace("_", " ").title()
@@ -213,6 +222,59 @@ class WsConfig:
         return result
 
 
+def numbered_example_dirs(examples_dir: Path) -> dict[str, Path]:
+    """Map the `NN` prefix of every `NN_*` directory in examples_dir, scanning it once."""
+    result: dict[str, Path] = {}
+    for p in sorted(examples_dir.iterdir()):
+        prefix, sep, _ = p.name.partition("_")
+        if sep and prefix.isdigit() and p.is_dir():
+            result.setdefault(prefix, p)
+    return result
+
+
+def resolve_example_paths(examples: list[Example], examples_dir: Path) -> dict[str, Path]:
+    numbered_dirs = numbered_example_dirs(examples_dir) if examples_dir.exists() else {}
+    return {ex.identifier: ex.example_path(examples_dir, numbered_dirs) for ex in examples}
+
+
+@dataclass(frozen=True)
+class WsContext:
+    """A workspace config parsed once per run, shared by every stage.
+
+    `examples` holds the examples selected by --include-examples, and `example_paths` their
+    resolved directories keyed by identifier.
+    """
+
+    ws_dir: Path
+    config: WsConfig
+    examples: tuple[Example, ...]
+    example_paths: Mapping[str, Path]
+
+    @classmethod
+    def create(
+        cls, ws_dir: Path, config: WsConfig, examples: list[Example], examples_dir: Path
+    ) -> WsContext:
+        paths = resolve_example_paths(examples, examples_dir)
+        return cls(
+            ws_dir=ws_dir,
+            config=config,
+            examples=tuple(examples),
+            example_paths=MappingProxyType(paths),
+        )
+
+    @property
+    def example_dirs(self) -> list[Path]:
+        return [self.example_paths[ex.identifier] for ex in self.examples]
+
+    def included_config(self) -> WsConfig:
+        """The config narrowed to the included examples."""
+        return WsConfig(
+            examples=list(self.examples),
+            var_groups=self.config.var_groups,
+            resource_type_import_ids=self.config.resource_type_import_ids,
+        )
+
+
 def parse_ws_config(ws_yaml_path: Path) -> WsConfig:
     data = yaml.safe_load(ws_yaml_path.read_text())
     var_groups: dict[str, list[WsVar]] = {}
@@ -381,3 +381,24 @@ def test_resolve_workspaces_tests_dir_not_found(tmp_path: Path):
 def test_resolve_workspaces_no_workspace_dirs(tmp_path: Path):
     with pytest.raises(ValueError, match="No workspace_\\* directories found"):
         models.resolve_workspaces("all", tmp_path)
+
+
+def test_ws_context_resolves_example_paths_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    examples_dir = tmp_path / "examples"
+    examples_dir.mkdir()
+    (examples_dir / "01_basic").mkdir()
+    (examples_dir / "02_advanced").mkdir()
+    (examples_dir / "backup_export").mkdir()
+    examples = [models.Example(number=1), models.Example(name="backup_export")]
+    config = models.WsConfig(examples=examples + [models.Example(number=2)], var_groups={})
+    scans: list[Path] = []
+    original = models.numbered_example_dirs
+    monkeypatch.setattr(models, "numbered_example_dirs", lambda d: scans.append(d) or original(d))
+
+    ctx = models.WsContext.create(tmp_path, config, examples, examples_dir)
+
+    assert scans == [examples_dir]
+    assert [p.name for p in ctx.example_dirs] == ["01_basic", "backup_export"]
+    assert [ex.identifier for ex in ctx.included_config().examples] == ["01", "backup_export"]
+    with pytest.raises(TypeError):
+        ctx.example_paths["02"] = examples_dir / "02_advanced"  # type: ignore[index]
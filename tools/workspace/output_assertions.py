@@ -66,13 +66,13 @@ def run_output_assertions(config: models.WsConfig, raw_outputs: dict[str, Any])
 
 
 def process_workspace(ws_dir: Path, include_examples: str = "all") -> None:
-    ws_config_path = ws_dir / models.WORKSPACE_CONFIG_FILE
-    if not ws_config_path.exists():
-        typer.echo(f"Skipping {ws_dir.name}: no {models.WORKSPACE_CONFIG_FILE} found")
-        return
-    config = models.parse_ws_config(ws_config_path)
-    examples = gen.parse_include_examples(include_examples, config)
-    filtered_config = models.WsConfig(examples=examples, var_groups=config.var_groups)
+    if ctx := gen.load_context(ws_dir, include_examples):
+        process_context(ctx)
+
+
+def process_context(ctx: models.WsContext) -> None:
+    ws_dir = ctx.ws_dir
+    filtered_config = ctx.included_config()
     has_assertions = any(ex.output_assertions for ex in filtered_config.examples)
     if not has_assertions:
         typer.echo(f"  No output_assertions configured in {ws_dir.name}, skipping")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
 import logging
 import re
@@ -13,8 +14,8 @@ from typing import Any
 
 import typer
 
-from shared import tf_retry
-from workspace import models
+from shared import tf_modules, tf_retry
+from workspace import models, replay, timings
 
 logger = logging.getLogger(__name__)
 
@@ -27,15 +28,98 @@ OUTPUTS_ACTUAL_JSON = "outputs_actual.json"
 PROVIDER_VERSION_OVERRIDE_FILE = "provider_version_override.tf"
 MONGODB_ATLAS_PROVIDER_NAME = "mongodbatlas"
 MONGODB_ATLAS_PROVIDER_SOURCE = "mongodb/mongodbatlas"
+LOCK_FILE = ".terraform.lock.hcl"
+# Stored inside .terraform/ so removing the init cache also invalidates the fingerprint.
+INIT_FINGERPRINT_FILE = ".terraform/workspace_init_fingerprint"
+# Module block headers (init installs modules by label), module sources/versions,
+# required_providers entries and required_version lines.
+TF_DEPENDENCY_LINE_PATTERN = re.compile(
+    r'^\s*(?:module\s+"[^"]*"|(?:source|version|required_version)\s*=\s*".*")', re.MULTILINE
+)
+
+
+def _skip_for_replay(cmd: list[str]) -> bool:
+    if not replay.is_replaying():
+        return False
+    typer.echo(f"  Replay: skipping {' '.join(cmd[:3])}")
+    return True
 
 
 def run_cmd(cmd: list[str], cwd: Path) -> int:
+    if _skip_for_replay(cmd):
+        return 0
     result = subprocess.run(cmd, cwd=cwd)
     return result.returncode
 
 
-def run_terraform_init(ws_dir: Path) -> None:
-    logger.info(f"Running terraform init in {ws_dir.name}...")
+def run_cmd_json(cmd: list[str], cwd: Path) -> tuple[int, list[dict[str, Any]]]:
+    """Run a terraform command with `-json`, echoing each event's message as it arrives."""
+    events: list[dict[str, Any]] = []
+    if _skip_for_replay(cmd):
+        return 0, events
+    with subprocess.Popen([*cmd, "-json"], cwd=cwd, stdout=subprocess.PIPE, text=True) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                typer.echo(line.rstrip())
+                continue
+            events.append(event)
+            if message := event.get("@message"):
+                typer.echo(message)
+    return proc.returncode, events
+
+
+def _run_timed_cmd(cmd: list[str], ws_dir: Path, command: str, timed: bool) -> int:
+    if not timed:
+        return run_cmd(cmd, ws_dir)
+    returncode, events = run_cmd_json(cmd, ws_dir)
+    timings.write_timings_report(ws_dir, command, events)
+    return returncode
+
+
+def _require_auto_approve(command: str, timed: bool, auto_approve: bool) -> None:
+    # terraform only accepts -json for apply/destroy when no interactive prompt is needed.
+    if timed and not auto_approve:
+        raise ValueError(f"Resource timings for terraform {command} require --auto-approve")
+
+
+def init_fingerprint(ws_dir: Path) -> str:
+    """Hash everything `terraform init -upgrade` resolves for the workspace.
+
+    Covers module block labels, module sources and version constraints in the workspace and
+    every local module it references (recursively), the provider version override file, and
+    the lock file.
+    """
+    digest = hashlib.sha256()
+    for module_dir in tf_modules.local_module_dirs(ws_dir):
+        digest.update(f"{module_dir}\n".encode())
+        for tf_file in sorted(module_dir.glob("*.tf")):
+            digest.update(f"{tf_file.name}\n".encode())
+            for line in TF_DEPENDENCY_LINE_PATTERN.findall(tf_file.read_text()):
+                digest.update(f"{line.strip()}\n".encode())
+    for name in (PROVIDER_VERSION_OVERRIDE_FILE, LOCK_FILE):
+        path = ws_dir / name
+        digest.update(f"{name}\n".encode())
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _stored_init_fingerprint(ws_dir: Path) -> str:
+    path = ws_dir / INIT_FINGERPRINT_FILE
+    return path.read_text().strip() if path.exists() else ""
+
+
+def run_terraform_init(ws_dir: Path, force: bool = False) -> None:
+    if _skip_for_replay(["terraform", "init"]):
+        return
+    if not force and init_fingerprint(ws_dir) == _stored_init_fingerprint(ws_dir):
+        typer.echo(f"Skipping terraform init in {ws_dir.name}: init inputs unchanged")
+        return
+    reason = "forced" if force else "init inputs changed"
+    logger.info(f"Running terraform init -upgrade in {ws_dir.name} ({reason})...")
     try:
         result = tf_retry.run_terraform_init(
             ["terraform", "init", "-upgrade", "-input=false"], ws_dir
@@ -47,21 +131,34 @@ def run_terraform_init(ws_dir: Path) -> None:
         typer.echo(result.stdout.rstrip())
     if result.stderr:
         typer.echo(result.stderr.rstrip(), err=True)
+    fingerprint_path = ws_dir / INIT_FINGERPRINT_FILE
+    fingerprint_path.parent.mkdir(exist_ok=True)
+    fingerprint_path.write_text(init_fingerprint(ws_dir) + "\n")
 
 
-def run_terraform_plan(ws_dir: Path, var_files: list[Path], skip_init: bool = False) -> None:
+def run_terraform_plan(
+    ws_dir: Path, var_files: list[Path], skip_init: bool = False, timed: bool = False
+) -> None:
     if not skip_init:
         run_terraform_init(ws_dir)
     plan_cmd = ["terraform", "plan", f"-out={PLAN_BIN}", "-input=false"]
     for vf in var_files:
         plan_cmd.extend(["-var-file", str(vf)])
     typer.echo("Running terraform plan...")
-    if run_cmd(plan_cmd, ws_dir) != 0:
+    if _run_timed_cmd(plan_cmd, ws_dir, "plan", timed) != 0:
         raise typer.Exit(1)
     typer.echo("Exporting plan to JSON...")
     plan_json_path = ws_dir / PLAN_JSON
-    with open(plan_json_path, "w") as f:
-        subprocess.run(["terraform", "show", "-json", PLAN_BIN], cwd=ws_dir, stdout=f, check=True)
+    bundle = replay.active()
+    if bundle and bundle.replaying:
+        bundle.replay_file(replay.PLAN_KIND, plan_json_path)
+    else:
+        with open(plan_json_path, "w") as f:
+            subprocess.run(
+                ["terraform", "show", "-json", PLAN_BIN], cwd=ws_dir, stdout=f, check=True
+            )
+    if bundle and bundle.recording:
+        bundle.record_file(replay.PLAN_KIND, plan_json_path)
     typer.echo(f"Plan saved to {PLAN_JSON}")
 
 
@@ -71,29 +168,38 @@ def run_terraform_apply_plan(ws_dir: Path) -> None:
         raise typer.Exit(1)
 
 
-def run_terraform_apply(ws_dir: Path, var_files: list[Path], auto_approve: bool = False) -> None:
+def run_terraform_apply(
+    ws_dir: Path, var_files: list[Path], auto_approve: bool = False, timed: bool = False
+) -> None:
+    _require_auto_approve("apply", timed, auto_approve)
     apply_cmd = ["terraform", "apply", "-input=false"]
     for vf in var_files:
         apply_cmd.extend(["-var-file", str(vf)])
     if auto_approve:
         apply_cmd.append("-auto-approve")
     typer.echo("Running terraform apply...")
-    if run_cmd(apply_cmd, ws_dir) != 0:
+    if _run_timed_cmd(apply_cmd, ws_dir, "apply", timed) != 0:
         raise typer.Exit(1)
 
 
 def run_terraform_output_json(ws_dir: Path) -> dict[str, Any]:
     typer.echo("Capturing terraform output...")
-    result = subprocess.run(
-        ["terraform", "output", "-json"],
-        cwd=ws_dir,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        typer.echo(f"terraform output failed: {result.stderr}", err=True)
-        raise typer.Exit(1)
-    outputs = json.loads(result.stdout)
+    bundle = replay.active()
+    if bundle and bundle.replaying:
+        outputs = bundle.replay(replay.OUTPUTS_KIND)
+    else:
+        result = subprocess.run(
+            ["terraform", "output", "-json"],
+            cwd=ws_dir,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            typer.echo(f"terraform output failed: {result.stderr}", err=True)
+            raise typer.Exit(1)
+        outputs = json.loads(result.stdout)
+    if bundle and bundle.recording:
+        bundle.record(replay.OUTPUTS_KIND, outputs)
     output_path = ws_dir / OUTPUTS_ACTUAL_JSON
     output_path.write_text(json.dumps(outputs, indent=2) + "\n")
     typer.echo(f"Outputs saved to {OUTPUTS_ACTUAL_JSON}")
@@ -101,6 +207,9 @@ def run_terraform_output_json(ws_dir: Path) -> dict[str, Any]:
 
 
 def run_terraform_show_json(ws_dir: Path) -> dict[str, Any]:
+    bundle = replay.active()
+    if bundle and bundle.replaying:
+        return bundle.replay(replay.STATE_KIND)
     logger.info(f"Running terraform show -json in {ws_dir.name}...")
     result = subprocess.run(
         ["terraform", "show", "-json"],
@@ -111,13 +220,16 @@ def run_terraform_show_json(ws_dir: Path) -> dict[str, Any]:
     if result.returncode != 0:
         typer.echo(f"terraform show -json failed: {result.stderr}", err=True)
         raise typer.Exit(1)
-    return json.loads(result.stdout)
+    state = json.loads(result.stdout)
+    if bundle and bundle.recording:
+        bundle.record(replay.STATE_KIND, state)
+    return state
 
 
 def run_terraform_state_rm(ws_dir: Path, addresses: list[str]) -> None:
-    if not addresses:
-        return
     cmd = ["terraform", "state", "rm", *addresses]
+    if not addresses or _skip_for_replay(cmd):
+        return
     logger.info(f"Removing {len(addresses)} resources from state...")
     result = subprocess.run(cmd, cwd=ws_dir, capture_output=True, text=True)
     if result.returncode != 0:
@@ -126,14 +238,17 @@ def run_terraform_state_rm(ws_dir: Path, addresses: list[str]) -> None:
     logger.info(result.stdout.strip())
 
 
-def run_terraform_destroy(ws_dir: Path, var_files: list[Path], auto_approve: bool = False) -> None:
+def run_terraform_destroy(
+    ws_dir: Path, var_files: list[Path], auto_approve: bool = False, timed: bool = False
+) -> None:
+    _require_auto_approve("destroy", timed, auto_approve)
     destroy_cmd = ["terraform", "destroy", "-input=false"]
     for vf in var_files:
         destroy_cmd.extend(["-var-file", str(vf)])
     if auto_approve:
         destroy_cmd.append("-auto-approve")
     typer.echo("Running terraform destroy...")
-    if run_cmd(destroy_cmd, ws_dir) != 0:
+    if _run_timed_cmd(destroy_cmd, ws_dir, "destroy", timed) != 0:
         raise typer.Exit(1)
 
 
@@ -203,6 +318,9 @@ def main(
     ws: str = typer.Option("all", "--ws"),
     tests_dir: Path = typer.Option(models.DEFAULT_TESTS_DIR, "--tests-dir"),
     var_file: list[Path] = typer.Option([], "--var-file", "-v"),
+    timed: bool = typer.Option(
+        False, "--timings", help="Report per-resource refresh durations from `plan -json`"
+    ),
 ) -> None:
     try:
         ws_dirs = models.resolve_workspaces(ws, tests_dir)
@@ -210,7 +328,7 @@ def main(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
     for ws_dir in ws_dirs:
-        run_terraform_plan(ws_dir, var_file)
+        run_terraform_plan(ws_dir, var_file, timed=timed)
     typer.echo("Done.")
 
 
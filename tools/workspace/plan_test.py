@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
 from shared import tf_retry
 from workspace.plan import (
+    LOCK_FILE,
     PROVIDER_VERSION_OVERRIDE_FILE,
+    init_fingerprint,
     provider_version_override,
+    run_cmd_json,
+    run_terraform_apply,
     run_terraform_init,
     strip_provider_blocks,
 )
@@ -181,3 +186,87 @@ def test_provider_version_override_rejects_non_exact_version(tmp_path: Path):
     with pytest.raises(ValueError, match="Invalid exact provider version"):
         with provider_version_override(tmp_path, "~> 2.12"):
             pass
+
+
+def test_timed_apply_requires_auto_approve(tmp_path: Path):
+    with pytest.raises(ValueError, match="require --auto-approve"):
+        run_terraform_apply(tmp_path, [], auto_approve=False, timed=True)
+
+
+def test_run_cmd_json_collects_events(tmp_path: Path, capsys):
+    script = tmp_path / "fake_tf.py"
+    script.write_text(
+        "import json\n"
+        "print(json.dumps({'type': 'version', '@message': 'Terraform 1.10.5'}))\n"
+        "print('not json')\n"
+    )
+
+    returncode, events = run_cmd_json([sys.executable, str(script)], tmp_path)
+
+    assert returncode == 0
+    assert events == [{"type": "version", "@message": "Terraform 1.10.5"}]
+    assert capsys.readouterr().out == "Terraform 1.10.5\nnot json\n"
+
+
+def _init_result(*_) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=["terraform", "init"], returncode=0, stdout="")
+
+
+def _write_init_inputs(tmp_path: Path) -> Path:
+    ws_dir = tmp_path / "tests" / "workspace_x"
+    example_dir = tmp_path / "examples" / "01_basic"
+    ws_dir.mkdir(parents=True)
+    example_dir.mkdir(parents=True)
+    (ws_dir / "modules.generated.tf").write_text(
+        'module "ex_01" {\n  source = "../../examples/01_basic"\n}\n'
+    )
+    (example_dir / "versions.tf").write_text(VERSIONS_TF_WITH_PROVIDER)
+    return ws_dir
+
+
+def test_run_terraform_init_skips_when_fingerprint_unchanged(tmp_path: Path, monkeypatch, capsys):
+    ws_dir = _write_init_inputs(tmp_path)
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        tf_retry, "run_terraform_init", lambda cmd, _: calls.append(cmd) or _init_result()
+    )
+
+    run_terraform_init(ws_dir)
+    run_terraform_init(ws_dir)
+    assert len(calls) == 1
+    assert "init inputs unchanged" in capsys.readouterr().out
+
+    run_terraform_init(ws_dir, force=True)
+    assert len(calls) == 2
+
+
+def test_init_fingerprint_tracks_referenced_modules_and_lock_file(tmp_path: Path):
+    ws_dir = _write_init_inputs(tmp_path)
+    baseline = init_fingerprint(ws_dir)
+
+    versions_tf = tmp_path / "examples" / "01_basic" / "versions.tf"
+    versions_tf.write_text(versions_tf.read_text() + "\n# comment only\n")
+    assert init_fingerprint(ws_dir) == baseline
+
+    versions_tf.write_text(VERSIONS_TF_WITH_PROVIDER.replace("~> 2.12", "~> 2.13"))
+    changed = init_fingerprint(ws_dir)
+    assert changed != baseline
+
+    (ws_dir / LOCK_FILE).write_text("# lock\n")
+    assert init_fingerprint(ws_dir) != changed
+
+
+def test_init_fingerprint_tracks_module_renames(tmp_path: Path):
+    ws_dir = _write_init_inputs(tmp_path)
+    baseline = init_fingerprint(ws_dir)
+    modules_tf = ws_dir / "modules.generated.tf"
+    modules_tf.write_text(modules_tf.read_text().replace('"ex_01"', '"ex_renamed"'))
+    assert init_fingerprint(ws_dir) != baseline
+
+
+def test_init_fingerprint_includes_provider_version_override(tmp_path: Path):
+    ws_dir = _write_init_inputs(tmp_path)
+    baseline = init_fingerprint(ws_dir)
+    with provider_version_override(ws_dir, "2.12.0"):
+        assert init_fingerprint(ws_dir) != baseline
+    assert init_fingerprint(ws_dir) == baseline
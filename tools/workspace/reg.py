@@ -163,14 +163,25 @@ def report_uncovered(uncovered: dict[str, list[str]]) -> None:
 
 def process_workspace(ws_dir: Path, force_regen: bool, show_uncovered: bool) -> None:
     ws_config = ws_dir / models.WORKSPACE_CONFIG_FILE
-    plan_path = ws_dir / PLAN_JSON
     if not ws_config.exists():
         typer.echo(f"Skipping {ws_dir.name}: no {models.WORKSPACE_CONFIG_FILE} found")
         return
+    config = models.parse_ws_config(ws_config)
+    process_config(ws_dir, config, force_regen, show_uncovered)
+
+
+def process_context(ctx: models.WsContext, force_regen: bool, show_uncovered: bool) -> None:
+    # Snapshots cover every configured example, not only the included ones.
+    process_config(ctx.ws_dir, ctx.config, force_regen, show_uncovered)
+
+
+def process_config(
+    ws_dir: Path, config: models.WsConfig, force_regen: bool, show_uncovered: bool
+) -> None:
+    plan_path = ws_dir / PLAN_JSON
     if not plan_path.exists():
         typer.echo(f"Skipping {ws_dir.name}: no {PLAN_JSON} found (run plan first)")
         return
-    config = models.parse_ws_config(ws_config)
     plan = parse_plan_json(plan_path)
     resources = extract_planned_resources(plan)
     if show_uncovered:
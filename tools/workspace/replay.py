@@ -0,0 +1,108 @@
+"""Record terraform JSON outputs per workspace step and replay them without terraform."""
+
+from __future__ import annotations
+
+import contextlib
+import enum
+import json
+import shutil
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import typer
+
+REPLAY_FIXTURES_DIR = "replay_fixtures"
+PLAN_KIND = "plan"
+STATE_KIND = "state"
+OUTPUTS_KIND = "outputs"
+
+
+class ReplayMode(enum.StrEnum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+@dataclass
+class FixtureBundle:
+    """Fixture files for one workspace run, numbered per kind in call order (plan_1.json, ...)."""
+
+    bundle_dir: Path
+    mode: ReplayMode
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == ReplayMode.REPLAY
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == ReplayMode.RECORD
+
+    def _next_path(self, kind: str) -> Path:
+        self.counters[kind] = self.counters.get(kind, 0) + 1
+        return self.bundle_dir / f"{kind}_{self.counters[kind]}.json"
+
+    def record(self, kind: str, data: dict[str, Any]) -> None:
+        path = self._next_path(kind)
+        path.write_text(json.dumps(data, indent=2) + "\n")
+        typer.echo(f"  Recorded {path.name}")
+
+    def record_file(self, kind: str, source: Path) -> None:
+        path = self._next_path(kind)
+        shutil.copyfile(source, path)
+        typer.echo(f"  Recorded {path.name}")
+
+    def replay(self, kind: str) -> dict[str, Any]:
+        return json.loads(self._fixture_path(kind).read_text())
+
+    def replay_file(self, kind: str, dest: Path) -> None:
+        shutil.copyfile(self._fixture_path(kind), dest)
+
+    def _fixture_path(self, kind: str) -> Path:
+        path = self._next_path(kind)
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Replay fixture {path} not found (record it with --replay record)"
+            )
+        typer.echo(f"  Replaying {path.name}")
+        return path
+
+
+_active: FixtureBundle | None = None
+
+
+def active() -> FixtureBundle | None:
+    return _active
+
+
+def is_replaying() -> bool:
+    return _active is not None and _active.replaying
+
+
+def bundle_dir_for(ws_dir: Path, run_mode: str, fixtures_dir: Path | None = None) -> Path:
+    if fixtures_dir is None:
+        return ws_dir / REPLAY_FIXTURES_DIR / run_mode
+    return fixtures_dir / ws_dir.name / run_mode
+
+
+@contextlib.contextmanager
+def fixture_bundle(bundle_dir: Path, mode: ReplayMode) -> Generator[None]:
+    """Activate recording or replaying of terraform JSON outputs for the enclosed steps."""
+    global _active
+    if mode == ReplayMode.OFF:
+        yield
+        return
+    if mode == ReplayMode.REPLAY and not bundle_dir.is_dir():
+        raise ValueError(f"Replay fixture bundle {bundle_dir} does not exist")
+    if mode == ReplayMode.RECORD:
+        if bundle_dir.exists():
+            shutil.rmtree(bundle_dir)
+        bundle_dir.mkdir(parents=True)
+    _active = FixtureBundle(bundle_dir=bundle_dir, mode=mode)
+    try:
+        yield
+    finally:
+        _active = None
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from workspace import import_validation, models, output_assertions, plan, replay
+
+CLUSTER_ADDR = "module.ex_01.mongodbatlas_advanced_cluster.this"
+
+WS_CONFIG = """\
+examples:
+  - name: "01"
+    source: 01_basic
+    plan_regressions:
+      - address: mongodbatlas_advanced_cluster.this
+    output_assertions:
+      - output: cluster_id
+        pattern: "^[a-f0-9]{24}$"
+    import_validation:
+      enabled: true
+resource_type_import_ids:
+  mongodbatlas_advanced_cluster: "{project_id}-{name}"
+"""
+
+STATE = {
+    "values": {
+        "root_module": {
+            "resources": [
+                {
+                    "address": CLUSTER_ADDR,
+                    "type": "mongodbatlas_advanced_cluster",
+                    "values": {"project_id": "p1", "name": "c1"},
+                }
+            ]
+        }
+    }
+}
+NOOP_PLAN = {
+    "resource_changes": [{"address": CLUSTER_ADDR, "change": {"actions": ["no-op"]}}],
+}
+OUTPUTS = {"ex_01": {"value": {"cluster_id": "0123456789abcdef01234567"}}}
+
+
+def _no_subprocess(*args, **kwargs):
+    raise AssertionError(f"unexpected subprocess call: {args}")
+
+
+@pytest.fixture
+def ws_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(models, "REPO_ROOT", tmp_path)
+    (tmp_path / "examples" / "01_basic").mkdir(parents=True)
+    ws_dir = tmp_path / "workspace_test"
+    ws_dir.mkdir()
+    (ws_dir / models.WORKSPACE_CONFIG_FILE).write_text(WS_CONFIG)
+    return ws_dir
+
+
+def _write_bundle(bundle_dir: Path) -> None:
+    bundle_dir.mkdir(parents=True)
+    (bundle_dir / "state_1.json").write_text(json.dumps(STATE))
+    (bundle_dir / "plan_1.json").write_text(json.dumps(NOOP_PLAN))
+    (bundle_dir / "plan_2.json").write_text(json.dumps(NOOP_PLAN))
+    (bundle_dir / "outputs_1.json").write_text(json.dumps(OUTPUTS))
+
+
+def test_record_then_replay_outputs(ws_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    bundle_dir = replay.bundle_dir_for(ws_dir, "check-outputs")
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(OUTPUTS))
+    monkeypatch.setattr(subprocess, "run", lambda *_, **__: completed)
+    with replay.fixture_bundle(bundle_dir, replay.ReplayMode.RECORD):
+        assert plan.run_terraform_output_json(ws_dir) == OUTPUTS
+    assert json.loads((bundle_dir / "outputs_1.json").read_text()) == OUTPUTS
+
+    monkeypatch.setattr(subprocess, "run", _no_subprocess)
+    (ws_dir / plan.OUTPUTS_ACTUAL_JSON).unlink()
+    with replay.fixture_bundle(bundle_dir, replay.ReplayMode.REPLAY):
+        assert plan.run_terraform_output_json(ws_dir) == OUTPUTS
+    assert (ws_dir / plan.OUTPUTS_ACTUAL_JSON).exists()
+    assert replay.active() is None
+
+
+def test_replay_missing_fixture(ws_dir: Path):
+    bundle_dir = ws_dir / "bundle"
+    bundle_dir.mkdir()
+    with replay.fixture_bundle(bundle_dir, replay.ReplayMode.REPLAY):
+        with pytest.raises(FileNotFoundError, match="state_1.json"):
+            plan.run_terraform_show_json(ws_dir)
+
+
+def test_replay_requires_existing_bundle(ws_dir: Path):
+    with pytest.raises(ValueError, match="does not exist"):
+        with replay.fixture_bundle(ws_dir / "missing", replay.ReplayMode.REPLAY):
+            pass
+
+
+def test_replay_import_and_output_pipeline_offline(ws_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    bundle_dir = ws_dir / "bundle"
+    _write_bundle(bundle_dir)
+    monkeypatch.setattr(subprocess, "run", _no_subprocess)
+    monkeypatch.setattr(subprocess, "Popen", _no_subprocess)
+
+    with replay.fixture_bundle(bundle_dir, replay.ReplayMode.REPLAY):
+        import_validation.process_workspace(ws_dir)
+        output_assertions.process_workspace(ws_dir)
+
+    assert not (ws_dir / import_validation.IMPORTS_GENERATED_TF).exists()
+    assert not (ws_dir / import_validation.TFSTATE_FILE).exists()
+    assert json.loads((ws_dir / plan.PLAN_JSON).read_text()) == NOOP_PLAN
@@ -8,23 +8,13 @@ from pathlib import Path
 
 import typer
 
-from workspace import gen, import_validation, models, output_assertions, plan, reg
+from workspace import gen, import_validation, models, output_assertions, plan, reg, replay
 
 app = typer.Typer()
 
-EXAMPLES_DIR = models.REPO_ROOT / "examples"
 PROVIDER_VERSION_ENV = "MONGODB_ATLAS_PROVIDER_VERSION"
 
 
-def _resolve_example_dirs(ws_dir: Path, include_examples: str) -> list[Path]:
-    ws_config_path = ws_dir / models.WORKSPACE_CONFIG_FILE
-    if not ws_config_path.exists():
-        return []
-    config = models.parse_ws_config(ws_config_path)
-    examples_list = gen.parse_include_examples(include_examples, config)
-    return [ex.example_path(EXAMPLES_DIR) for ex in examples_list]
-
-
 class RunMode(enum.StrEnum):
     SETUP_ONLY = "setup-only"
     PLAN_ONLY = "plan-only"
@@ -41,16 +31,34 @@ def main(
     include_examples: str = typer.Option("all", "--include-examples", "-e"),
     auto_approve: bool = typer.Option(False, "--auto-approve"),
     skip_init: bool = typer.Option(False, "--skip-init"),
+    force_init: bool = typer.Option(
+        False, "--force-init", help="Run terraform init -upgrade even if init inputs are unchanged"
+    ),
     ws: str = typer.Option("all", "--ws"),
     tests_dir: Path = typer.Option(models.DEFAULT_TESTS_DIR, "--tests-dir"),
     var_file: list[Path] = typer.Option([], "--var-file", "-v"),
     force_regen: bool = typer.Option(False, "--force-regen"),
+    timed: bool = typer.Option(
+        False,
+        "--timings",
+        help="Report per-resource durations from terraform's -json output (plan/apply/destroy)",
+    ),
     show_uncovered: bool = typer.Option(
         False,
         "--show-uncovered",
         "-u",
         help="Show resources not covered by plan_regressions",
     ),
+    replay_mode: replay.ReplayMode = typer.Option(
+        replay.ReplayMode.OFF,
+        "--replay",
+        help="record: save terraform JSON outputs per step; replay: serve them without terraform",
+    ),
+    fixtures_dir: Path | None = typer.Option(
+        None,
+        "--fixtures-dir",
+        help=f"Fixture bundle root (default: <workspace>/{replay.REPLAY_FIXTURES_DIR})",
+    ),
 ) -> None:
     try:
         ws_dirs = models.resolve_workspaces(ws, tests_dir)
@@ -63,39 +71,48 @@ def main(
 
     for ws_dir in ws_dirs:
         typer.echo(f"=== {ws_dir.name} ({mode}) ===")
-        gen.process_workspace(ws_dir, include_examples=examples)
-        example_dirs = _resolve_example_dirs(ws_dir, examples)
+        try:
+            ctx = gen.load_context(ws_dir, include_examples=examples)
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1) from e
+        # Without a config only the terraform steps run; the config-driven stages are skipped.
+        if ctx is not None:
+            gen.process_context(ctx)
+        example_dirs = ctx.example_dirs if ctx is not None else []
 
         try:
+            bundle_dir = replay.bundle_dir_for(ws_dir, mode, fixtures_dir)
             with (
+                replay.fixture_bundle(bundle_dir, replay_mode),
                 plan.strip_provider_blocks(example_dirs),
                 plan.provider_version_override(ws_dir, provider_version),
             ):
                 if not skip_init:
-                    plan.run_terraform_init(ws_dir)
+                    plan.run_terraform_init(ws_dir, force=force_init)
 
                 if mode in (RunMode.PLAN_ONLY, RunMode.PLAN_SNAPSHOT_TEST):
-                    plan.run_terraform_plan(ws_dir, var_file, skip_init=True)
+                    plan.run_terraform_plan(ws_dir, var_file, skip_init=True, timed=timed)
 
-                if mode == RunMode.PLAN_SNAPSHOT_TEST:
-                    reg.process_workspace(
-                        ws_dir,
+                if ctx is not None and mode == RunMode.PLAN_SNAPSHOT_TEST:
+                    reg.process_context(
+                        ctx,
                         force_regen=force_regen,
                         show_uncovered=show_uncovered,
                     )
 
                 if mode in (RunMode.SETUP_ONLY, RunMode.APPLY):
-                    plan.run_terraform_apply(ws_dir, var_file, auto_approve)
+                    plan.run_terraform_apply(ws_dir, var_file, auto_approve, timed=timed)
 
-                if mode == RunMode.CHECK_OUTPUTS:
-                    output_assertions.process_workspace(ws_dir, include_examples)
+                if ctx is not None and mode == RunMode.CHECK_OUTPUTS:
+                    output_assertions.process_context(ctx)
 
-                if mode == RunMode.IMPORT:
-                    import_validation.process_workspace(ws_dir, include_examples, var_file)
+                if ctx is not None and mode == RunMode.IMPORT:
+                    import_validation.process_context(ctx, var_file)
 
                 if mode == RunMode.DESTROY:
-                    plan.run_terraform_destroy(ws_dir, var_file, auto_approve)
-        except (FileExistsError, ValueError) as e:
+                    plan.run_terraform_destroy(ws_dir, var_file, auto_approve, timed=timed)
+        except (FileExistsError, FileNotFoundError, ValueError) as e:
             typer.echo(f"Error: {e}", err=True)
             raise typer.Exit(1) from e
 
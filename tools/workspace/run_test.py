@@ -3,7 +3,12 @@ from pathlib import Path
 import pytest
 import typer
 
-from workspace import gen, models, plan, run
+from workspace import gen, models, plan, replay, run
+
+
+def _empty_context(ws_dir: Path) -> models.WsContext:
+    config = models.WsConfig(examples=[], var_groups={})
+    return models.WsContext.create(ws_dir, config, [], ws_dir / "examples")
 
 
 def test_provider_version_environment_controls_override_during_run(
@@ -14,11 +19,11 @@ def test_provider_version_environment_controls_override_during_run(
     override_path = tmp_path / plan.PROVIDER_VERSION_OVERRIDE_FILE
     monkeypatch.setenv(run.PROVIDER_VERSION_ENV, provider_version)
     monkeypatch.setattr(models, "resolve_workspaces", lambda *_: [tmp_path])
-    monkeypatch.setattr(gen, "process_workspace", lambda *_, **__: None)
-    monkeypatch.setattr(run, "_resolve_example_dirs", lambda *_: [])
+    monkeypatch.setattr(gen, "load_context", lambda ws_dir, **_: _empty_context(ws_dir))
+    monkeypatch.setattr(gen, "process_context", lambda *_: None)
     monkeypatch.setattr(plan, "run_terraform_plan", lambda *_, **__: None)
 
-    def assert_override_state(_: Path):
+    def assert_override_state(_: Path, **__):
         assert f'version = "= {provider_version}"' in override_path.read_text()
 
     monkeypatch.setattr(plan, "run_terraform_init", assert_override_state)
@@ -28,11 +33,15 @@ def test_provider_version_environment_controls_override_during_run(
         include_examples="all",
         auto_approve=False,
         skip_init=False,
+        force_init=False,
         ws="all",
         tests_dir=tmp_path,
         var_file=[],
         force_regen=False,
+        timed=False,
         show_uncovered=False,
+        replay_mode=replay.ReplayMode.OFF,
+        fixtures_dir=None,
     )
 
     assert not override_path.exists()
@@ -47,8 +56,8 @@ def test_provider_version_error_is_reported(
 ):
     monkeypatch.setenv(run.PROVIDER_VERSION_ENV, provider_version)
     monkeypatch.setattr(models, "resolve_workspaces", lambda *_: [tmp_path])
-    monkeypatch.setattr(gen, "process_workspace", lambda *_, **__: None)
-    monkeypatch.setattr(run, "_resolve_example_dirs", lambda *_: [])
+    monkeypatch.setattr(gen, "load_context", lambda ws_dir, **_: _empty_context(ws_dir))
+    monkeypatch.setattr(gen, "process_context", lambda *_: None)
 
     with pytest.raises(typer.Exit) as exc_info:
         run.main(
@@ -56,12 +65,45 @@ def test_provider_version_error_is_reported(
             include_examples="all",
             auto_approve=False,
             skip_init=True,
+            force_init=False,
             ws="all",
             tests_dir=tmp_path,
             var_file=[],
             force_regen=False,
+            timed=False,
             show_uncovered=False,
+            replay_mode=replay.ReplayMode.OFF,
+            fixtures_dir=None,
         )
 
     assert exc_info.value.exit_code == 1
     assert f"Error: Invalid exact provider version {provider_version!r}" in capsys.readouterr().err
+
+
+def test_workspace_without_config_still_runs_terraform(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls: list[str] = []
+    monkeypatch.setattr(models, "resolve_workspaces", lambda *_: [tmp_path])
+    monkeypatch.setattr(plan, "run_terraform_init", lambda *_, **__: calls.append("init"))
+    monkeypatch.setattr(plan, "run_terraform_plan", lambda *_, **__: calls.append("plan"))
+    monkeypatch.setattr(gen, "process_context", lambda *_: calls.append("gen"))
+
+    run.main(
+        mode=run.RunMode.PLAN_SNAPSHOT_TEST,
+        include_examples="all",
+        auto_approve=False,
+        skip_init=False,
+        force_init=False,
+        ws="all",
+        tests_dir=tmp_path,
+        var_file=[],
+        force_regen=False,
+        timed=False,
+        show_uncovered=False,
+        replay_mode=replay.ReplayMode.OFF,
+        fixtures_dir=None,
+    )
+
+    assert calls == ["init", "plan"]
@@ -0,0 +1,155 @@
+"""Per-resource timings from terraform's `-json` event stream."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import typer
+
+RESOURCE_TIMINGS_JSON = "resource_timings_{command}.json"
+LOCK_FILE = ".terraform.lock.hcl"
+EXAMPLE_MODULE_PATTERN = re.compile(r"^module\.ex_([^.\[]+)\.")
+ATLAS_PROVIDER_LOCK_PATTERN = re.compile(
+    r'provider\s+"[^"]*/mongodb/mongodbatlas"\s*\{\s*version\s*=\s*"([^"]+)"'
+)
+NO_EXAMPLE = "-"
+
+# apply_complete/apply_errored carry elapsed_seconds; refresh_complete only has @timestamp.
+_START_EVENTS = {"apply_start": "apply", "refresh_start": "refresh"}
+_END_EVENTS = {
+    "apply_complete": ("apply", "complete"),
+    "apply_errored": ("apply", "errored"),
+    "refresh_complete": ("refresh", "complete"),
+}
+
+
+@dataclass
+class ResourceTiming:
+    address: str
+    example_id: str
+    phase: str
+    action: str
+    status: str
+    elapsed_seconds: float
+
+
+def example_id_from_address(address: str) -> str:
+    if match := EXAMPLE_MODULE_PATTERN.match(address):
+        return match.group(1)
+    return NO_EXAMPLE
+
+
+def _parse_timestamp(event: dict[str, Any]) -> datetime | None:
+    raw = event.get("@timestamp")
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def collect_resource_timings(events: Iterable[dict[str, Any]]) -> list[ResourceTiming]:
+    """Pair start/end hook events per (phase, address) into resource durations."""
+    started: dict[tuple[str, str], tuple[datetime | None, str]] = {}
+    timings: list[ResourceTiming] = []
+    for event in events:
+        event_type = event.get("type", "")
+        hook = event.get("hook") or {}
+        address = (hook.get("resource") or {}).get("addr")
+        if not address:
+            continue
+        if phase := _START_EVENTS.get(event_type):
+            started[(phase, address)] = (_parse_timestamp(event), hook.get("action", "read"))
+            continue
+        if event_type not in _END_EVENTS:
+            continue
+        phase, status = _END_EVENTS[event_type]
+        start_ts, start_action = started.pop((phase, address), (None, "read"))
+        elapsed = hook.get("elapsed_seconds")
+        if elapsed is None:
+            end_ts = _parse_timestamp(event)
+            if start_ts is None or end_ts is None:
+                continue
+            elapsed = (end_ts - start_ts).total_seconds()
+        timings.append(
+            ResourceTiming(
+                address=address,
+                example_id=example_id_from_address(address),
+                phase=phase,
+                action=hook.get("action", start_action),
+                status=status,
+                elapsed_seconds=float(elapsed),
+            )
+        )
+    return timings
+
+
+def terraform_version_from_events(events: Iterable[dict[str, Any]]) -> str:
+    for event in events:
+        if event.get("type") == "version":
+            return event.get("terraform", "")
+    return ""
+
+
+def atlas_provider_version(ws_dir: Path) -> str:
+    lock_file = ws_dir / LOCK_FILE
+    if not lock_file.exists():
+        return ""
+    match = ATLAS_PROVIDER_LOCK_PATTERN.search(lock_file.read_text())
+    return match.group(1) if match else ""
+
+
+def example_totals(timings: list[ResourceTiming]) -> dict[str, float]:
+    totals: dict[str, float] = {}
+    for t in timings:
+        totals[t.example_id] = totals.get(t.example_id, 0.0) + t.elapsed_seconds
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def format_timings_table(timings: list[ResourceTiming]) -> str:
+    if not timings:
+        return "  No resource timings recorded"
+    totals = example_totals(timings)
+    lines = [f"  {'example':<20} {'phase':<8} {'action':<8} {'seconds':>9}  address"]
+    for example_id, total in totals.items():
+        rows = sorted(
+            (t for t in timings if t.example_id == example_id),
+            key=lambda t: t.elapsed_seconds,
+            reverse=True,
+        )
+        for t in rows:
+            suffix = "" if t.status == "complete" else f" ({t.status})"
+            lines.append(
+                f"  {example_id:<20} {t.phase:<8} {t.action:<8} "
+                f"{t.elapsed_seconds:>9.1f}  {t.address}{suffix}"
+            )
+        lines.append(f"  {example_id:<20} {'total':<17} {total:>9.1f}")
+    return "\n".join(lines)
+
+
+def write_timings_report(
+    ws_dir: Path, command: str, events: list[dict[str, Any]]
+) -> list[ResourceTiming]:
+    """Print the per-example table and write `resource_timings_{command}.json` in ws_dir."""
+    timings = collect_resource_timings(events)
+    typer.echo(f"Resource timings ({command}):")
+    typer.echo(format_timings_table(timings))
+    report = {
+        "workspace": ws_dir.name,
+        "command": command,
+        "terraform_version": terraform_version_from_events(events),
+        "mongodbatlas_provider_version": atlas_provider_version(ws_dir),
+        "example_totals": example_totals(timings),
+        "resources": [asdict(t) for t in timings],
+    }
+    report_name = RESOURCE_TIMINGS_JSON.format(command=command)
+    (ws_dir / report_name).write_text(json.dumps(report, indent=2) + "\n")
+    typer.echo(f"Timings saved to {report_name}")
+    return timings
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from workspace import timings
+
+CLUSTER_ADDR = "module.ex_01.module.cluster.mongodbatlas_advanced_cluster.this"
+PROJECT_ADDR = "module.ex_project.mongodbatlas_project.this"
+
+EVENTS = [
+    {"type": "version", "terraform": "1.10.5", "ui": "1.2"},
+    {
+        "type": "refresh_start",
+        "@timestamp": "2026-01-01T10:00:00.000000+00:00",
+        "hook": {"resource": {"addr": PROJECT_ADDR}},
+    },
+    {
+        "type": "refresh_complete",
+        "@timestamp": "2026-01-01T10:00:02.500000+00:00",
+        "hook": {"resource": {"addr": PROJECT_ADDR}, "id_key": "id", "id_value": "p1"},
+    },
+    {
+        "type": "apply_start",
+        "hook": {"resource": {"addr": CLUSTER_ADDR}, "action": "create"},
+    },
+    {"type": "apply_progress", "hook": {"resource": {"addr": CLUSTER_ADDR}, "elapsed_seconds": 10}},
+    {
+        "type": "apply_complete",
+        "hook": {"resource": {"addr": CLUSTER_ADDR}, "action": "create", "elapsed_seconds": 612},
+    },
+    {
+        "type": "apply_start",
+        "hook": {"resource": {"addr": "terraform_data.shared"}, "action": "create"},
+    },
+    {
+        "type": "apply_errored",
+        "hook": {
+            "resource": {"addr": "terraform_data.shared"},
+            "action": "create",
+            "elapsed_seconds": 1,
+        },
+    },
+    {"type": "change_summary", "changes": {"add": 1}},
+]
+
+
+def test_collect_resource_timings():
+    result = timings.collect_resource_timings(EVENTS)
+    assert [(t.address, t.example_id, t.phase, t.action, t.status) for t in result] == [
+        (PROJECT_ADDR, "project", "refresh", "read", "complete"),
+        (CLUSTER_ADDR, "01", "apply", "create", "complete"),
+        ("terraform_data.shared", timings.NO_EXAMPLE, "apply", "create", "errored"),
+    ]
+    assert [t.elapsed_seconds for t in result] == [2.5, 612.0, 1.0]
+
+
+def test_refresh_without_start_is_ignored():
+    events = [e for e in EVENTS if e["type"] != "refresh_start"]
+    addresses = [t.address for t in timings.collect_resource_timings(events)]
+    assert PROJECT_ADDR not in addresses
+
+
+def test_example_totals_sorted_slowest_first():
+    totals = timings.example_totals(timings.collect_resource_timings(EVENTS))
+    assert list(totals.items()) == [("01", 612.0), ("project", 2.5), (timings.NO_EXAMPLE, 1.0)]
+
+
+def test_write_timings_report(tmp_path: Path):
+    (tmp_path / timings.LOCK_FILE).write_text(
+        'provider "registry.terraform.io/mongodb/mongodbatlas" {\n'
+        '  version     = "2.12.0"\n'
+        '  constraints = "~> 2.0"\n'
+        "}\n"
+    )
+    timings.write_timings_report(tmp_path, "apply", EVENTS)
+
+    report = json.loads((tmp_path / "resource_timings_apply.json").read_text())
+    assert report["terraform_version"] == "1.10.5"
+    assert report["mongodbatlas_provider_version"] == "2.12.0"
+    assert report["example_totals"]["01"] == 612.0
+    assert len(report["resources"]) == 3
+
+
+def test_format_timings_table_marks_errors():
+    table = timings.format_timings_table(timings.collect_resource_timings(EVENTS))
+    assert "terraform_data.shared (errored)" in table
+    assert table.index(CLUSTER_ADDR) < table.index(PROJECT_ADDR)